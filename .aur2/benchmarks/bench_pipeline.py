@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark of the audio pipeline against a local API stand-in.
+
+Usage:
+    python .aur2/benchmarks/bench_pipeline.py [--minutes 1 10 60] [--formats wav m4a]
+    python .aur2/benchmarks/bench_pipeline.py --save .aur2/benchmarks/baseline.json
+    python .aur2/benchmarks/bench_pipeline.py --compare .aur2/benchmarks/baseline.json
+
+Generates synthetic speech-like recordings (16 kHz mono WAV, and M4A when
+ffmpeg is installed), starts stub_api.py on a local port, and measures each
+pipeline stage on each input:
+
+    duration    transcribe.get_audio_duration_ms
+    split       transcribe.split_audio_into_chunks (pydub decode and re-export;
+                M4A needs ffprobe)
+    iter_chunks transcribe.iter_audio_chunks (the streaming cutter transcribe_file uses)
+    transcribe  transcribe.transcribe_chunks, uploading every chunk to the stub
+    title       generate_title.generate_title on a transcript of the same length
+    save        record_memo.save_memo into a scratch visions directory
+
+Each stage runs in a fresh child process, working in a scratch project
+with its own .aur2/ (so caches start cold), and reports wall time,
+throughput in audio minutes per second and peak RSS. No network access or
+API key is needed.
+
+--save writes the results as a baseline; --compare reruns the same
+configuration, prints the change per stage and exits with status 3 if any
+stage got slower than --tolerance allows.
+
+Requirements:
+    pip install -r .aur2/scripts/requirements.txt
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCHMARKS_DIR.parent / "scripts"
+DEFAULT_MINUTES = [1, 10, 60]
+DEFAULT_FORMATS = ["wav", "m4a"]
+STAGES = ["duration", "split", "iter_chunks", "transcribe", "title", "save"]
+DEFAULT_TOLERANCE = 0.2  # A stage more than 20% slower than the baseline is a regression
+MIN_REGRESSION_S = 0.05  # Slowdowns smaller than this are timer noise, whatever the percentage
+M4A_BITRATE = "48k"  # Typical phone voice memo bitrate
+
+
+def make_input(directory: Path, minutes: float, fmt: str) -> Path | None:
+    """Write (or reuse) a synthetic recording; None if the format can't be produced here."""
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+    from bench_split import write_synthetic_wav
+
+    wav_path = directory / f"synthetic-{minutes:g}min.wav"
+    if not wav_path.exists():
+        print(f"Generating {minutes:g}-minute WAV...", file=sys.stderr)
+        write_synthetic_wav(str(wav_path), minutes)
+    if fmt == "wav":
+        return wav_path
+
+    path = directory / f"synthetic-{minutes:g}min.{fmt}"
+    if not path.exists():
+        if shutil.which("ffmpeg") is None:
+            return None
+        print(f"Encoding {path.name}...", file=sys.stderr)
+        subprocess.run(["ffmpeg", "-v", "error", "-y", "-i", str(wav_path), "-c:a", "aac", "-b:a", M4A_BITRATE,
+                        str(path)], check=True)
+    return path
+
+
+def _run_stage(stage: str, path: str, minutes: float, workdir: str, settings: dict, results) -> None:
+    """Child-process body: run one stage on one input and report its measurements."""
+    import time
+
+    # Scratch project: cold caches, and nothing written to the real .aur2
+    os.chdir(workdir)
+    os.environ.update({
+        "OPENAI_BASE_URL": settings["base_url"],
+        "OPENAI_API_KEY": "stub",
+        "AUR2_RATE_LIMIT": "1" if settings["rate_limit"] else "0",
+    })
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+    import transcribe
+    import metrics
+
+    def run():
+        if stage == "duration":
+            return transcribe.get_audio_duration_ms(path)
+        if stage == "split":
+            chunks = transcribe.split_audio_into_chunks(path)
+            for chunk in chunks:
+                if isinstance(chunk, str) and chunk != path:
+                    os.unlink(chunk)
+            return len(chunks)
+        if stage == "iter_chunks":
+            count = 0
+            for chunk in transcribe.iter_audio_chunks(path):
+                if isinstance(chunk, str) and chunk != path:
+                    os.unlink(chunk)
+                count += 1
+            return count
+        if stage == "transcribe":
+            plan = transcribe.plan_chunks(path, transcribe.get_audio_duration_ms(path))
+            chunks = transcribe.iter_audio_chunks(path, plan=plan)
+            return len(transcribe.transcribe_chunks(chunks, path, jobs=settings["jobs"], total=len(plan),
+                                                    use_cache=False))
+        if stage == "title":
+            from bench_title_prompt import synthetic_transcript
+            from generate_title import generate_title
+            return generate_title(synthetic_transcript(minutes, seed=0))
+        if stage == "save":
+            from record_memo import save_memo
+            from bench_title_prompt import synthetic_transcript
+            visions_dir = Path(workdir) / ".aur2" / "visions"
+            audio_copy = Path(workdir) / f"recording{Path(path).suffix}"
+            shutil.copyfile(path, audio_copy)
+            transcript = synthetic_transcript(minutes, seed=0)
+            start = time.perf_counter()
+            final_dir, _ = save_memo(audio_copy, transcript, visions_dir, title="benchmark-memo")
+            return final_dir.name, time.perf_counter() - start
+        raise ValueError(f"Unknown stage: {stage}")
+
+    row = {"ok": True}
+    elapsed = 0.0
+    try:
+        if stage in ("transcribe", "title"):
+            # Build the client up front: a missing SDK fails here instead of after every retry
+            from api_client import get_client
+            get_client()
+
+        start = time.perf_counter()
+        try:
+            output = run()
+        finally:
+            elapsed = time.perf_counter() - start
+        if stage == "save":
+            output, elapsed = output  # Time the move and write, not the copy set up for it
+        if stage == "title" and output.startswith("transcription-"):
+            raise RuntimeError("API error, got a fallback title")
+        row["output"] = output
+    except Exception as e:
+        row.update(ok=False, error=f"{type(e).__name__}: {e}")
+
+    rss, child_rss = metrics.peak_rss_mb()
+    row.update(seconds=round(elapsed, 3), peak_rss_mb=rss, child_peak_rss_mb=child_rss,
+               audio_min_per_s=round(minutes / elapsed, 2) if elapsed > 0 else None)
+    results.put(row)
+
+
+def measure(stage: str, path: Path, minutes: float, settings: dict) -> dict:
+    """Run one stage in a fresh process and scratch project, and return its measurements."""
+    with tempfile.TemporaryDirectory() as workdir:
+        (Path(workdir) / ".aur2").mkdir()
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        proc = ctx.Process(target=_run_stage, args=(stage, str(path), minutes, workdir, settings, results))
+        proc.start()
+        result = results.get()
+        proc.join()
+        return result
+
+
+def compare(rows: list[dict], baseline: dict, tolerance: float) -> bool:
+    """Print per-stage change against a baseline.
+
+    Returns:
+        True if any stage regressed beyond tolerance
+    """
+    before = {(row["format"], row["minutes"], row["stage"]): row for row in baseline["rows"]}
+    regressed = False
+    print(f"\nCompared with baseline from {baseline['created']} ({baseline['machine']}):")
+    print(f"{'input':<12}  {'stage':<11}  {'before s':>9}  {'after s':>9}  {'change':>8}")
+    for row in rows:
+        old = before.get((row["format"], row["minutes"], row["stage"]))
+        if not old or not old["ok"] or not row["ok"]:
+            continue
+        change = row["seconds"] / old["seconds"] - 1 if old["seconds"] else 0.0
+        flag = ""
+        if change > tolerance and row["seconds"] - old["seconds"] > MIN_REGRESSION_S:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"{row['minutes']:>6g}m {row['format']:<4}  {row['stage']:<11}  {old['seconds']:>9.3f}  "
+              f"{row['seconds']:>9.3f}  {change:>+7.0%}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the audio pipeline end to end against a local API stub",
+        epilog="Examples:\n"
+               "  python .aur2/benchmarks/bench_pipeline.py --minutes 1 10 --formats wav\n"
+               "  python .aur2/benchmarks/bench_pipeline.py --minutes 120 --stages iter_chunks transcribe\n"
+               "  python .aur2/benchmarks/bench_pipeline.py --error-rate 0.1 --stages transcribe\n"
+               "  python .aur2/benchmarks/bench_pipeline.py --save .aur2/benchmarks/baseline.json\n"
+               "  python .aur2/benchmarks/bench_pipeline.py --compare .aur2/benchmarks/baseline.json\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--minutes",
+        type=float,
+        nargs="+",
+        default=None,
+        help=f"Synthetic recording lengths, 1 to 120 (default: {' '.join(map(str, DEFAULT_MINUTES))})"
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=DEFAULT_FORMATS,
+        default=None,
+        help="Input formats (default: wav m4a; m4a needs ffmpeg)"
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=None,
+        help="Stages to measure (default: all)"
+    )
+    parser.add_argument("--jobs", type=int, default=None, help="Concurrent chunk uploads (default: 4)")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=None,
+        help="Stub server think time per request (default: stub_api's)"
+    )
+    parser.add_argument("--jitter-ms", type=float, default=None, help="Stub latency jitter, +/- (default: stub_api's)")
+    parser.add_argument("--error-rate", type=float, default=None, help="Fraction of stub requests answered with 429")
+    parser.add_argument(
+        "--rate-limit",
+        action="store_true",
+        help="Keep the fleet-wide rate limiter on (off by default so its RPM budget doesn't dominate)"
+    )
+    parser.add_argument(
+        "--inputs-dir",
+        type=str,
+        help="Keep generated recordings here and reuse them on the next run (default: a temp dir)"
+    )
+    parser.add_argument("--save", type=str, metavar="PATH", help="Write the results as a baseline JSON file")
+    parser.add_argument(
+        "--compare",
+        type=str,
+        metavar="PATH",
+        help="Compare with a baseline; its configuration is reused unless overridden"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Slowdown allowed before --compare fails (default: {DEFAULT_TOLERANCE:g})"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import stub_api
+    from transcribe import DEFAULT_JOBS
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8")) if args.compare else None
+    config = dict(baseline["config"]) if baseline else {
+        "minutes": DEFAULT_MINUTES, "formats": DEFAULT_FORMATS, "stages": STAGES, "jobs": DEFAULT_JOBS,
+        "latency_ms": stub_api.DEFAULT_LATENCY_MS, "jitter_ms": stub_api.DEFAULT_JITTER_MS, "error_rate": 0.0,
+        "rate_limit": False,
+    }
+    overrides = {"minutes": args.minutes, "formats": args.formats, "stages": args.stages, "jobs": args.jobs,
+                 "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "error_rate": args.error_rate,
+                 "rate_limit": args.rate_limit or None}
+    config.update({key: value for key, value in overrides.items() if value is not None})
+
+    server, base_url = stub_api.start_stub(latency_ms=config["latency_ms"], jitter_ms=config["jitter_ms"],
+                                           error_rate=config["error_rate"])
+    settings = {"base_url": base_url, "jobs": config["jobs"], "rate_limit": config["rate_limit"]}
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs_dir = Path(args.inputs_dir or tmp)
+        inputs_dir.mkdir(parents=True, exist_ok=True)
+        for minutes in config["minutes"]:
+            for fmt in config["formats"]:
+                path = make_input(inputs_dir, minutes, fmt)
+                if path is None:
+                    print(f"Skipping {fmt}: ffmpeg not installed", file=sys.stderr)
+                    continue
+                for stage in config["stages"]:
+                    if stage == "split" and fmt != "wav" and shutil.which("ffprobe") is None:
+                        # pydub probes every non-WAV input with ffprobe before decoding it
+                        print(f"Skipping split on {fmt}: ffprobe not installed", file=sys.stderr)
+                        continue
+                    print(f"  {minutes:g} min {fmt}: {stage}...", file=sys.stderr)
+                    rows.append({"minutes": minutes, "format": fmt, "stage": stage,
+                                 **measure(stage, path, minutes, settings)})
+    server.shutdown()
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'input':<12}  {'stage':<11}  {'seconds':>8}  {'audio min/s':>11}  {'peak MB':>8}  {'child MB':>8}")
+        for row in rows:
+            if not row["ok"]:
+                print(f"{row['minutes']:>6g}m {row['format']:<4}  {row['stage']:<11}  FAILED: {row['error']}")
+                continue
+            print(f"{row['minutes']:>6g}m {row['format']:<4}  {row['stage']:<11}  {row['seconds']:>8.3f}  "
+                  f"{row['audio_min_per_s']:>11.2f}  {row['peak_rss_mb']:>8.1f}  {row['child_peak_rss_mb']:>8.1f}")
+        print(f"Stub API: {server.stats['requests']} requests, {server.stats['bytes'] / (1024 * 1024):.1f}MB "
+              f"uploaded, {server.stats['throttled']} answered with 429", file=sys.stderr)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps({
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "machine": f"{platform.node()} {platform.machine()} Python {platform.python_version()}",
+            "config": config,
+            "rows": rows,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline saved to {args.save}", file=sys.stderr)
+
+    if baseline and compare(rows, baseline, args.tolerance):
+        sys.exit(3)
+
+
+if __name__ == "__main__":
+    main()
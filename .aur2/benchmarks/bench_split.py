@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark WAV chunk splitting: pydub decode/re-export vs the mmap fast path.
+
+Usage:
+    python .aur2/benchmarks/bench_split.py [--minutes 10 30 60]
+
+Generates synthetic 16 kHz mono WAVs (the format record_memo.py produces),
+splits each with transcribe.split_audio_into_chunks and transcribe.iter_wav_chunks,
+and reports wall time and peak RSS. Each measurement runs in a fresh child
+process so peak RSS is not polluted by earlier runs.
+
+Requirements:
+    pip install -r .aur2/scripts/requirements.txt
+"""
+
+import os
+import sys
+import math
+import time
+import array
+import wave
+import json
+import random
+import argparse
+import resource
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+SAMPLE_RATE = 16000
+DEFAULT_MINUTES = [10, 30, 60]
+
+
+def write_synthetic_wav(path: str, minutes: float, sample_rate: int = SAMPLE_RATE) -> None:
+    """Write a speech-like 16-bit mono WAV: voiced bursts separated by short pauses."""
+    rng = random.Random(0)
+    block_s = 10
+    block = array.array("h")
+    for n in range(sample_rate * block_s):
+        t = n / sample_rate
+        # ~4 Hz syllable envelope with a silent gap every couple of seconds
+        envelope = max(0.0, math.sin(2 * math.pi * 4 * t)) * (0.0 if (t % 2.5) > 2.1 else 1.0)
+        voiced = math.sin(2 * math.pi * 140 * t) + 0.5 * math.sin(2 * math.pi * 280 * t)
+        block.append(int(8000 * envelope * voiced + rng.gauss(0, 200)))
+    block_bytes = block.tobytes()
+
+    total_blocks = int(minutes * 60 / block_s)
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        for _ in range(total_blocks):
+            w.writeframes(block_bytes)
+
+
+def _run_split(method: str, path: str, results) -> None:
+    """Child-process body: split path with the given method and report timings."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import transcribe
+
+    start = time.perf_counter()
+    if method == "pydub":
+        chunks = transcribe.split_audio_into_chunks(path)
+    else:
+        chunks = list(transcribe.iter_wav_chunks(path))
+    elapsed = time.perf_counter() - start
+
+    for chunk in chunks:
+        if isinstance(chunk, str) and chunk != path:
+            os.unlink(chunk)
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    results.put({"seconds": round(elapsed, 3), "peak_rss_mb": round(peak_mb, 1), "chunks": len(chunks)})
+
+
+def measure(method: str, path: str) -> dict:
+    """Run one split in a fresh process and return its measurements."""
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    proc = ctx.Process(target=_run_split, args=(method, path, results))
+    proc.start()
+    result = results.get()
+    proc.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WAV chunk splitting")
+    parser.add_argument(
+        "--minutes",
+        type=float,
+        nargs="+",
+        default=DEFAULT_MINUTES,
+        help=f"Synthetic recording lengths in minutes (default: {' '.join(map(str, DEFAULT_MINUTES))})"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of a table"
+    )
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for minutes in args.minutes:
+            path = os.path.join(tmp, f"synthetic-{minutes:g}min.wav")
+            print(f"Generating {minutes:g}-minute WAV...", file=sys.stderr)
+            write_synthetic_wav(path, minutes)
+
+            for method in ("pydub", "mmap"):
+                print(f"  {method}...", file=sys.stderr)
+                rows.append({"minutes": minutes, "method": method, **measure(method, path)})
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'minutes':>8}  {'method':<6}  {'chunks':>6}  {'seconds':>8}  {'peak MB':>8}")
+    for row in rows:
+        print(f"{row['minutes']:>8g}  {row['method']:<6}  {row['chunks']:>6}  {row['seconds']:>8.3f}  {row['peak_rss_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Benchmark title prompts: first-5,000-character truncation vs extractive condensing.
+
+Usage:
+    python .aur2/benchmarks/bench_title_prompt.py [--corpus .aur2/visions/processed]
+    python .aur2/benchmarks/bench_title_prompt.py --live [--repeat 3]
+
+Builds the title prompt for every transcript in the corpus both ways and
+reports prompt tokens (tiktoken if installed, otherwise the 4-characters-per-
+token estimate) and the local cost of condensing. With --live, also sends
+each prompt to the API and reports call latency (set OPENAI_BASE_URL to
+measure against a stub server instead).
+
+The corpus is every transcript.txt / *.txt under --corpus; without one,
+synthetic transcripts of 1 to 60 minutes are generated.
+
+Requirements:
+    pip install -r .aur2/scripts/requirements.txt
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+SYNTHETIC_MINUTES = [1, 5, 15, 30, 60]
+WORDS_PER_MINUTE = 150  # Typical speaking rate
+
+TOPICS = [
+    "the billing service migration", "hiring for the data team", "the quarterly roadmap review",
+    "flaky integration tests", "the customer onboarding flow", "moving the cache to a new region",
+]
+FILLER = [
+    "So I was thinking about {topic} again this morning.",
+    "The main issue with {topic} is that nobody owns it end to end.",
+    "Um, we should probably write down the decision on {topic} before Friday.",
+    "Okay.",
+    "Another option for {topic} would be to split it into two smaller pieces.",
+    "I talked to Sam and they think {topic} can wait until next month.",
+    "Right, so the numbers on {topic} look better than last week.",
+    "Let me also note that {topic} depends on the new deploy pipeline.",
+]
+
+
+def synthetic_transcript(minutes: float, seed: int) -> str:
+    """Rambling memo text that drifts across a few topics."""
+    rng = random.Random(seed)
+    topics = rng.sample(TOPICS, 3)
+    sentences, words = [], 0
+    while words < minutes * WORDS_PER_MINUTE:
+        # Most of the memo is about the first topic; the rest wanders
+        topic = topics[0] if rng.random() < 0.6 else rng.choice(topics[1:])
+        sentence = rng.choice(FILLER).format(topic=topic)
+        sentences.append(sentence)
+        words += len(sentence.split())
+    return " ".join(sentences)
+
+
+def load_corpus(corpus: str | None) -> list[tuple[str, str]]:
+    """(name, text) pairs from a directory of transcripts, or synthetic ones."""
+    if corpus is None:
+        return [(f"synthetic-{minutes}min", synthetic_transcript(minutes, seed))
+                for seed, minutes in enumerate(SYNTHETIC_MINUTES)]
+
+    files = sorted(p for p in Path(corpus).expanduser().rglob("*.txt") if p.is_file())
+    return [(str(path.relative_to(corpus)), path.read_text(encoding="utf-8")) for path in files]
+
+
+def token_counter():
+    """Exact token counter if tiktoken is installed, else the condenser's estimate."""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("o200k_base")
+        return "tiktoken", lambda text: len(encoding.encode(text))
+    except ImportError:
+        from condense import estimate_tokens
+        return "estimate", estimate_tokens
+
+
+def truncated(text: str) -> str:
+    """The previous generate_title behaviour."""
+    return text[:5000] if len(text) > 10000 else text
+
+
+def call_latency_s(prompt: str, model: str) -> float:
+    """Wall time of one title request."""
+    from api_client import get_client
+
+    start = time.perf_counter()
+    get_client().chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.7,
+        max_tokens=50
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark title prompt size and latency")
+    parser.add_argument(
+        "--corpus",
+        type=str,
+        help="Directory of transcript .txt files (default: synthetic transcripts)"
+    )
+    parser.add_argument(
+        "--tokens",
+        type=int,
+        default=None,
+        help="Condense token budget (default: generate_title.TITLE_TOKEN_BUDGET)"
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Also measure API call latency (needs OPENAI_API_KEY or OPENAI_BASE_URL)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="API calls per prompt with --live; the median is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="gpt-4o-mini",
+        help="Model for --live (default: gpt-4o-mini)"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of a table"
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from condense import condense
+    from generate_title import TITLE_TOKEN_BUDGET, _title_prompt  # The prompt production sends, not a copy
+
+    budget = args.tokens or TITLE_TOKEN_BUDGET
+    counter_name, count_tokens = token_counter()
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"Error: No .txt transcripts under {args.corpus}", file=sys.stderr)
+        sys.exit(1)
+    if args.live and not (os.environ.get("OPENAI_API_KEY") or os.environ.get("OPENAI_BASE_URL")):
+        print("Error: --live needs OPENAI_API_KEY (or OPENAI_BASE_URL for a stub server)", file=sys.stderr)
+        sys.exit(1)
+
+    condense(synthetic_transcript(5, 0), budget)  # Keep numpy's import out of the first timing
+
+    rows = []
+    for name, text in corpus:
+        print(f"  {name}...", file=sys.stderr)
+        start = time.perf_counter()
+        condensed = condense(text, budget)
+        condense_ms = (time.perf_counter() - start) * 1000
+
+        row = {"name": name, "transcript_tokens": count_tokens(text), "condense_ms": round(condense_ms, 2)}
+        for method, body in (("truncate", truncated(text)), ("condense", condensed)):
+            prompt = _title_prompt(body)
+            row[f"{method}_tokens"] = count_tokens(prompt)
+            if args.live:
+                latencies = [call_latency_s(prompt, args.model) for _ in range(args.repeat)]
+                row[f"{method}_latency_s"] = round(statistics.median(latencies), 3)
+        rows.append(row)
+
+    if args.json:
+        print(json.dumps({"token_counter": counter_name, "budget": budget, "rows": rows}, indent=2))
+        return
+
+    print(f"Prompt tokens ({counter_name}), condense budget {budget}")
+    header = f"{'transcript':<32}  {'input':>7}  {'truncate':>8}  {'condense':>8}  {'cond ms':>7}"
+    if args.live:
+        header += f"  {'trunc s':>7}  {'cond s':>7}"
+    print(header)
+    for row in rows:
+        line = (f"{row['name'][:32]:<32}  {row['transcript_tokens']:>7}  {row['truncate_tokens']:>8}  "
+                f"{row['condense_tokens']:>8}  {row['condense_ms']:>7.1f}")
+        if args.live:
+            line += f"  {row['truncate_latency_s']:>7.3f}  {row['condense_latency_s']:>7.3f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Local stand-in for the OpenAI transcription and chat-completion endpoints.
+
+Usage:
+    python .aur2/benchmarks/stub_api.py [--port 8765] [--latency-ms 200] [--jitter-ms 50] [--error-rate 0.05]
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub python .aur2/scripts/transcribe.py memo.wav
+
+    from stub_api import start_stub
+    server, base_url = start_stub(latency_ms=200, error_rate=0.05)
+
+Answers POST /v1/audio/transcriptions and POST /v1/chat/completions
+(plain text, or {"titles": [...]} for the batched title schema) after a
+configurable delay. Uploads also take time in proportion to their size.
+A fraction of requests can be answered with 429 and a Retry-After
+header, to exercise the retry and fleet rate-limit paths without a
+network or an API key.
+
+Transcripts are synthetic sentences, about one per 16KB uploaded, so
+longer audio yields longer text.
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8765
+DEFAULT_LATENCY_MS = 200  # Server think time per request
+DEFAULT_JITTER_MS = 50  # Latency varies uniformly by +/- this much
+DEFAULT_UPLOAD_MS_PER_MB = 20  # Extra time per uploaded MB (~400 Mbit/s)
+DEFAULT_RETRY_AFTER_S = 1.0  # Retry-After sent with injected 429s
+BYTES_PER_SENTENCE = 16 * 1024
+
+WORDS = ("budget roadmap hiring migration launch review customer billing cache deploy pipeline team "
+         "quarter metrics onboarding priority estimate feedback design schedule").split()
+
+
+def synthetic_text(body: bytes) -> str:
+    """Deterministic transcript for an upload: same bytes, same text."""
+    rng = random.Random(hashlib.sha256(body).digest())
+    sentences = []
+    for _ in range(max(1, len(body) // BYTES_PER_SENTENCE)):
+        words = rng.choices(WORDS, k=rng.randint(6, 14))
+        sentences.append(" ".join(words).capitalize() + ".")
+    return " ".join(sentences)
+
+
+def make_handler(config: dict, stats: dict, stats_lock: threading.Lock):
+    """Request handler class bound to a stub configuration."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+        def log_message(self, format, *args):
+            if config["verbose"]:
+                super().log_message(format, *args)
+
+        def _send_json(self, status: int, payload: dict, headers: dict | None = None) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _delay(self, size: int) -> None:
+            jitter = random.uniform(-config["jitter_ms"], config["jitter_ms"])
+            upload = config["upload_ms_per_mb"] * size / (1024 * 1024)
+            time.sleep(max(0.0, config["latency_ms"] + jitter + upload) / 1000)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            with stats_lock:
+                stats["requests"] += 1
+                stats["bytes"] += len(body)
+                throttled = random.random() < config["error_rate"]
+                if throttled:
+                    stats["throttled"] += 1
+
+            if throttled:
+                self._send_json(429, {"error": {"message": "Rate limit reached (stub)", "type": "requests",
+                                                "code": "rate_limit_exceeded"}},
+                                {"Retry-After": f"{config['retry_after_s']:g}"})
+                return
+
+            self._delay(len(body))
+            if self.path.endswith("/audio/transcriptions"):
+                self._transcription(body)
+            elif self.path.endswith("/chat/completions"):
+                self._chat(json.loads(body or b"{}"))
+            else:
+                self._send_json(404, {"error": {"message": f"Unknown endpoint {self.path} (stub)"}})
+
+        def _transcription(self, body: bytes) -> None:
+            self._send_json(200, {"text": synthetic_text(body)})
+
+        def _chat(self, request: dict) -> None:
+            prompt = request["messages"][-1]["content"]
+            if request.get("response_format", {}).get("type") == "json_schema":
+                memos = len(re.findall(r"^Memo \d+:$", prompt, re.MULTILINE))
+                content = json.dumps({"titles": [{"memo": i, "title": f"Stub Memo Title {i}"}
+                                                 for i in range(1, memos + 1)]})
+            else:
+                content = "Stub Memo Title"
+
+            self._send_json(200, {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                          "total_tokens": (len(prompt) + len(content)) // 4},
+            })
+
+    return Handler
+
+
+def start_stub(port: int = 0, latency_ms: float = DEFAULT_LATENCY_MS, jitter_ms: float = DEFAULT_JITTER_MS,
+               upload_ms_per_mb: float = DEFAULT_UPLOAD_MS_PER_MB, error_rate: float = 0.0,
+               retry_after_s: float = DEFAULT_RETRY_AFTER_S, verbose: bool = False):
+    """Serve the stub API on 127.0.0.1 from a background thread.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        latency_ms: Server think time per request
+        jitter_ms: Uniform latency variation, +/- this much
+        upload_ms_per_mb: Extra time per uploaded MB
+        error_rate: Fraction of requests answered with 429
+        retry_after_s: Retry-After sent with those 429s
+        verbose: Log every request to stderr
+
+    Returns:
+        Tuple of (server, base_url); server.stats counts requests, bytes and
+        throttled responses, and server.shutdown() stops it
+    """
+    config = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "upload_ms_per_mb": upload_ms_per_mb,
+              "error_rate": error_rate, "retry_after_s": retry_after_s, "verbose": verbose}
+    stats = {"requests": 0, "bytes": 0, "throttled": 0}
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(config, stats, threading.Lock()))
+    server.daemon_threads = True
+    server.stats = stats
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a local stand-in for the OpenAI transcription and chat endpoints",
+        epilog="Examples:\n"
+               "  python .aur2/benchmarks/stub_api.py --latency-ms 500 --error-rate 0.1\n"
+               "  OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub \\\n"
+               "      python .aur2/scripts/record_memo.py --no-daemon\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=DEFAULT_LATENCY_MS,
+        help=f"Server think time per request (default: {DEFAULT_LATENCY_MS})"
+    )
+    parser.add_argument(
+        "--jitter-ms",
+        type=float,
+        default=DEFAULT_JITTER_MS,
+        help=f"Latency varies by +/- this much (default: {DEFAULT_JITTER_MS})"
+    )
+    parser.add_argument(
+        "--upload-ms-per-mb",
+        type=float,
+        default=DEFAULT_UPLOAD_MS_PER_MB,
+        help=f"Extra time per uploaded MB (default: {DEFAULT_UPLOAD_MS_PER_MB})"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with 429 (default: 0)"
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=DEFAULT_RETRY_AFTER_S,
+        help=f"Retry-After seconds sent with 429s (default: {DEFAULT_RETRY_AFTER_S:g})"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server, base_url = start_stub(args.port, args.latency_ms, args.jitter_ms, args.upload_ms_per_mb,
+                                  args.error_rate, args.retry_after, verbose=args.verbose)
+    print(f"Stub API listening on {base_url} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\nServed {server.stats['requests']} requests ({server.stats['throttled']} throttled)",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Check that concurrent chunk uploads actually overlap.
+
+Usage:
+    python -m pytest .aur2/benchmarks/test_concurrency.py
+
+Runs transcribe.transcribe_chunks against stub_api.py with a fixed server
+latency, once with one upload thread and once with four. When uploads are
+latency-bound, four threads should take about a quarter of the time.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path[:0] = [str(BENCHMARKS_DIR), str(BENCHMARKS_DIR.parent / "scripts")]
+
+CHUNKS = 8  # Divisible by 4, so every jobs=4 wave is full
+LATENCY_MS = 250  # Fixed server time per chunk, large next to client overhead
+SPEEDUP_TOLERANCE = 0.35  # jobs=4 may take up to 35% longer than a perfect quarter
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    """Point the shared API client at a stub with fixed latency, in a scratch project."""
+    from stub_api import start_stub
+    from api_client import configure_client
+
+    server, base_url = start_stub(latency_ms=LATENCY_MS, jitter_ms=0, upload_ms_per_mb=0)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "stub")
+    monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    monkeypatch.setenv("AUR2_RATE_LIMIT", "0")
+    configure_client()
+    yield server
+    server.shutdown()
+    configure_client()
+
+
+def timed_transcribe(jobs: int) -> float:
+    """Seconds to transcribe CHUNKS distinct in-memory chunks with ``jobs`` threads."""
+    from transcribe import transcribe_chunks
+
+    chunks = [(f"chunk-{jobs}-{i}.wav", f"jobs={jobs} chunk={i}".encode() * 1024) for i in range(CHUNKS)]
+    start = time.perf_counter()
+    text = transcribe_chunks(chunks, "memo.wav", jobs=jobs, use_cache=False)
+    elapsed = time.perf_counter() - start
+    assert text
+    return elapsed
+
+
+def test_four_jobs_take_a_quarter_of_the_time(stub):
+    timed_transcribe(1)  # Warm up the client and its connections
+
+    serial = timed_transcribe(1)
+    concurrent = timed_transcribe(4)
+
+    assert stub.stats["requests"] == 3 * CHUNKS
+    assert serial >= CHUNKS * LATENCY_MS / 1000
+    assert concurrent == pytest.approx(serial / 4, rel=SPEEDUP_TOLERANCE)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Process-wide OpenAI client with pooled keep-alive connections.
+
+Every transcription and title request goes through one client, so
+concurrent chunk uploads reuse open TLS connections instead of each
+building a client and paying for a fresh handshake.
+
+Usage:
+    from api_client import get_client
+    client = get_client()
+
+    python .aur2/scripts/api_client.py   # Show the effective settings
+
+Environment:
+    OPENAI_API_KEY - Required. Your OpenAI API key.
+    OPENAI_BASE_URL - Optional. Send requests to a compatible server instead
+        (e.g. a local stub for benchmarking).
+    AUR2_HTTP_POOL_SIZE - Optional. Connections kept open (default: 16).
+    AUR2_HTTP_TIMEOUT_S - Optional. Per-request timeout in seconds (default: 120).
+    AUR2_HTTP_CONNECT_TIMEOUT_S - Optional. Connect timeout in seconds (default: 10).
+"""
+
+import os
+import sys
+import argparse
+import threading
+
+DEFAULT_POOL_SIZE = 16  # Enough for the default upload jobs plus a title call
+DEFAULT_TIMEOUT_S = 120.0  # Long enough for a 25MB upload on a slow link
+DEFAULT_CONNECT_TIMEOUT_S = 10.0
+KEEPALIVE_EXPIRY_S = 60.0  # Idle connections are closed after this
+SDK_MAX_RETRIES = 0  # Callers retry through rate_limit, so every 429 reaches the fleet-wide limiter
+
+_client_lock = threading.Lock()
+_client = None
+_overrides: dict = {}
+
+
+def client_settings() -> dict:
+    """Effective client settings: configure_client overrides, then environment, then defaults."""
+    settings = {
+        "base_url": os.environ.get("OPENAI_BASE_URL") or None,
+        "pool_size": int(os.environ.get("AUR2_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE)),
+        "timeout_s": float(os.environ.get("AUR2_HTTP_TIMEOUT_S", DEFAULT_TIMEOUT_S)),
+        "connect_timeout_s": float(os.environ.get("AUR2_HTTP_CONNECT_TIMEOUT_S", DEFAULT_CONNECT_TIMEOUT_S)),
+    }
+    settings.update(_overrides)
+    return settings
+
+
+def create_client(base_url: str | None = None, pool_size: int = DEFAULT_POOL_SIZE,
+                  timeout_s: float = DEFAULT_TIMEOUT_S, connect_timeout_s: float = DEFAULT_CONNECT_TIMEOUT_S):
+    """Build an OpenAI client backed by a pooled HTTP client.
+
+    The SDK's own retries are off: a retry inside the SDK would run while
+    the caller still holds its rate_limit lease, so the limiter would never
+    see the 429 (no backoff, no cooldown) or charge the extra request.
+    transcribe_with_retry and generate_title retry instead, each attempt
+    with a fresh lease.
+
+    Args:
+        base_url: API base URL, or None for the SDK default
+        pool_size: Maximum open (and kept-alive) connections
+        timeout_s: Per-request timeout in seconds
+        connect_timeout_s: Connect timeout in seconds
+
+    Returns:
+        openai.OpenAI instance
+    """
+    import httpx
+    from openai import OpenAI, DefaultHttpxClient
+
+    http_client = DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=KEEPALIVE_EXPIRY_S,
+        ),
+        timeout=httpx.Timeout(timeout_s, connect=connect_timeout_s),
+    )
+    return OpenAI(base_url=base_url, http_client=http_client, max_retries=SDK_MAX_RETRIES)
+
+
+def get_client():
+    """Get the shared OpenAI client, creating it on first use.
+
+    The client is thread-safe, so chunk upload workers share it.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = create_client(**client_settings())
+        return _client
+
+
+def configure_client(**overrides) -> None:
+    """Override client settings for the rest of the process (e.g. base_url for a stub server).
+
+    Accepts the keyword arguments of create_client. The shared client is
+    rebuilt on next use.
+    """
+    global _client
+    with _client_lock:
+        _overrides.update(overrides)
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def main():
+    """CLI interface: show the settings the shared client would use."""
+    parser = argparse.ArgumentParser(description="Show the effective API client settings")
+    parser.parse_args()
+
+    for name, value in client_settings().items():
+        print(f"{name}: {value if value is not None else '(SDK default)'}")
+    if not os.environ.get("OPENAI_API_KEY"):
+        print("Warning: OPENAI_API_KEY is not set", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Content-addressed on-disk cache for transcripts and other API results.
+
+Usage:
+    python .aur2/scripts/cache.py stats
+    python .aur2/scripts/cache.py clear [--namespace transcripts]
+
+Entries live under .aur2/cache/<namespace>/ as one file per key (a SHA-256
+of the content that produced them). Reads refresh the entry's mtime, and
+writes evict the least recently used entries once a namespace grows past
+its size cap.
+"""
+
+import os
+import sys
+import hashlib
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+
+DEFAULT_MAX_MB = 50  # Size cap per namespace before LRU eviction
+
+_evict_lock = threading.Lock()
+
+
+def get_cache_root() -> Path:
+    """Get the .aur2/cache directory path (not created)."""
+    # Find .aur2 the same way record_memo does: walk up from cwd
+    cwd = Path.cwd()
+    for parent in [cwd] + list(cwd.parents):
+        aur2_dir = parent / ".aur2"
+        if aur2_dir.exists():
+            return aur2_dir / "cache"
+
+    # Fallback to cwd/.aur2/cache
+    return cwd / ".aur2" / "cache"
+
+
+def get_cache_dir(namespace: str) -> Path:
+    """Get the .aur2/cache/<namespace> directory path (not created)."""
+    return get_cache_root() / namespace
+
+
+def cache_key(*parts: str | bytes) -> str:
+    """Hash the given parts into a cache key.
+
+    Parts are length-prefixed so ("ab", "c") and ("a", "bc") differ.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _entry_path(namespace: str, key: str) -> Path:
+    return get_cache_dir(namespace) / key[:2] / key
+
+
+def cache_get(namespace: str, key: str) -> str | None:
+    """Look up a cached value, marking it as recently used.
+
+    Returns:
+        The cached text, or None on a miss
+    """
+    path = _entry_path(namespace, key)
+    try:
+        value = path.read_text(encoding="utf-8")
+        os.utime(path)  # mtime doubles as the LRU timestamp
+        return value
+    except (FileNotFoundError, OSError):
+        return None
+
+
+def cache_put(namespace: str, key: str, value: str, max_mb: float = DEFAULT_MAX_MB) -> None:
+    """Store a value, then evict least recently used entries over the cap.
+
+    Writes are atomic (temp file + rename), so concurrent workers and
+    interrupted runs never leave a half-written entry behind.
+    """
+    path = _entry_path(namespace, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, delete=False) as temp_file:
+        temp_file.write(value)
+    os.replace(temp_file.name, path)
+
+    evict(namespace, int(max_mb * 1024 * 1024))
+
+
+def evict(namespace: str, max_bytes: int) -> int:
+    """Delete least recently used entries until the namespace fits in max_bytes.
+
+    Returns:
+        Number of entries deleted
+    """
+    with _evict_lock:
+        entries = []
+        total = 0
+        for path in get_cache_dir(namespace).glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        deleted = 0
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            deleted += 1
+        return deleted
+
+
+def main():
+    """CLI interface for inspecting and clearing the cache."""
+    parser = argparse.ArgumentParser(description="Inspect or clear the .aur2 result cache")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument(
+        "--namespace",
+        type=str,
+        help="Only act on one namespace (e.g. transcripts)"
+    )
+    args = parser.parse_args()
+
+    if args.namespace:
+        namespaces = [args.namespace]
+    elif get_cache_root().exists():
+        namespaces = sorted(p.name for p in get_cache_root().iterdir() if p.is_dir())
+    else:
+        namespaces = []
+
+    for namespace in namespaces:
+        if args.command == "clear":
+            deleted = evict(namespace, 0)
+            print(f"{namespace}: deleted {deleted} entries", file=sys.stderr)
+        else:
+            files = [p for p in get_cache_dir(namespace).glob("*/*") if p.is_file()]
+            size_mb = sum(p.stat().st_size for p in files) / (1024 * 1024)
+            print(f"{namespace}: {len(files)} entries, {size_mb:.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
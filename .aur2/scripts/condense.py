@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Extractive condensing of long transcripts to a fixed token budget.
+
+Usage:
+    python .aur2/scripts/condense.py transcript.txt [--tokens 600]
+    cat transcript.txt | python .aur2/scripts/condense.py
+
+Picks the sentences that best represent the whole transcript (TF-IDF
+similarity to the document centroid, with a penalty for repeating what is
+already picked) until the budget is full, and returns them in their
+original order. Used to keep the title prompt small and constant-size
+without ignoring everything after the opening.
+
+Requirements:
+    pip install -r .aur2/scripts/requirements.txt
+"""
+
+import re
+import sys
+import math
+import argparse
+
+DEFAULT_TOKEN_BUDGET = 600  # Prompt tokens spent on transcript text
+CHARS_PER_TOKEN = 4  # Rough size of an English token; avoids a tokenizer dependency
+REDUNDANCY_WEIGHT = 0.5  # How strongly overlap with picked sentences lowers a candidate's score
+LEAD_SENTENCES = 3  # Opening sentences often name the topic; they get a small boost
+LEAD_BONUS = 0.1
+MIN_SENTENCE_CHARS = 20  # Shorter fragments ("Okay.", "Um, so.") are never picked
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+WORD = re.compile(r"[a-z0-9']+")
+
+# Fillers and function words that say nothing about the topic
+STOPWORDS = frozenset("""
+a about after again all also am an and any are as at be because been but by can could did do does
+doing don't for from get got had has have having he her here him his how i i'm if in into is it it's
+its just know let's like maybe me more my no not now of off oh ok okay on one or our out really right
+say so some something that that's the their them then there these they thing things think this to
+too uh um up us very want was we we're well were what when where which who will with would yeah you
+your
+""".split())
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split transcript text into sentences on terminal punctuation."""
+    return [sentence.strip() for sentence in SENTENCE_END.split(text.strip()) if sentence.strip()]
+
+
+def _tfidf(sentences: list[str]):
+    """L2-normalized TF-IDF matrix (sentences x terms), treating each sentence as a document."""
+    import numpy as np
+
+    tokenized = [[word for word in WORD.findall(sentence.lower()) if word not in STOPWORDS]
+                 for sentence in sentences]
+    vocabulary = {word: j for j, word in enumerate(sorted({word for words in tokenized for word in words}))}
+
+    counts = np.zeros((len(sentences), max(len(vocabulary), 1)), dtype=np.float32)
+    for i, words in enumerate(tokenized):
+        for word in words:
+            counts[i, vocabulary[word]] += 1
+
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1
+    weights = np.log1p(counts) * idf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    return weights / np.where(norms == 0, 1, norms)
+
+
+def condense(text: str, token_budget: int = DEFAULT_TOKEN_BUDGET) -> str:
+    """Condense text to about token_budget tokens of its most representative sentences.
+
+    Text already within the budget is returned unchanged. Without numpy the
+    opening of the text is kept instead.
+
+    Args:
+        text: Transcript text
+        token_budget: Maximum tokens (estimated) of the result
+
+    Returns:
+        Selected sentences in their original order
+    """
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    char_budget = token_budget * CHARS_PER_TOKEN
+    try:
+        import numpy as np
+    except ImportError:
+        return text[:char_budget]
+
+    sentences = split_sentences(text)
+    candidates = [i for i, sentence in enumerate(sentences) if len(sentence) >= MIN_SENTENCE_CHARS]
+    if not candidates:
+        return text[:char_budget]
+
+    vectors = _tfidf(sentences)
+    centroid = vectors[candidates].sum(axis=0)
+    centroid /= np.linalg.norm(centroid) or 1
+    relevance = vectors @ centroid
+    relevance[:LEAD_SENTENCES] += LEAD_BONUS
+
+    # Greedy maximal-marginal-relevance selection until the budget is full
+    lengths = np.array([len(sentence) + 1 for sentence in sentences])
+    available = np.zeros(len(sentences), dtype=bool)
+    available[candidates] = True
+    redundancy = np.zeros(len(sentences), dtype=np.float32)
+    selected: list[int] = []
+    used_chars = 0
+    while True:
+        available &= lengths <= char_budget - used_chars
+        if not available.any():
+            break
+        scores = np.where(available, relevance - REDUNDANCY_WEIGHT * redundancy, -np.inf)
+        best = int(np.argmax(scores))
+        available[best] = False
+        selected.append(best)
+        used_chars += lengths[best]
+        redundancy = np.maximum(redundancy, vectors @ vectors[best])
+
+    if not selected:
+        return text[:char_budget]
+    return " ".join(sentences[i] for i in sorted(selected))
+
+
+def main():
+    """CLI interface: print the condensed version of a transcript."""
+    parser = argparse.ArgumentParser(description="Condense a transcript to its most representative sentences")
+    parser.add_argument("file", nargs="?", help="Transcript file (default: stdin)")
+    parser.add_argument(
+        "--tokens",
+        type=int,
+        default=DEFAULT_TOKEN_BUDGET,
+        help=f"Token budget (default: {DEFAULT_TOKEN_BUDGET})"
+    )
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            text = f.read()
+    else:
+        text = sys.stdin.read()
+
+    condensed = condense(text, args.tokens)
+    print(condensed)
+    print(f"{estimate_tokens(text)} -> {estimate_tokens(condensed)} tokens (estimated)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,15 @@
 Usage:
     python .aur2/scripts/generate_title.py --text "transcription text"
     python .aur2/scripts/generate_title.py --file transcription.txt
+    python .aur2/scripts/generate_title.py --file a.txt b.txt c.txt   # One batched request
     echo "transcription text" | python .aur2/scripts/generate_title.py
 
 Requirements:
     pip install -r .aur2/scripts/requirements.txt
 
+Titles are cached under .aur2/cache/titles/, keyed on the transcript and
+model, so re-processing a memo does not cost another request.
+
 Environment:
     OPENAI_API_KEY - Required. Your OpenAI API key.
 """
@@ -16,10 +20,44 @@ Environment:
 import os
 import sys
 import re
+import json
+import time
 import argparse
 from datetime import datetime
 
 MAX_TITLE_LENGTH = 50  # Characters before truncation
+TITLE_TOKEN_BUDGET = 600  # Transcript tokens sent in the title prompt
+MAX_REQUEST_RETRIES = 3  # Failed title requests retried before falling back
+RETRY_BACKOFF_S = 1.0  # Base delay before retrying a network or server error
+TITLE_BATCH_SIZE = 8  # Transcripts titled per request
+BATCH_TOKENS_PER_TITLE = 40  # Response tokens allowed per memo in a batch
+TITLE_CACHE_NAMESPACE = "titles"  # Generated titles under .aur2/cache/
+TITLE_CACHE_MAX_MB = 1  # Title cache size before LRU eviction
+
+# Structured output for batch requests: one {memo, title} per transcript
+BATCH_RESPONSE_SCHEMA = {
+    "name": "memo_titles",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "titles": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "memo": {"type": "integer"},
+                        "title": {"type": "string"},
+                    },
+                    "required": ["memo", "title"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["titles"],
+        "additionalProperties": False,
+    },
+}
 
 
 def sanitize_title(title: str) -> str:
@@ -60,15 +98,122 @@ def sanitize_title(title: str) -> str:
     return title
 
 
-def generate_title(transcription: str, model: str = "gpt-4o-mini") -> str:
-    """Generate a concise title for a transcription using an LLM.
+def normalize_transcript(transcription: str) -> str:
+    """Collapse case and whitespace so trivially different copies share a cache entry."""
+    return " ".join(transcription.lower().split())
+
+
+def _fallback_title() -> str:
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return f"transcription-{timestamp}"
+
+
+def _title_prompt(transcription: str) -> str:
+    return f"""Generate a short, memorable title (2-5 words) for this voice memo transcription.
+The title should capture the main topic or purpose.
+Return ONLY the title, no explanation or formatting.
+
+Transcription:
+{transcription}"""
+
+
+def _batch_prompt(transcriptions: list[str]) -> str:
+    memos = "\n\n".join(f"Memo {i}:\n{text}" for i, text in enumerate(transcriptions, start=1))
+    return f"""Generate a short, memorable title (2-5 words) for each of these {len(transcriptions)} voice memo transcriptions.
+Each title should capture the main topic or purpose of its own memo.
+Return one title per memo, identified by the memo's number.
+
+{memos}"""
+
+
+def _complete(client, model: str, prompt: str, max_tokens: int, items: int = 1, **kwargs):
+    """Send one chat completion, drawing from the fleet-wide budget.
+
+    Retries happen here, not in the SDK, so each attempt takes its own
+    limiter lease. A 429 is retried rather than turned into a fallback
+    title; the limiter holds the retry back until the server's Retry-After
+    has passed, or with the limiter disabled the retry sleeps through it
+    here. Network and server errors are retried after a backoff.
+    """
+    import metrics
+    from rate_limit import (rate_limited, is_rate_limited, is_retryable, get_retry_after_s, enabled,
+                            MAX_COOLDOWN_S)
+
+    for attempt in range(MAX_REQUEST_RETRIES + 1):
+        try:
+            with rate_limited(), metrics.span("title_request", bytes=len(prompt.encode("utf-8")), items=items):
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=max_tokens,
+                    **kwargs
+                )
+            break
+        except Exception as e:
+            if attempt == MAX_REQUEST_RETRIES or not is_retryable(e):
+                raise
+            if is_rate_limited(e) and enabled():
+                print("Title request rate limited, retrying...", file=sys.stderr)
+                continue
+            retry_after_s = get_retry_after_s(e) if is_rate_limited(e) else None
+            delay = RETRY_BACKOFF_S * (2 ** attempt) if retry_after_s is None else min(retry_after_s, MAX_COOLDOWN_S)
+            print(f"Title request failed ({e}), retrying in {delay:.1f}s...", file=sys.stderr)
+            time.sleep(delay)
+    return response.choices[0].message.content.strip()
+
+
+def _request_titles(transcriptions: list[str], model: str) -> list[str | None]:
+    """Title a batch in one request; None for any memo the response left out.
+
+    A batch response that isn't valid JSON (e.g. cut off at max_tokens)
+    leaves every memo None, so each is retried on its own.
+    """
+    from api_client import get_client
+
+    # Shared with transcription, so the title call reuses an open connection
+    client = get_client()
+
+    if len(transcriptions) == 1:
+        return [_complete(client, model, _title_prompt(transcriptions[0]), max_tokens=50)]
+
+    content = _complete(
+        client, model, _batch_prompt(transcriptions),
+        max_tokens=BATCH_TOKENS_PER_TITLE * len(transcriptions),
+        items=len(transcriptions),
+        response_format={"type": "json_schema", "json_schema": BATCH_RESPONSE_SCHEMA},
+    )
+    titles: list[str | None] = [None] * len(transcriptions)
+    try:
+        items = json.loads(content).get("titles", [])
+    except (json.JSONDecodeError, AttributeError):
+        print("Warning: batch title response was not valid JSON, titling memos one at a time", file=sys.stderr)
+        return titles
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("memo"), int):
+            continue
+        index = item["memo"] - 1
+        if 0 <= index < len(titles) and item.get("title"):
+            titles[index] = item["title"]
+    return titles
+
+
+def generate_titles(transcriptions: list[str], model: str = "gpt-4o-mini") -> list[str]:
+    """Generate titles for several transcriptions with as few LLM calls as possible.
+
+    Titles already generated for the same transcript (ignoring case and
+    whitespace) and model come from the cache. The rest are sent
+    TITLE_BATCH_SIZE at a time in one structured request each; a memo the
+    model skipped is retried on its own.
 
     Args:
-        transcription: The transcription text to generate a title for
+        transcriptions: Transcription texts
         model: OpenAI model to use (default: gpt-4o-mini)
 
     Returns:
-        Sanitized kebab-case title
+        Sanitized kebab-case titles, in the same order as transcriptions
     """
     # Load environment variables from .env file
     # Check .aur2/.env first (standard location), then .env in current dir
@@ -87,48 +232,60 @@ def generate_title(transcription: str, model: str = "gpt-4o-mini") -> str:
     if not os.environ.get("OPENAI_API_KEY"):
         raise ValueError("OPENAI_API_KEY environment variable not set")
 
-    # Handle empty or very short transcriptions
-    if not transcription or len(transcription.strip()) < 10:
-        return "short-memo"
-
-    # Handle very long transcriptions - truncate to first 5,000 characters
-    if len(transcription) > 10000:
-        transcription = transcription[:5000]
-
-    try:
-        from openai import OpenAI
-
-        client = OpenAI()
-
-        # Construct focused prompt
-        prompt = f"""Generate a short, memorable title (2-5 words) for this voice memo transcription.
-The title should capture the main topic or purpose.
-Return ONLY the title, no explanation or formatting.
-
-Transcription:
-{transcription}"""
+    from cache import cache_get, cache_put, cache_key
+    from condense import condense
+
+    titles: list[str | None] = [None] * len(transcriptions)
+    keys: list[str | None] = [None] * len(transcriptions)
+    for i, transcription in enumerate(transcriptions):
+        # Handle empty or very short transcriptions
+        if not transcription or len(transcription.strip()) < 10:
+            titles[i] = "short-memo"
+            continue
+        keys[i] = cache_key(model, normalize_transcript(transcription))
+        titles[i] = cache_get(TITLE_CACHE_NAMESPACE, keys[i])
+
+    missing = [i for i, title in enumerate(titles) if title is None]
+    for batch_start in range(0, len(missing), TITLE_BATCH_SIZE):
+        batch = missing[batch_start:batch_start + TITLE_BATCH_SIZE]
+        # Keep each prompt small and constant-size: long transcripts are
+        # condensed to their most representative sentences from start to end
+        texts = [condense(transcriptions[i], TITLE_TOKEN_BUDGET) for i in batch]
+        try:
+            raw = _request_titles(texts, model)
+        except Exception as e:
+            # Handle API errors - fallback titles with timestamp (not cached)
+            print(f"Warning: API error ({e}), using fallback title", file=sys.stderr)
+            for i in batch:
+                titles[i] = _fallback_title()
+            continue
+
+        for i, text, title in zip(batch, texts, raw):
+            if title is None:
+                # Left out of the batch response: retry alone, so a failure only costs this memo its title
+                try:
+                    title = _request_titles([text], model)[0]
+                except Exception as e:
+                    print(f"Warning: API error ({e}), using fallback title", file=sys.stderr)
+                    titles[i] = _fallback_title()
+                    continue
+            titles[i] = sanitize_title(title)
+            cache_put(TITLE_CACHE_NAMESPACE, keys[i], titles[i], TITLE_CACHE_MAX_MB)
+
+    return titles
 
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=50
-        )
 
-        # Extract title from response
-        title = response.choices[0].message.content.strip()
+def generate_title(transcription: str, model: str = "gpt-4o-mini") -> str:
+    """Generate a concise title for a transcription using an LLM.
 
-        # Sanitize and return
-        return sanitize_title(title)
+    Args:
+        transcription: The transcription text to generate a title for
+        model: OpenAI model to use (default: gpt-4o-mini)
 
-    except Exception as e:
-        # Handle API errors - return fallback with timestamp
-        print(f"Warning: API error ({e}), using fallback title", file=sys.stderr)
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        return f"transcription-{timestamp}"
+    Returns:
+        Sanitized kebab-case title
+    """
+    return generate_titles([transcription], model=model)[0]
 
 
 def main():
@@ -138,6 +295,7 @@ def main():
         epilog="Examples:\n"
                "  echo 'Meeting notes about API refactor' | python .aur2/scripts/generate_title.py\n"
                "  python .aur2/scripts/generate_title.py --file transcription.txt\n"
+               "  python .aur2/scripts/generate_title.py --file memos/*/transcript.txt\n"
                "  python .aur2/scripts/generate_title.py --text 'Quick memo about the bug fix'\n",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -146,7 +304,8 @@ def main():
     input_group.add_argument(
         "--file",
         type=str,
-        help="Read transcription from file"
+        nargs="+",
+        help="Read transcription from file (several files are titled in one batch, one title per line)"
     )
     input_group.add_argument(
         "--text",
@@ -160,9 +319,17 @@ def main():
         default="gpt-4o-mini",
         help="OpenAI model to use (default: gpt-4o-mini)"
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print request timings (spans are always saved to .aur2/metrics)"
+    )
 
     args = parser.parse_args()
 
+    import metrics
+    metrics.start_run("generate_title", profile=args.profile)
+
     # Load environment variables from .env file
     # Check .aur2/.env first (standard location), then .env in current dir
     try:
@@ -192,12 +359,24 @@ def main():
 
     # Get transcription text from appropriate source
     try:
-        if args.file:
+        if args.file and len(args.file) > 1:
+            # Several files: title them together and print one title per line
+            transcriptions = []
+            for path in args.file:
+                if not os.path.exists(path):
+                    print(f"Error: File not found: {path}", file=sys.stderr)
+                    sys.exit(1)
+                with open(path, 'r', encoding='utf-8') as f:
+                    transcriptions.append(f.read().strip())
+            for title in generate_titles(transcriptions, model=args.model):
+                print(title)
+            return
+        elif args.file:
             # Read from file
-            if not os.path.exists(args.file):
-                print(f"Error: File not found: {args.file}", file=sys.stderr)
+            if not os.path.exists(args.file[0]):
+                print(f"Error: File not found: {args.file[0]}", file=sys.stderr)
                 sys.exit(1)
-            with open(args.file, 'r', encoding='utf-8') as f:
+            with open(args.file[0], 'r', encoding='utf-8') as f:
                 transcription = f.read()
         elif args.text:
             # Use provided text
@@ -225,6 +404,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        metrics.finish_run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Progress manifests that let an interrupted chunked transcription resume.
+
+A manifest sits next to the audio it describes (memo.wav ->
+memo.progress.json) and records the chunk plan, the settings that produced
+it, and the text of every chunk finished so far. A resumed run with the same
+audio and settings reuses the plan and only transcribes missing chunks.
+
+Usage:
+    python .aur2/scripts/manifest.py <audio-file-path>
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".progress.json"
+
+
+def manifest_path_for(audio_path: str | Path) -> Path:
+    """Path of the progress manifest that belongs to an audio file."""
+    audio_path = Path(audio_path)
+    return audio_path.with_name(audio_path.stem + MANIFEST_SUFFIX)
+
+
+def file_sha256(path: str | Path) -> str:
+    """SHA-256 of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def new_manifest(audio_sha256: str, settings: dict, plan: list[tuple[int, int]]) -> dict:
+    """Create an empty manifest for a chunk plan."""
+    return {
+        "version": MANIFEST_VERSION,
+        "audio_sha256": audio_sha256,
+        "settings": settings,
+        "plan": [list(span) for span in plan],
+        "chunks": {},
+    }
+
+
+def load_manifest(path: str | Path, audio_sha256: str, settings: dict) -> dict | None:
+    """Load a manifest if it matches the given audio and settings.
+
+    Returns:
+        The manifest, or None if it is missing, unreadable, or was written
+        for different audio or settings (its plan would not line up)
+    """
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+    if (manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("audio_sha256") != audio_sha256
+            or manifest.get("settings") != settings):
+        print(f"Ignoring {Path(path).name}: written for different audio or settings", file=sys.stderr)
+        return None
+    return manifest
+
+
+def save_manifest(path: str | Path, manifest: dict) -> None:
+    """Write a manifest atomically, so a kill mid-write never corrupts it."""
+    path = Path(path)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, suffix=".tmp",
+                                     delete=False) as temp_file:
+        try:
+            json.dump(manifest, temp_file, indent=2)
+        except BaseException:
+            os.unlink(temp_file.name)
+            raise
+    try:
+        os.replace(temp_file.name, path)
+    except OSError:
+        os.unlink(temp_file.name)
+        raise
+
+
+def completed_chunks(manifest: dict) -> dict[int, str]:
+    """Finished chunk texts from a manifest, keyed by chunk index."""
+    return {int(i): text for i, text in manifest["chunks"].items()}
+
+
+def main():
+    """CLI interface: show how far a manifest's transcription got."""
+    parser = argparse.ArgumentParser(description="Show progress recorded for a chunked transcription")
+    parser.add_argument("audio_path", type=str, help="Audio file whose manifest to show")
+    args = parser.parse_args()
+
+    path = manifest_path_for(args.audio_path)
+    if not path.exists():
+        print(f"No manifest at {path}", file=sys.stderr)
+        sys.exit(1)
+
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    done = completed_chunks(manifest)
+    for i, (start_ms, end_ms) in enumerate(manifest["plan"]):
+        status = "done" if i in done else "missing"
+        print(f"chunk {i + 1:3d}  {start_ms / 1000:9.1f}s - {end_ms / 1000:9.1f}s  {status}")
+    print(f"{len(done)}/{len(manifest['plan'])} chunks finished", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""Warm background worker that transcribes and titles memos on request.
+
+Usage:
+    python .aur2/scripts/memo_daemon.py start     # Start in the background
+    python .aur2/scripts/memo_daemon.py status
+    python .aur2/scripts/memo_daemon.py stop
+    python .aur2/scripts/memo_daemon.py serve     # Run in the foreground
+
+A fresh record_memo.py or transcribe.py run spends about a second loading
+.env, openai, pydub and the pipeline modules before the first upload. The
+daemon loads them once and keeps the pooled API client open. While it is
+running, record_memo.py and transcribe.py hand their jobs to it over a Unix
+socket and stream its progress output back. When it is not running, they
+work in-process as before.
+
+Protocol: the client sends one JSON line {"op": ..., ...} and reads JSON
+lines back: {"event": "log", "line": ...} for each progress line,
+{"event": "text", "text": ...} for streamed transcript text, then a final
+{"event": "result", "result": ...} or {"event": "error", "message": ...}.
+
+Jobs run one at a time (each still uploads its chunks concurrently). The
+daemon reads .aur2/.env at startup; restart it after changing the API key.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import socket
+import hashlib
+import argparse
+import tempfile
+import threading
+import subprocess
+import socketserver
+from pathlib import Path
+from typing import Callable
+
+CONNECT_TIMEOUT_S = 0.5  # How long a client waits for the daemon before falling back
+START_TIMEOUT_S = 15.0  # How long `start` waits for the daemon to come up
+
+
+def find_aur2_dir() -> Path:
+    """Find the .aur2 directory the same way record_memo does: walk up from cwd."""
+    cwd = Path.cwd()
+    for parent in [cwd] + list(cwd.parents):
+        aur2_dir = parent / ".aur2"
+        if aur2_dir.exists():
+            return aur2_dir
+
+    # Fallback to cwd/.aur2
+    return cwd / ".aur2"
+
+
+def socket_path() -> Path:
+    """Socket path for this project's daemon.
+
+    Kept in the per-user runtime dir (or the temp dir) rather than .aur2/,
+    since Unix socket paths are limited to ~100 characters. The name is
+    derived from the .aur2 path, so each project gets its own daemon.
+    """
+    if os.environ.get("AUR2_DAEMON_SOCKET"):
+        return Path(os.environ["AUR2_DAEMON_SOCKET"])
+
+    project = hashlib.sha256(str(find_aur2_dir().resolve()).encode("utf-8")).hexdigest()[:12]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"aur2-daemon-{os.getuid()}-{project}.sock"
+
+
+def log_path() -> Path:
+    """Log file of a daemon started in the background."""
+    return socket_path().with_suffix(".log")
+
+
+def _connect(timeout_s: float = CONNECT_TIMEOUT_S) -> socket.socket | None:
+    """Connect to the daemon, or None if it isn't running."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout_s)
+    try:
+        sock.connect(str(socket_path()))
+    except (FileNotFoundError, ConnectionRefusedError, socket.timeout, OSError):
+        sock.close()
+        return None
+    sock.settimeout(None)  # Jobs take as long as they take
+    return sock
+
+
+def call_daemon(op: str, on_text: Callable[[str], None] | None = None,
+                on_sent: Callable[[], None] | None = None, **params):
+    """Run an operation in the daemon, echoing its progress lines to stderr.
+
+    Args:
+        op: Operation name ("transcribe", "memo", "title", "ping", "shutdown")
+        on_text: Receives transcript text streamed by a transcribe job sent
+            with stream=True
+        on_sent: Called once the request is sent; from then on the daemon
+            runs the job even if this client goes away
+        **params: JSON-serializable operation parameters; run_id and profile
+            (see metrics.run_context) attach the job's spans to the caller's run
+
+    Returns:
+        The operation's result, or None if no daemon is running
+
+    Raises:
+        RuntimeError: If the daemon ran the operation and it failed, or the
+            connection to it was lost mid-job
+    """
+    sock = _connect()
+    if sock is None:
+        return None
+
+    with sock, sock.makefile("rwb") as stream:
+        try:
+            stream.write(json.dumps({"op": op, **params}).encode("utf-8") + b"\n")
+            stream.flush()
+            if on_sent:
+                on_sent()
+            for line in stream:
+                event = json.loads(line)
+                if event["event"] == "log":
+                    print(event["line"], file=sys.stderr)
+                elif event["event"] == "text":
+                    if on_text:
+                        on_text(event["text"])
+                elif event["event"] == "result":
+                    return event["result"]
+                else:
+                    raise RuntimeError(event["message"])
+        except (OSError, json.JSONDecodeError) as e:
+            raise RuntimeError("Daemon connection lost") from e
+
+    raise RuntimeError("Daemon closed the connection without a result")
+
+
+class _EventWriter(io.TextIOBase):
+    """File-like stderr stand-in that forwards each complete line to the client as a log event."""
+
+    def __init__(self, send):
+        self._send = send
+        self._pending = ""
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._pending += text
+            *lines, self._pending = self._pending.split("\n")
+        for line in lines:
+            self._send({"event": "log", "line": line})
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            line, self._pending = self._pending, ""
+        if line:
+            self._send({"event": "log", "line": line})
+
+
+def run_op(request: dict, send: Callable[[dict], None]):
+    """Execute one operation in this process; the pipeline modules are already imported."""
+    op = request["op"]
+    if op == "transcribe":
+        from transcribe import transcribe_file, ordered_stream
+        if request.get("stream"):
+            on_chunk_done = ordered_stream(lambda text: send({"event": "text", "text": text}))
+            return transcribe_file(request["audio_path"], on_chunk_done=on_chunk_done, **request.get("options", {}))
+        return transcribe_file(request["audio_path"], **request.get("options", {}))
+
+    if op == "memo":
+        import metrics
+        import record_memo
+        final_dir, success = record_memo.finish_memo(Path(request["audio_path"]), Path(request["visions_dir"]),
+                                                     **request.get("options", {}))
+        return {"final_dir": str(final_dir), "success": success, "spans": metrics.run_spans()}
+
+    if op == "title":
+        from generate_title import generate_title
+        return generate_title(request["text"])
+
+    raise ValueError(f"Unknown operation: {op}")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        send_lock = threading.Lock()
+
+        def send(event: dict) -> None:
+            # A client that went away (e.g. Ctrl+C) must not abort a job halfway through saving a memo
+            with send_lock:
+                try:
+                    self.wfile.write(json.dumps(event).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+                except OSError:
+                    pass
+
+        try:
+            request = json.loads(self.rfile.readline())
+            op = request.get("op")
+            if op == "ping":
+                send({"event": "result", "result": {"pid": os.getpid(), "jobs": self.server.jobs,
+                                                    "uptime_s": time.time() - self.server.started}})
+                return
+            if op == "shutdown":
+                send({"event": "result", "result": "stopping"})
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+            import metrics
+
+            # One job at a time: stderr is swapped process-wide so that
+            # progress printed from upload worker threads reaches the client too
+            with self.server.job_lock:
+                self.server.jobs += 1
+                writer = _EventWriter(send)
+                sys.stderr = writer
+                # Spans are saved under the client's run id, so its run and this job line up in reports
+                metrics.start_run(f"daemon:{op}", profile=request.get("profile", False),
+                                  run_id=request.get("run_id"))
+                try:
+                    result = run_op(request, send)
+                finally:
+                    metrics.finish_run()  # Before stderr is restored, so --profile output reaches the client
+                    writer.flush()
+                    sys.stderr = sys.__stderr__
+            send({"event": "result", "result": result})
+        except Exception as e:
+            send({"event": "error", "message": str(e)})
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def warm_up() -> None:
+    """Load .env, the pipeline modules and the API client so the first job starts instantly."""
+    try:
+        from dotenv import load_dotenv
+        aur2_env = find_aur2_dir() / ".env"
+        if aur2_env.exists():
+            load_dotenv(aur2_env)
+        else:
+            load_dotenv()
+    except ImportError:
+        pass
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    import transcribe  # noqa: F401
+    import generate_title  # noqa: F401
+    import record_memo  # noqa: F401
+    from api_client import get_client
+
+    try:
+        import numpy  # noqa: F401
+        import pydub  # noqa: F401
+        get_client()
+    except Exception as e:
+        print(f"Warning: {e}", file=sys.stderr)
+
+
+def serve() -> None:
+    """Run the daemon in the foreground until stopped."""
+    path = socket_path()
+    if _connect() is not None:
+        print(f"Daemon already running on {path}", file=sys.stderr)
+        sys.exit(1)
+    path.unlink(missing_ok=True)  # Stale socket from a daemon that was killed
+
+    # Work from the project root so relative .aur2 lookups (cache, visions) match the clients
+    os.chdir(find_aur2_dir().resolve().parent)
+    warm_up()
+
+    # Owner-only from the moment the socket file exists, not just after a chmod
+    umask = os.umask(0o177)  # Socket mode 0600
+    try:
+        server = _Server(str(path), _Handler)
+    finally:
+        os.umask(umask)
+    server.job_lock = threading.Lock()
+    server.jobs = 0
+    server.started = time.time()
+    print(f"Daemon listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+        print("Daemon stopped", file=sys.stderr)
+
+
+def start() -> None:
+    """Start the daemon in the background and wait until it accepts connections."""
+    if _connect() is not None:
+        print(f"Daemon already running on {socket_path()}", file=sys.stderr)
+        return
+
+    with open(log_path(), "ab") as log:
+        subprocess.Popen([sys.executable, __file__, "serve"], stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+                         start_new_session=True)
+
+    deadline = time.monotonic() + START_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if _connect() is not None:
+            print(f"Daemon started on {socket_path()}", file=sys.stderr)
+            return
+        time.sleep(0.1)
+
+    print(f"Error: Daemon did not start; see {log_path()}", file=sys.stderr)
+    sys.exit(1)
+
+
+def main():
+    """CLI interface for the warm daemon."""
+    parser = argparse.ArgumentParser(
+        description="Keep the transcription pipeline loaded so memos start instantly",
+        epilog="Examples:\n"
+               "  python .aur2/scripts/memo_daemon.py start\n"
+               "  python .aur2/scripts/record_memo.py          # uses the daemon when it is running\n"
+               "  python .aur2/scripts/memo_daemon.py stop\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"])
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve()
+    elif args.command == "start":
+        start()
+    elif args.command == "stop":
+        if call_daemon("shutdown") is None:
+            print("Daemon is not running", file=sys.stderr)
+    else:
+        status = call_daemon("ping")
+        if status is None:
+            print("Daemon is not running", file=sys.stderr)
+            sys.exit(1)
+        print(f"Daemon running (pid {status['pid']}, up {status['uptime_s'] / 60:.0f} min, "
+              f"{status['jobs']} jobs) on {socket_path()}")
+
+
+if __name__ == "__main__":
+    main()
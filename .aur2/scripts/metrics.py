@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Structured timing spans for the voice memo pipeline.
+
+Usage:
+    import metrics
+    metrics.start_run("record_memo", profile=args.profile)
+    with metrics.span("trim") as fields:
+        ...
+        fields["bytes"] = len(data)
+    metrics.finish_run()
+
+    python .aur2/scripts/metrics.py report [--days 7] [--script record_memo] [--json]
+
+A run collects one span per stage (record, trim, probe, split, upload,
+title, save, ...), each with wall time, bytes, audio seconds and the peak
+RSS of the process so far. finish_run() appends them as JSON lines to
+.aur2/metrics/spans-YYYY-MM.jsonl and, with profile, prints them. Spans
+outside a run (e.g. library use) are not recorded.
+
+The report command aggregates p50/p95 latency per stage across runs.
+
+Environment:
+    AUR2_METRICS - Optional. Set to 0 to stop writing spans to .aur2/metrics.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_REPORT_DAYS = 30  # Spans older than this are left out of the report
+
+_run_lock = threading.Lock()
+_run: dict | None = None
+
+
+def get_metrics_dir() -> Path:
+    """Get the .aur2/metrics directory path (not created)."""
+    # Find .aur2 the same way record_memo does: walk up from cwd
+    cwd = Path.cwd()
+    for parent in [cwd] + list(cwd.parents):
+        aur2_dir = parent / ".aur2"
+        if aur2_dir.exists():
+            return aur2_dir / "metrics"
+
+    # Fallback to cwd/.aur2/metrics
+    return cwd / ".aur2" / "metrics"
+
+
+def peak_rss_mb() -> tuple[float | None, float | None]:
+    """Peak resident memory so far of this process and of its finished children (ffmpeg, sox)."""
+    try:
+        import resource
+    except ImportError:
+        return None, None  # Not available on Windows
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return (round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+            round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1))
+
+
+def start_run(script: str, profile: bool = False, run_id: str | None = None) -> str:
+    """Start collecting spans for this process's run, replacing any previous run.
+
+    Args:
+        script: Name of the entry point (e.g. "record_memo")
+        profile: Print the spans when the run finishes
+        run_id: Id to reuse, e.g. the client's when the daemon runs its job
+
+    Returns:
+        The run id
+    """
+    global _run
+    with _run_lock:
+        _run = {"id": run_id or uuid.uuid4().hex[:12], "script": script, "profile": profile, "spans": [],
+                "merged": []}
+        return _run["id"]
+
+
+def run_context() -> dict:
+    """Parameters for handing the current run to another process (see memo_daemon.py).
+
+    Returns:
+        {"run_id": ..., "profile": ...}, empty if no run is being collected
+    """
+    with _run_lock:
+        return {"run_id": _run["id"], "profile": _run["profile"]} if _run else {}
+
+
+def run_spans() -> list[dict]:
+    """Spans of the current run so far, including ones merged from other processes."""
+    with _run_lock:
+        return list(_run["spans"]) + list(_run["merged"]) if _run else []
+
+
+def merge_spans(spans: list[dict]) -> None:
+    """Add spans another process recorded for this run (e.g. a daemon job) to run_spans.
+
+    They are not saved or printed again; the other process already did that.
+    """
+    with _run_lock:
+        if _run is not None:
+            _run["merged"].extend(spans)
+
+
+def record_span(stage: str, start: float, end: float, **fields) -> None:
+    """Add a finished span to the current run.
+
+    Args:
+        stage: Stage name
+        start: Start time on the perf_counter clock
+        end: End time on the perf_counter clock
+        **fields: Extra measurements, e.g. bytes, audio_s, chunk, cached
+    """
+    with _run_lock:
+        if _run is None:
+            return
+        rss, child_rss = peak_rss_mb()
+        _run["spans"].append({
+            "run": _run["id"],
+            "script": _run["script"],
+            "stage": stage,
+            "ts": round(time.time() - (time.perf_counter() - start), 3),
+            "wall_s": round(end - start, 4),
+            "peak_rss_mb": rss,
+            "child_peak_rss_mb": child_rss,
+            **fields,
+        })
+
+
+@contextmanager
+def span(stage: str, **fields):
+    """Record the enclosed block as a span.
+
+    Yields the span's fields so the block can add measurements it only
+    knows at the end (e.g. bytes). A block that raises is recorded with
+    error set.
+    """
+    start = time.perf_counter()
+    try:
+        yield fields
+    except BaseException as e:
+        fields["error"] = type(e).__name__
+        raise
+    finally:
+        record_span(stage, start, time.perf_counter(), **fields)
+
+
+def format_profile(spans: list[dict]) -> str:
+    """Table of a run's spans, in the order they started."""
+    lines = [f"{'stage':<12}  {'wall s':>8}  {'MB':>8}  {'audio s':>8}  {'peak RSS MB':>11}  notes"]
+    for item in sorted(spans, key=lambda item: item["ts"]):
+        size = f"{item['bytes'] / (1024 * 1024):.2f}" if item.get("bytes") is not None else "-"
+        audio = f"{item['audio_s']:.1f}" if item.get("audio_s") is not None else "-"
+        rss = f"{item['peak_rss_mb']:.0f}" if item.get("peak_rss_mb") is not None else "-"
+        notes = ", ".join(f"{key}={value}" for key, value in item.items()
+                          if key not in {"run", "script", "stage", "ts", "wall_s", "bytes", "audio_s",
+                                         "peak_rss_mb", "child_peak_rss_mb"})
+        lines.append(f"{item['stage']:<12}  {item['wall_s']:>8.3f}  {size:>8}  {audio:>8}  {rss:>11}  {notes}")
+    return "\n".join(lines)
+
+
+def finish_run() -> list[dict]:
+    """End the current run: append its spans to .aur2/metrics and print them if profiling.
+
+    Returns:
+        The run's spans
+    """
+    global _run
+    with _run_lock:
+        run, _run = _run, None
+    if run is None or not run["spans"]:
+        return []
+
+    if os.environ.get("AUR2_METRICS", "1") != "0":
+        try:
+            metrics_dir = get_metrics_dir()
+            metrics_dir.mkdir(parents=True, exist_ok=True)
+            lines = "".join(json.dumps(item) + "\n" for item in run["spans"])
+            # One append per run; O_APPEND keeps concurrent runs from interleaving mid-line
+            with open(metrics_dir / f"spans-{datetime.now():%Y-%m}.jsonl", "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError as e:
+            print(f"Warning: could not write metrics ({e})", file=sys.stderr)
+
+    if run["profile"]:
+        print(f"Profile ({run['script']}, run {run['id']}):", file=sys.stderr)
+        print(format_profile(run["spans"]), file=sys.stderr)
+    return run["spans"]
+
+
+def load_spans(days: float = DEFAULT_REPORT_DAYS, script: str | None = None) -> list[dict]:
+    """Read recorded spans from the last days, optionally for one script only."""
+    since = time.time() - days * 86400
+    spans = []
+    for path in sorted(get_metrics_dir().glob("spans-*.jsonl")):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn line from a killed process
+                if item.get("ts", 0) >= since and (script is None or item.get("script") == script):
+                    spans.append(item)
+    return spans
+
+
+def percentile(values: list[float], q: float) -> float:
+    """q-th percentile (0-100) of values, interpolating between ranks."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(spans: list[dict]) -> list[dict]:
+    """Per-stage latency percentiles and totals, slowest p95 first."""
+    by_stage: dict[str, list[dict]] = {}
+    for item in spans:
+        by_stage.setdefault(item["stage"], []).append(item)
+
+    rows = []
+    for stage, items in by_stage.items():
+        walls = [item["wall_s"] for item in items]
+        rows.append({
+            "stage": stage,
+            "count": len(items),
+            "errors": sum(1 for item in items if item.get("error")),
+            "p50_s": round(percentile(walls, 50), 3),
+            "p95_s": round(percentile(walls, 95), 3),
+            "total_mb": round(sum(item.get("bytes") or 0 for item in items) / (1024 * 1024), 2),
+            "audio_min": round(sum(item.get("audio_s") or 0 for item in items) / 60, 2),
+            "max_peak_rss_mb": max((item.get("peak_rss_mb") or 0 for item in items), default=0),
+        })
+    return sorted(rows, key=lambda row: row["p95_s"], reverse=True)
+
+
+def main():
+    """CLI interface for the latency report."""
+    parser = argparse.ArgumentParser(
+        description="Report per-stage latency of the voice memo pipeline across runs",
+        epilog="Examples:\n"
+               "  python .aur2/scripts/metrics.py report\n"
+               "  python .aur2/scripts/metrics.py report --days 7 --script record_memo\n"
+               "  python .aur2/scripts/record_memo.py --profile   # record spans and print this run's\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=["report"])
+    parser.add_argument(
+        "--days",
+        type=float,
+        default=DEFAULT_REPORT_DAYS,
+        help=f"Only include runs from the last N days (default: {DEFAULT_REPORT_DAYS})"
+    )
+    parser.add_argument(
+        "--script",
+        type=str,
+        help="Only include runs of one entry point (e.g. record_memo, transcribe, daemon:memo)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    spans = load_spans(args.days, args.script)
+    if not spans:
+        print("  No metrics recorded yet")
+        return
+
+    rows = summarize(spans)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    runs = len({item["run"] for item in spans})
+    print(f"{len(spans)} spans from {runs} runs in the last {args.days:g} days")
+    print(f"{'stage':<14}  {'count':>6}  {'errors':>6}  {'p50 s':>8}  {'p95 s':>8}  {'MB':>8}  {'audio min':>9}  "
+          f"{'peak RSS MB':>11}")
+    for row in rows:
+        print(f"{row['stage']:<14}  {row['count']:>6}  {row['errors']:>6}  {row['p50_s']:>8.3f}  "
+              f"{row['p95_s']:>8.3f}  {row['total_mb']:>8.2f}  {row['audio_min']:>9.1f}  "
+              f"{row['max_peak_rss_mb']:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""Transcribe and title every pending audio memo in one run.
+
+Usage:
+    python .aur2/scripts/process_backlog.py [--jobs N] [--files N] [--dry-run]
+    python .aur2/scripts/process_backlog.py "~/Downloads/phone-memos/*.m4a" [--json summary.json]
+
+With no arguments, picks up what record_memo.py left behind or what was
+dropped into the visions directories:
+    - failed/<memo>/audio.*              memos whose transcription failed
+    - queue/<memo>/audio.*               memos without a transcript.txt
+    - queue/*.m4a, failed/*.wav, ...     loose audio files
+Glob arguments add audio files from anywhere instead.
+
+Several files are processed at once, and all of their chunks share one
+bounded upload pool, so a backlog of short memos keeps the pool as busy as
+one long recording. Finished transcripts are titled several to a
+request. Each success is saved to queue/<title>/ in the same layout as
+record_memo.py; failures stay where they are (with a progress manifest, so
+the next run only redoes missing chunks).
+
+Progress goes to stderr; a JSON summary (throughput, failures, audio
+minutes processed) goes to stdout, or to --json.
+
+Requirements:
+    pip install -r .aur2/scripts/requirements.txt
+
+Environment:
+    OPENAI_API_KEY - Required. Your OpenAI API key.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+DEFAULT_FILE_JOBS = 3  # Files preprocessed/titled at once; their chunks share the upload pool
+
+
+def find_pending(visions_dir: Path, patterns: list[str] | None = None) -> list[Path]:
+    """List audio files that still need a transcript.
+
+    Args:
+        visions_dir: Base visions directory (.aur2/visions)
+        patterns: Glob patterns to use instead of scanning queue/ and failed/
+
+    Returns:
+        Audio file paths, oldest first
+    """
+    from transcribe import SUPPORTED_FORMATS
+    from record_memo import find_memo_audio
+
+    def is_audio(path: Path) -> bool:
+        return path.is_file() and path.suffix.lower().lstrip(".") in SUPPORTED_FORMATS
+
+    pending: list[Path] = []
+    if patterns:
+        for pattern in patterns:
+            pending.extend(Path(p) for p in glob.glob(os.path.expanduser(pattern), recursive=True))
+        pending = [path for path in pending if is_audio(path)]
+    else:
+        for folder in ("failed", "queue"):
+            for entry in (visions_dir / folder).iterdir() if (visions_dir / folder).exists() else []:
+                if is_audio(entry):
+                    pending.append(entry)
+                elif entry.is_dir() and not (entry / "transcript.txt").exists():
+                    audio_path = find_memo_audio(entry)
+                    if audio_path and is_audio(audio_path):
+                        pending.append(audio_path)
+
+    unique = {path.resolve(): path for path in pending}
+    return sorted(unique.values(), key=lambda path: path.stat().st_mtime)
+
+
+def transcribe_item(audio_path: Path, executor: ThreadPoolExecutor, **options) -> dict:
+    """Transcribe one memo, using the shared upload pool.
+
+    Returns:
+        Result record: path, success (False until saved), audio_minutes,
+        seconds, and either transcript or error
+    """
+    from transcribe import transcribe_file, get_audio_duration_ms
+
+    start = time.perf_counter()
+    result = {"path": str(audio_path), "success": False, "audio_minutes": 0.0}
+    try:
+        result["audio_minutes"] = round(get_audio_duration_ms(str(audio_path)) / 60000, 2)
+        # resume: a memo that failed partway only redoes its missing chunks
+        transcript = transcribe_file(str(audio_path), executor=executor, resume=True, **options)
+        if not transcript:
+            raise ValueError("Empty transcript")
+        result["transcript"] = transcript
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["seconds"] = round(time.perf_counter() - start, 2)
+    return result
+
+
+def save_items(results: list[dict], visions_dir: Path) -> None:
+    """Title a batch of transcribed memos in one request and save each to queue/.
+
+    Updates each result in place with success and final_dir (or error);
+    the transcript is dropped from the record once saved.
+    """
+    from generate_title import generate_titles
+    from record_memo import save_memo
+
+    try:
+        print(f"Generating {len(results)} titles...", file=sys.stderr)
+        titles = generate_titles([result["transcript"] for result in results])
+    except Exception as e:
+        print(f"Title generation error: {e}", file=sys.stderr)
+        titles = [None] * len(results)  # save_memo generates a fallback one by one
+
+    for result, title in zip(results, titles):
+        audio_path = Path(result["path"])
+        memo_dir = audio_path.parent
+        try:
+            final_dir, _ = save_memo(audio_path, result.pop("transcript"), visions_dir, title=title)
+            result.update(success=True, final_dir=str(final_dir))
+
+            # Remove the memo directory the audio came from if nothing is left in it
+            if memo_dir.resolve().parent in {(visions_dir / "queue").resolve(), (visions_dir / "failed").resolve()}:
+                if not any(memo_dir.iterdir()):
+                    memo_dir.rmdir()
+        except Exception as e:
+            result["error"] = str(e)
+
+
+def process_backlog(items: list[Path], visions_dir: Path, jobs: int, file_jobs: int = DEFAULT_FILE_JOBS,
+                    **options) -> dict:
+    """Process pending memos through one upload pool shared across files.
+
+    Finished transcripts are titled TITLE_BATCH_SIZE at a time, one request
+    per batch, then saved.
+
+    Args:
+        items: Audio files to process
+        visions_dir: Base visions directory (.aur2/visions)
+        jobs: Upload pool size, shared by every file's chunks
+        file_jobs: Files processed at once
+        **options: Passed to transcribe.transcribe_file (trim, transcode, use_cache, ...)
+
+    Returns:
+        Summary with counts, audio minutes, throughput, and per-item results
+    """
+    from generate_title import TITLE_BATCH_SIZE
+
+    start = time.perf_counter()
+    results = []
+    untitled: list[dict] = []
+
+    def report(result: dict) -> None:
+        results.append(result)
+        status = f"-> {Path(result['final_dir']).name}" if result["success"] else f"FAILED: {result['error']}"
+        print(f"[{len(results)}/{len(items)}] {result['path']} ({result['audio_minutes']:.1f} min, "
+              f"{result['seconds']:.0f}s) {status}", file=sys.stderr)
+
+    def flush() -> None:
+        if untitled:
+            save_items(untitled, visions_dir)
+            for result in untitled:
+                report(result)
+            untitled.clear()
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as upload_pool, \
+            ThreadPoolExecutor(max_workers=max(1, file_jobs)) as file_pool:
+        futures = [file_pool.submit(transcribe_item, path, upload_pool, **options) for path in items]
+        for future in as_completed(futures):
+            result = future.result()
+            if "transcript" not in result:
+                report(result)
+                continue
+            untitled.append(result)
+            # Title while later files are still transcribing, once a full batch is ready
+            if len(untitled) >= TITLE_BATCH_SIZE:
+                flush()
+        flush()
+
+    elapsed_s = time.perf_counter() - start
+    audio_minutes = sum(result["audio_minutes"] for result in results if result["success"])
+    return {
+        "items": len(results),
+        "succeeded": sum(1 for result in results if result["success"]),
+        "failed": sum(1 for result in results if not result["success"]),
+        "audio_minutes": round(audio_minutes, 2),
+        "elapsed_s": round(elapsed_s, 2),
+        "audio_minutes_per_minute": round(audio_minutes / (elapsed_s / 60), 2) if elapsed_s > 0 else 0.0,
+        "failures": [{"path": result["path"], "error": result["error"]} for result in results
+                     if not result["success"]],
+        "results": results,
+    }
+
+
+def main():
+    """CLI interface for bulk transcription."""
+    parser = argparse.ArgumentParser(
+        description="Transcribe and title pending audio memos in bulk",
+        epilog="Examples:\n"
+               "  python .aur2/scripts/process_backlog.py\n"
+               "  python .aur2/scripts/process_backlog.py --dry-run\n"
+               "  python .aur2/scripts/process_backlog.py '~/Downloads/memos/*.m4a' --jobs 8\n"
+               "  python .aur2/scripts/process_backlog.py --json backlog-summary.json\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        help="Glob patterns of audio files to import (default: scan visions queue/ and failed/)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Chunk uploads in flight across all files (default: 4)"
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        default=DEFAULT_FILE_JOBS,
+        help=f"Files processed at once (default: {DEFAULT_FILE_JOBS})"
+    )
+    parser.add_argument(
+        "--no-trim",
+        action="store_true",
+        help="Upload the audio as-is instead of trimming silence and collapsing long pauses"
+    )
+    parser.add_argument(
+        "--no-transcode",
+        action="store_true",
+        help="Upload the original encoding instead of low-bitrate speech audio"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Upload every chunk even if an identical one was transcribed before"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the pending files without transcribing them"
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        metavar="PATH",
+        help="Write the JSON summary to a file instead of stdout"
+    )
+    args = parser.parse_args()
+
+    # Load environment variables
+    try:
+        from dotenv import load_dotenv
+        aur2_env = Path(".aur2/.env")
+        if aur2_env.exists():
+            load_dotenv(aur2_env)
+        else:
+            load_dotenv()
+    except ImportError:
+        pass
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from transcribe import DEFAULT_JOBS
+    from record_memo import get_visions_dir, ensure_directories
+
+    visions_dir = get_visions_dir()
+    ensure_directories(visions_dir)
+
+    items = find_pending(visions_dir, args.patterns)
+    if not items:
+        print("Nothing to process", file=sys.stderr)
+        return
+    if args.dry_run:
+        for path in items:
+            print(path)
+        return
+
+    if not os.environ.get("OPENAI_API_KEY"):
+        print("Error: OPENAI_API_KEY environment variable not set", file=sys.stderr)
+        print("Set it in .aur2/.env or export it: export OPENAI_API_KEY=your-key", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Processing {len(items)} memos...", file=sys.stderr)
+    summary = process_backlog(
+        items, visions_dir,
+        jobs=args.jobs or DEFAULT_JOBS,
+        file_jobs=args.files,
+        trim=not args.no_trim,
+        transcode=not args.no_transcode,
+        use_cache=not args.no_cache,
+    )
+    print(f"Done: {summary['succeeded']} saved, {summary['failed']} failed, "
+          f"{summary['audio_minutes']:.1f} min of audio in {summary['elapsed_s']:.0f}s", file=sys.stderr)
+
+    output = json.dumps(summary, indent=2)
+    if args.json:
+        Path(args.json).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    sys.exit(0 if not summary["failed"] else 2)
+
+
+if __name__ == "__main__":
+    main()
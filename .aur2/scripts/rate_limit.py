@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Cross-process API rate limiter shared by every worktree of the repo.
+
+Usage:
+    from rate_limit import rate_limited
+    with rate_limited():
+        client.audio.transcriptions.create(...)
+
+    python .aur2/scripts/rate_limit.py status [--json]
+    python .aur2/scripts/rate_limit.py reset
+
+All agents in a fleet (see scripts/setup-fleet.sh) use the same API key, so
+their requests count against one quota. State lives in a SQLite database in
+the git common dir, which every worktree shares. Each request needs a token
+from a requests-per-minute bucket and a free concurrency slot.
+
+The concurrency limit adapts: a 429 halves it and pauses everyone for the
+Retry-After interval, and each success grows it back by a fraction of a slot,
+up to the configured ceiling.
+
+Environment:
+    AUR2_RATE_LIMIT_RPM - Optional. Requests per minute across the fleet (default: 50).
+    AUR2_MAX_CONCURRENCY - Optional. Concurrent requests across the fleet (default: 8).
+    AUR2_RATE_LIMIT - Optional. Set to 0 to disable the limiter.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import sqlite3
+import argparse
+import functools
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_BUCKET = "openai"  # One API key, one budget
+DEFAULT_RPM = 50
+DEFAULT_MAX_CONCURRENCY = 8
+MIN_CONCURRENCY = 1
+DEFAULT_COOLDOWN_S = 5.0  # Pause after a 429 without a Retry-After header
+MAX_COOLDOWN_S = 60.0
+LEASE_TTL_S = 15 * 60  # A slot held this long is assumed leaked (e.g. a killed process)
+MAX_POLL_S = 1.0  # Longest sleep between checks for a free slot
+DB_NAME = "aur2-rate-limit.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    concurrency REAL NOT NULL,
+    cooldown_until REAL NOT NULL DEFAULT 0,
+    requests INTEGER NOT NULL DEFAULT 0,
+    throttled INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS leases (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    acquired REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recent (
+    name TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+"""
+
+
+def limits() -> tuple[float, float]:
+    """Configured (requests per minute, concurrency ceiling)."""
+    return (float(os.environ.get("AUR2_RATE_LIMIT_RPM", DEFAULT_RPM)),
+            float(os.environ.get("AUR2_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)))
+
+
+@functools.lru_cache(maxsize=1)
+def db_path() -> Path:
+    """SQLite path in the git common dir (shared by all worktrees), or .aur2/cache outside git."""
+    try:
+        common_dir = subprocess.run(["git", "rev-parse", "--git-common-dir"], capture_output=True, text=True,
+                                    check=True).stdout.strip()
+        return Path(common_dir).resolve() / DB_NAME
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        from cache import get_cache_root
+        get_cache_root().mkdir(parents=True, exist_ok=True)
+        return get_cache_root() / DB_NAME
+
+
+@contextmanager
+def _connect():
+    """Short-lived connection per call (sqlite3 connections can't be shared across threads)."""
+    conn = sqlite3.connect(str(db_path()), timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        yield conn
+    finally:
+        conn.close()  # An uncommitted transaction is rolled back
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _load_bucket(conn: sqlite3.Connection, name: str, now: float) -> dict:
+    """Read a bucket inside a write transaction, refilled up to now and with leaked leases dropped."""
+    rpm, ceiling = limits()
+    row = conn.execute("SELECT tokens, updated, concurrency, cooldown_until FROM buckets WHERE name = ?",
+                       (name,)).fetchone()
+    if row is None:
+        conn.execute("INSERT INTO buckets (name, tokens, updated, concurrency) VALUES (?, ?, ?, ?)",
+                     (name, rpm, now, ceiling))
+        row = (rpm, now, ceiling, 0.0)
+    tokens, updated, concurrency, cooldown_until = row
+
+    for lease_id, pid, acquired in conn.execute("SELECT id, pid, acquired FROM leases WHERE name = ?",
+                                                (name,)).fetchall():
+        if now - acquired > LEASE_TTL_S or not _pid_alive(pid):
+            conn.execute("DELETE FROM leases WHERE id = ?", (lease_id,))
+
+    return {
+        "tokens": min(rpm, tokens + (now - updated) * rpm / 60),
+        "concurrency": min(ceiling, concurrency),
+        "cooldown_until": cooldown_until,
+        "in_flight": conn.execute("SELECT COUNT(*) FROM leases WHERE name = ?", (name,)).fetchone()[0],
+    }
+
+
+def acquire(name: str = DEFAULT_BUCKET) -> str:
+    """Block until a request may start, then take a token and a concurrency slot.
+
+    Returns:
+        Lease id to pass to release()
+    """
+    rpm, _ = limits()
+    lease_id = uuid.uuid4().hex
+    announced = False
+    while True:
+        now = time.time()
+        with _connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            bucket = _load_bucket(conn, name, now)
+            if now >= bucket["cooldown_until"] and bucket["tokens"] >= 1 \
+                    and bucket["in_flight"] < max(MIN_CONCURRENCY, int(bucket["concurrency"])):
+                conn.execute("UPDATE buckets SET tokens = ?, updated = ?, requests = requests + 1 WHERE name = ?",
+                             (bucket["tokens"] - 1, now, name))
+                conn.execute("INSERT INTO leases (id, name, pid, acquired) VALUES (?, ?, ?, ?)",
+                             (lease_id, name, os.getpid(), now))
+                conn.execute("INSERT INTO recent (name, ts) VALUES (?, ?)", (name, now))
+                conn.execute("DELETE FROM recent WHERE ts < ?", (now - 60,))
+                conn.execute("COMMIT")
+                return lease_id
+            conn.execute("UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?", (bucket["tokens"], now, name))
+            conn.execute("COMMIT")
+
+        if now < bucket["cooldown_until"]:
+            wait_s = bucket["cooldown_until"] - now
+        elif bucket["tokens"] < 1:
+            wait_s = (1 - bucket["tokens"]) * 60 / rpm
+        else:
+            wait_s = MAX_POLL_S / 4  # Waiting for another request to finish
+        if not announced and wait_s >= 1:
+            print(f"Waiting for the shared API rate limit ({bucket['in_flight']} requests in flight)...",
+                  file=sys.stderr)
+            announced = True
+        # Jitter keeps waiting processes from waking in lockstep
+        time.sleep(min(wait_s, MAX_POLL_S) * (0.5 + random.random() / 2))
+
+
+def release(lease_id: str, name: str = DEFAULT_BUCKET, throttled: bool = False,
+            retry_after_s: float | None = None) -> None:
+    """Free a concurrency slot and adapt the limit to how the request went.
+
+    Args:
+        lease_id: Lease returned by acquire()
+        name: Bucket the lease belongs to
+        throttled: The API answered 429
+        retry_after_s: Server-requested pause (Retry-After), if any
+    """
+    _, ceiling = limits()
+    now = time.time()
+    with _connect() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM leases WHERE id = ?", (lease_id,))
+        row = conn.execute("SELECT concurrency, cooldown_until FROM buckets WHERE name = ?", (name,)).fetchone()
+        if row is not None:
+            concurrency, cooldown_until = row
+            if throttled:
+                # Multiplicative decrease, and everyone holds off until the server is ready again
+                concurrency = max(MIN_CONCURRENCY, concurrency / 2)
+                pause_s = min(retry_after_s if retry_after_s is not None else DEFAULT_COOLDOWN_S, MAX_COOLDOWN_S)
+                cooldown_until = max(cooldown_until, now + pause_s)
+                conn.execute("UPDATE buckets SET throttled = throttled + 1 WHERE name = ?", (name,))
+            else:
+                # Additive increase: about one slot per `concurrency` successful requests
+                concurrency = min(ceiling, concurrency + 1 / max(concurrency, 1))
+            conn.execute("UPDATE buckets SET concurrency = ?, cooldown_until = ? WHERE name = ?",
+                         (concurrency, cooldown_until, name))
+        conn.execute("COMMIT")
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Whether an API error is a 429."""
+    return getattr(error, "status_code", None) == 429
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed request is worth retrying (network errors, 408/409/429/5xx)."""
+    status = getattr(error, "status_code", None)
+    return status is None or status in (408, 409, 429) or status >= 500
+
+
+def get_retry_after_s(error: Exception) -> float | None:
+    """Seconds the server asked us to wait (Retry-After header), if it said."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None  # HTTP-date form; fall back to the default cooldown
+
+
+def enabled() -> bool:
+    """Whether the limiter is on (AUR2_RATE_LIMIT=0 turns it off)."""
+    return os.environ.get("AUR2_RATE_LIMIT", "1") != "0"
+
+
+@contextmanager
+def rate_limited(name: str = DEFAULT_BUCKET):
+    """Hold a fleet-wide token and concurrency slot for the duration of one API request."""
+    if not enabled():
+        yield
+        return
+
+    lease_id = acquire(name)
+    try:
+        yield
+    except Exception as e:
+        release(lease_id, name, throttled=is_rate_limited(e), retry_after_s=get_retry_after_s(e))
+        raise
+    except BaseException:
+        release(lease_id, name)
+        raise
+    else:
+        release(lease_id, name)
+
+
+def usage(name: str = DEFAULT_BUCKET) -> dict:
+    """Current limiter state for display."""
+    rpm, ceiling = limits()
+    now = time.time()
+    with _connect() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        bucket = _load_bucket(conn, name, now)
+        totals = conn.execute("SELECT requests, throttled FROM buckets WHERE name = ?", (name,)).fetchone()
+        last_minute = conn.execute("SELECT COUNT(*) FROM recent WHERE name = ? AND ts >= ?",
+                                   (name, now - 60)).fetchone()[0]
+        conn.execute("COMMIT")
+    return {
+        "bucket": name,
+        "in_flight": bucket["in_flight"],
+        "concurrency_limit": round(bucket["concurrency"], 2),
+        "concurrency_ceiling": ceiling,
+        "requests_last_minute": last_minute,
+        "rpm_limit": rpm,
+        "tokens": round(bucket["tokens"], 1),
+        "cooldown_s": round(max(0.0, bucket["cooldown_until"] - now), 1),
+        "requests_total": totals[0],
+        "throttled_total": totals[1],
+    }
+
+
+def main():
+    """CLI interface for inspecting and resetting the shared limiter."""
+    parser = argparse.ArgumentParser(description="Show or reset the fleet-wide API rate limiter")
+    parser.add_argument("command", choices=["status", "reset"])
+    parser.add_argument("--json", action="store_true", help="Print status as JSON")
+    args = parser.parse_args()
+
+    if args.command == "reset":
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path()}{suffix}").unlink(missing_ok=True)
+        print(f"Reset {db_path()}", file=sys.stderr)
+        return
+
+    if not db_path().exists():
+        print("  No API usage recorded yet")
+        return
+
+    status = usage()
+    if args.json:
+        print(json.dumps(status, indent=2))
+        return
+    print(f"  In flight: {status['in_flight']} / {status['concurrency_limit']:g} "
+          f"(ceiling {status['concurrency_ceiling']:g})")
+    print(f"  Requests last minute: {status['requests_last_minute']} / {status['rpm_limit']:g}")
+    print(f"  Total requests: {status['requests_total']}, rate limited (429): {status['throttled_total']}")
+    if status["cooldown_s"]:
+        print(f"  Cooling down after a 429: {status['cooldown_s']:g}s left")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,13 @@
 """Record voice memos with automatic transcription and title generation.
 
 Usage:
-    python .aur2/scripts/record_memo.py [--max-duration SECONDS]
+    python .aur2/scripts/record_memo.py [--max-duration SECONDS] [--jobs N] [--live] [--profile]
+    python .aur2/scripts/record_memo.py --resume .aur2/visions/failed/<memo>
 
 Records audio via sox, transcribes via OpenAI Whisper, generates a title,
-and saves to .aur2/visions/queue/<title>/.
+and saves to .aur2/visions/queue/<title>/. With --live, the recording is
+transcribed in segments while it is still in progress. If the warm daemon
+(memo_daemon.py) is running, transcription and titling run there.
 
 Requirements:
     - sox installed (brew install sox / apt install sox)
@@ -22,18 +25,32 @@ Exit Codes:
 
 import os
 import sys
+import atexit
 import signal
 import shutil
 import subprocess
 import tempfile
 import argparse
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO, Callable
 
 
 # Default maximum recording duration (10 minutes)
 DEFAULT_MAX_DURATION = 600
 
+SAMPLE_RATE = 16000  # Recording sample rate (good for speech)
+
+# Live mode: segments are cut at the first pause after LIVE_SEGMENT_MS, or forced at LIVE_MAX_SEGMENT_MS
+LIVE_SEGMENT_MS = 60 * 1000
+LIVE_MAX_SEGMENT_MS = 90 * 1000
+LIVE_PAUSE_MS = 300  # Quiet run long enough to cut a segment in
+
+# Transcript opening needed before the title is generated alongside the rest of the transcription
+TITLE_CONTEXT_CHARS = 2000
+
 
 def check_sox_installed() -> bool:
     """Check if sox is installed and available."""
@@ -82,7 +99,7 @@ def record_audio(output_path: Path, max_duration: int = DEFAULT_MAX_DURATION) ->
         "sox",
         "-d",  # Use default audio device
         "-c", "1",  # Mono
-        "-r", "16000",  # 16kHz sample rate
+        "-r", str(SAMPLE_RATE),  # 16kHz sample rate
         str(output_path),
         "trim", "0", str(max_duration)
     ]
@@ -121,11 +138,179 @@ def record_audio(output_path: Path, max_duration: int = DEFAULT_MAX_DURATION) ->
         return False
 
 
-def transcribe_audio(audio_path: Path) -> str | None:
+def read_live_segments(stream: BinaryIO, wav_file, on_segment: Callable[[bytes], None],
+                       segment_ms: int = LIVE_SEGMENT_MS, max_segment_ms: int = LIVE_MAX_SEGMENT_MS,
+                       pause_ms: int = LIVE_PAUSE_MS) -> None:
+    """Split raw 16-bit mono PCM into segments that end in pauses.
+
+    Every frame is also appended to wav_file, so the full recording is kept
+    exactly as a normal capture would keep it. Returns when the stream ends,
+    after handing over the final partial segment.
+
+    Args:
+        stream: Raw s16le mono PCM at SAMPLE_RATE (sox's stdout)
+        wav_file: Open wave.Wave_write receiving the whole recording
+        on_segment: Called with the PCM bytes of each finished segment
+        segment_ms: Length after which the next pause ends the segment
+        max_segment_ms: Length at which a segment is cut even without a pause
+        pause_ms: Quiet run that counts as a pause
+    """
+    import numpy as np
+
+    from silence import FRAME_MS, SILENCE_THRESHOLD_DBFS
+
+    frame_bytes = SAMPLE_RATE * FRAME_MS // 1000 * 2
+    threshold = 10 ** (SILENCE_THRESHOLD_DBFS / 20) * 32768
+    bytes_per_ms = SAMPLE_RATE * 2 // 1000
+
+    segment = bytearray()
+    quiet_ms = 0
+    while frame := stream.read(frame_bytes):
+        wav_file.writeframesraw(frame)
+        segment += frame
+
+        samples = np.frombuffer(frame, dtype="<i2", count=len(frame) // 2).astype(np.float32)
+        rms = float(np.sqrt(np.mean(np.square(samples)))) if len(samples) else 0.0
+        quiet_ms = quiet_ms + FRAME_MS if rms < threshold else 0
+
+        length_ms = len(segment) // bytes_per_ms
+        if (length_ms >= segment_ms and quiet_ms >= pause_ms) or length_ms >= max_segment_ms:
+            on_segment(bytes(segment))
+            segment.clear()
+            quiet_ms = 0
+
+    # Skip a trailing segment that is nothing but the pause before Ctrl+C
+    if segment and quiet_ms < len(segment) // bytes_per_ms:
+        on_segment(bytes(segment))
+
+
+def record_audio_live(output_path: Path, max_duration: int = DEFAULT_MAX_DURATION, jobs: int | None = None,
+                      use_cache: bool = True,
+                      on_segment_done: Callable[[int, str], None] | None = None) -> tuple[bool, str | None]:
+    """Record audio with sox and transcribe it in segments while recording.
+
+    sox streams raw PCM to a reader thread that saves the recording and cuts
+    a segment at a pause roughly every minute. Each segment is transcribed in
+    the background, so when recording stops only the last one is left.
+
+    Args:
+        output_path: Path to save the recorded audio
+        max_duration: Maximum recording duration in seconds
+        jobs: Number of segments to transcribe concurrently (default: transcribe.DEFAULT_JOBS)
+        use_cache: Reuse and store segment transcripts in .aur2/cache
+        on_segment_done: Called with (index, text) from a worker thread as
+            each segment is transcribed
+
+    Returns:
+        Tuple of (recorded, transcript) where transcript is None if any
+        segment failed; the saved recording can then be transcribed normally
+    """
+    print("Recording with live transcription... Press Ctrl+C to stop.", file=sys.stderr)
+    print(f"(Max duration: {max_duration} seconds)", file=sys.stderr)
+
+    # Same capture as record_audio, but raw 16-bit PCM on stdout instead of a file
+    cmd = [
+        "sox",
+        "-q",  # No progress display (stderr is only read at the end)
+        "-d",
+        "-c", "1",
+        "-r", str(SAMPLE_RATE),
+        "-b", "16", "-e", "signed-integer",
+        "-t", "raw", "-",
+        "trim", "0", str(max_duration)
+    ]
+
+    script_dir = Path(__file__).parent
+    sys.path.insert(0, str(script_dir))
+
+    executor = None
+    try:
+        import wave
+
+        from transcribe import transcribe_cached, wav_header_bytes, read_wav_header, WAVE_FORMAT_PCM, DEFAULT_JOBS
+
+        executor = ThreadPoolExecutor(max_workers=jobs or DEFAULT_JOBS)
+        futures = []
+
+        def submit(pcm: bytes) -> None:
+            n = len(futures) + 1
+            chunk = (f"segment-{n:03d}.wav", wav_header_bytes(WAVE_FORMAT_PCM, 1, SAMPLE_RATE, 2, len(pcm)) + pcm)
+            future = executor.submit(transcribe_cached, chunk, use_cache=use_cache)
+            future.add_done_callback(lambda f: report(n, f))
+            futures.append(future)
+
+        def report(n: int, future) -> None:
+            if not future.cancelled():
+                status = "failed" if future.exception() else "transcribed"
+                print(f"Segment {n} {status}", file=sys.stderr)
+                if on_segment_done and not future.exception():
+                    on_segment_done(n - 1, future.result()[0])
+
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        with wave.open(str(output_path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(SAMPLE_RATE)
+
+            reader = threading.Thread(target=read_live_segments, args=(process.stdout, wav_file, submit))
+            reader.start()
+            try:
+                process.wait()
+            except KeyboardInterrupt:
+                # User pressed Ctrl+C - send SIGINT to sox to stop recording
+                process.send_signal(signal.SIGINT)
+                process.wait()
+                print("\nRecording stopped.", file=sys.stderr)
+            # Drains what sox flushed on exit and submits the final segment
+            reader.join()
+        process.stdout.close()
+
+        header = read_wav_header(str(output_path))
+        if not header or header["data_size"] == 0:
+            print("Error: No audio recorded", file=sys.stderr)
+            stderr = process.stderr.read()
+            if stderr:
+                print(f"Sox error: {stderr.decode()}", file=sys.stderr)
+            return False, None
+
+        if not all(future.done() for future in futures):
+            print("Finishing live transcription...", file=sys.stderr)
+        texts = []
+        for future in futures:
+            try:
+                texts.append(future.result()[0])
+            except Exception as e:
+                print(f"Live transcription error: {e}", file=sys.stderr)
+                return True, None
+        return True, " ".join(texts) or None
+
+    except FileNotFoundError:
+        print("Error: sox not found. Install it with: brew install sox (macOS) or apt install sox (Linux)", file=sys.stderr)
+        return False, None
+    finally:
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if str(script_dir) in sys.path:
+            sys.path.remove(str(script_dir))
+
+
+def transcribe_audio(audio_path: Path, jobs: int | None = None, trim: bool = True,
+                     transcode: bool = True, use_cache: bool = True, resume: bool = False,
+                     on_chunk_done: Callable[[int, str], None] | None = None) -> str | None:
     """Transcribe audio file using OpenAI Whisper.
 
+    Preprocessing works on a temp copy; the audio saved with the memo is the
+    original recording. Long recordings keep a progress manifest next to the
+    audio until every chunk is transcribed, so a failed memo can be resumed.
+
     Args:
         audio_path: Path to the audio file
+        jobs: Number of chunks to transcribe concurrently (default: transcribe.DEFAULT_JOBS)
+        trim: Trim edge silence and collapse long pauses before upload
+        transcode: Re-encode the WAV to low-bitrate speech audio before upload
+        use_cache: Reuse transcripts of chunks already transcribed in an earlier run
+        resume: Only transcribe the chunks missing from the audio's progress manifest
+        on_chunk_done: Called with (index, text) as each chunk is transcribed
 
     Returns:
         Transcription text, or None if transcription failed
@@ -135,18 +320,11 @@ def transcribe_audio(audio_path: Path) -> str | None:
     sys.path.insert(0, str(script_dir))
 
     try:
-        from transcribe import transcribe_audio as _transcribe, split_audio_into_chunks, transcribe_chunks, get_audio_duration_ms, CHUNK_THRESHOLD_MS
+        from transcribe import transcribe_file, DEFAULT_JOBS
 
         print("Transcribing...", file=sys.stderr)
-
-        duration_ms = get_audio_duration_ms(str(audio_path))
-        if duration_ms > CHUNK_THRESHOLD_MS:
-            chunk_paths = split_audio_into_chunks(str(audio_path))
-            transcript = transcribe_chunks(chunk_paths, str(audio_path))
-        else:
-            transcript = _transcribe(str(audio_path))
-
-        return transcript
+        return transcribe_file(str(audio_path), jobs=jobs or DEFAULT_JOBS, trim=trim, transcode=transcode,
+                               use_cache=use_cache, resume=resume, on_chunk_done=on_chunk_done)
 
     except Exception as e:
         print(f"Transcription error: {e}", file=sys.stderr)
@@ -185,33 +363,149 @@ def generate_title(transcript: str) -> str:
             sys.path.remove(str(script_dir))
 
 
+def title_alongside(executor: ThreadPoolExecutor) -> tuple[Callable[[int, str], None], Callable[[str], Future]]:
+    """Start title generation as soon as the transcript's opening is known.
+
+    The title only needs the start of the memo, so there is no reason to
+    wait for the last chunk. Feed chunk texts to the returned on_chunk_done
+    (any order, any thread); once the chunks from the start add up to
+    TITLE_CONTEXT_CHARS, the title is generated on executor while the rest
+    is still being transcribed.
+
+    Returns:
+        Tuple of (on_chunk_done, start_title) where start_title(transcript)
+        returns the title future, starting it from the full transcript if the
+        opening never got long enough
+    """
+    lock = threading.Lock()
+    parts: dict[int, str] = {}
+    started: list[Future] = []
+
+    def submit(text: str) -> None:
+        started.append(executor.submit(timed, "title", generate_title, text))
+
+    def on_chunk_done(i: int, text: str) -> None:
+        with lock:
+            parts[i] = text
+            if started:
+                return
+            opening = []
+            while len(opening) in parts:
+                opening.append(parts[len(opening)])
+            opening = " ".join(opening)
+            if len(opening) >= TITLE_CONTEXT_CHARS:
+                submit(opening)
+
+    def start_title(transcript: str) -> Future:
+        with lock:
+            if not started:
+                submit(transcript)
+            return started[0]
+
+    return on_chunk_done, start_title
+
+
+TIMING_STAGES = ("record", "transcribe", "title", "save")  # Top-level spans summarized by --timings
+
+
+def timed(stage: str, func: Callable, *args, **kwargs):
+    """Call func, recording it as a metrics span of the current run."""
+    script_dir = Path(__file__).parent
+    sys.path.insert(0, str(script_dir))
+    try:
+        import metrics
+    finally:
+        if str(script_dir) in sys.path:
+            sys.path.remove(str(script_dir))
+
+    with metrics.span(stage):
+        return func(*args, **kwargs)
+
+
+def format_timings(spans: list[dict]) -> str:
+    """One-line summary of a run's top-level spans and of the wait after recording stopped.
+
+    Args:
+        spans: The run's spans (see metrics.run_spans); only TIMING_STAGES are summarized
+
+    Returns:
+        The summary line
+    """
+    # stage -> (start, end) in epoch seconds, so spans from the daemon line up with local ones
+    timings = {item["stage"]: (item["ts"], item["ts"] + item["wall_s"])
+               for item in sorted(spans, key=lambda item: item["ts"]) if item["stage"] in TIMING_STAGES}
+    stages = [f"{stage} {end - start:.1f}s"
+              for stage, (start, end) in sorted(timings.items(), key=lambda item: item[1][0])]
+    line = "Timings: " + ", ".join(stages)
+    if "record" in timings and "save" in timings:
+        line += f" | stop to saved {timings['save'][1] - timings['record'][1]:.1f}s"
+    if "title" in timings and "transcribe" in timings:
+        hidden = min(timings["title"][1], timings["transcribe"][1]) - timings["title"][0]
+        line += f" | title overlapped {max(hidden, 0.0):.1f}s"
+    return line
+
+
 def get_fallback_title() -> str:
     """Generate a fallback timestamp-based title."""
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     return f"memo-{timestamp}"
 
 
-def save_memo(audio_path: Path, transcript: str | None, visions_dir: Path) -> tuple[Path, bool]:
+def move_progress_manifest(audio_path: Path, target_audio: Path) -> None:
+    """Move a failed run's progress manifest along with its audio, if there is one."""
+    script_dir = Path(__file__).parent
+    sys.path.insert(0, str(script_dir))
+
+    try:
+        from manifest import manifest_path_for
+
+        manifest_path = manifest_path_for(audio_path)
+        if manifest_path.exists():
+            shutil.move(str(manifest_path), str(manifest_path_for(target_audio)))
+    finally:
+        if str(script_dir) in sys.path:
+            sys.path.remove(str(script_dir))
+
+
+def find_memo_audio(memo_dir: Path) -> Path | None:
+    """Find the audio file save_memo stored in a memo directory (audio.wav, audio.m4a, ...)."""
+    for path in sorted(memo_dir.glob("audio.*")):
+        if path.suffix != ".json":  # Not the progress manifest (audio.progress.json)
+            return path
+    return None
+
+
+def save_memo(audio_path: Path, transcript: str | None, visions_dir: Path,
+              title: str | None = None) -> tuple[Path, bool]:
     """Save memo to appropriate directory.
 
+    A progress manifest left next to the audio by a failed transcription is
+    moved along with it.
+
     Args:
         audio_path: Path to the recorded audio file
         transcript: Transcription text, or None if transcription failed
         visions_dir: Base visions directory (.aur2/visions)
+        title: Title generated already (e.g. alongside transcription); one is
+            generated from the transcript if not given
 
     Returns:
         Tuple of (final_dir, success) where success indicates if saved to queue/
     """
     if transcript:
         # Success path: generate title and save to queue/
-        title = generate_title(transcript)
+        title = title or generate_title(transcript)
         target_dir = visions_dir / "queue" / title
 
-        # Handle duplicate titles
+        # Handle duplicate titles (a batch can produce the same title
+        # several times within one second, so count up if still taken)
         if target_dir.exists():
             timestamp = datetime.now().strftime("%H%M%S")
-            title = f"{title}-{timestamp}"
-            target_dir = visions_dir / "queue" / title
+            target_dir = visions_dir / "queue" / f"{title}-{timestamp}"
+            suffix = 2
+            while target_dir.exists():
+                target_dir = visions_dir / "queue" / f"{title}-{timestamp}-{suffix}"
+                suffix += 1
     else:
         # Failure path: save to failed/ with timestamp title
         title = get_fallback_title()
@@ -220,9 +514,10 @@ def save_memo(audio_path: Path, transcript: str | None, visions_dir: Path) -> tu
     # Create directory and move/save files
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    # Move audio file
-    target_audio = target_dir / "audio.wav"
+    # Move audio file (recordings are WAV; imported memos keep their format)
+    target_audio = target_dir / f"audio{audio_path.suffix.lower() or '.wav'}"
     shutil.move(str(audio_path), str(target_audio))
+    move_progress_manifest(audio_path, target_audio)
 
     # Save transcript if available
     if transcript:
@@ -233,13 +528,115 @@ def save_memo(audio_path: Path, transcript: str | None, visions_dir: Path) -> tu
         return target_dir, False
 
 
+def finish_memo(audio_path: Path, visions_dir: Path, jobs: int | None = None, trim: bool = True,
+                transcode: bool = True, use_cache: bool = True, resume: bool = False) -> tuple[Path, bool]:
+    """Transcribe a recording, title it and save it to queue/ (or failed/).
+
+    The title is generated alongside the transcription once the opening is
+    known. With resume, a memo whose transcription fails again is left where
+    it is instead of being moved to a new failed/ directory.
+
+    Args:
+        audio_path: Path to the recorded audio file
+        visions_dir: Base visions directory (.aur2/visions)
+        jobs: Number of chunks to transcribe concurrently (default: transcribe.DEFAULT_JOBS)
+        trim: Trim edge silence and collapse long pauses before upload
+        transcode: Re-encode the WAV to low-bitrate speech audio before upload
+        use_cache: Reuse transcripts of chunks already transcribed in an earlier run
+        resume: Only transcribe the chunks missing from the audio's progress manifest
+
+    Returns:
+        Tuple of (final_dir, success) as returned by save_memo
+    """
+    title_executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        on_chunk_done, start_title = title_alongside(title_executor)
+        transcript = timed("transcribe", transcribe_audio, audio_path, jobs=jobs, trim=trim, transcode=transcode,
+                           use_cache=use_cache, resume=resume, on_chunk_done=on_chunk_done)
+        if not transcript and resume:
+            return audio_path.parent, False
+
+        title = start_title(transcript).result() if transcript else None
+        return timed("save", save_memo, audio_path, transcript, visions_dir, title=title)
+    finally:
+        title_executor.shutdown()
+
+
+def finish_memo_anywhere(audio_path: Path, visions_dir: Path, use_daemon: bool = True,
+                         on_handoff: Callable[[], None] | None = None, **options) -> tuple[Path, bool]:
+    """Run finish_memo in the warm daemon if one is running, else in this process.
+
+    Accepts the keyword arguments of finish_memo. on_handoff is called once
+    the daemon has the job; from then on the daemon saves (and so moves) the
+    audio even if this process is interrupted.
+    """
+    if use_daemon:
+        script_dir = Path(__file__).parent
+        sys.path.insert(0, str(script_dir))
+        try:
+            import metrics
+            from memo_daemon import call_daemon
+
+            result = call_daemon("memo", audio_path=str(audio_path.resolve()), on_sent=on_handoff,
+                                 visions_dir=str(visions_dir.resolve()), options=options, **metrics.run_context())
+        finally:
+            if str(script_dir) in sys.path:
+                sys.path.remove(str(script_dir))
+
+        if result is not None:
+            metrics.merge_spans(result["spans"])
+            return Path(result["final_dir"]), result["success"]
+
+    return finish_memo(audio_path, visions_dir, **options)
+
+
+def discard_recording(audio_path: Path, handed_off: bool, visions_dir: Path) -> None:
+    """Delete an unsaved recording, unless the daemon has it and may still be saving it."""
+    if not audio_path.exists():
+        return
+    if handed_off:
+        print(f"  The daemon is still finishing this memo; it will be saved under {visions_dir}", file=sys.stderr)
+        print(f"  (recording: {audio_path})", file=sys.stderr)
+        return
+    audio_path.unlink()
+
+
+def resume_memo(memo_dir: Path, visions_dir: Path, use_daemon: bool = True, **options) -> None:
+    """Finish transcribing a memo saved to failed/ and move it to queue/.
+
+    Only chunks missing from the memo's progress manifest are transcribed.
+    On failure the memo stays where it is, with its manifest updated.
+    Exits with the same codes as a recording run.
+    """
+    audio_path = find_memo_audio(memo_dir)
+    if not audio_path:
+        print(f"Error: No audio file in {memo_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    final_dir, success = finish_memo_anywhere(audio_path, visions_dir, use_daemon=use_daemon, resume=True,
+                                              **options)
+    if not success:
+        print(f"\n⚠ Transcription failed again. Audio left in: {memo_dir}", file=sys.stderr)
+        sys.exit(2)
+
+    if not any(memo_dir.iterdir()):
+        memo_dir.rmdir()
+
+    print(f"\n✓ Memo saved to: {final_dir}", file=sys.stderr)
+    print(f"  Run '/aur2.process_visions' to process it.", file=sys.stderr)
+    sys.exit(0)
+
+
 def main():
     """Main entry point for record_memo script."""
     parser = argparse.ArgumentParser(
         description="Record voice memos with automatic transcription and title generation",
         epilog="Examples:\n"
                "  python .aur2/scripts/record_memo.py\n"
-               "  python .aur2/scripts/record_memo.py --max-duration 120\n",
+               "  python .aur2/scripts/record_memo.py --max-duration 120\n"
+               "  python .aur2/scripts/record_memo.py --jobs 8\n"
+               "  python .aur2/scripts/record_memo.py --live\n"
+               "  python .aur2/scripts/record_memo.py --resume .aur2/visions/failed/memo-20250101-120000\n",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
@@ -249,6 +646,54 @@ def main():
         default=DEFAULT_MAX_DURATION,
         help=f"Maximum recording duration in seconds (default: {DEFAULT_MAX_DURATION})"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of chunks to transcribe concurrently (default: 4)"
+    )
+    parser.add_argument(
+        "--no-trim",
+        action="store_true",
+        help="Upload the recording as-is instead of trimming silence and collapsing long pauses"
+    )
+    parser.add_argument(
+        "--no-transcode",
+        action="store_true",
+        help="Upload the raw WAV instead of low-bitrate speech audio"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Upload every chunk even if an identical one was transcribed before"
+    )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Transcribe in segments while recording, so only the last segment is left when you stop"
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print a one-line summary of the run's spans: time per stage and how much of the title call "
+             "overlapped transcription"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print every span of the run with bytes and peak memory (spans are always saved to .aur2/metrics)"
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Transcribe in this process even if the warm daemon (memo_daemon.py) is running"
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="DIR",
+        help="Finish transcribing a memo in failed/ instead of recording a new one"
+    )
 
     args = parser.parse_args()
 
@@ -263,8 +708,14 @@ def main():
     except ImportError:
         pass
 
+    # Collect stage spans for this run; they are saved (and printed with --profile) on exit
+    sys.path.insert(0, str(Path(__file__).parent))
+    import metrics
+    metrics.start_run("record_memo", profile=args.profile)
+    atexit.register(metrics.finish_run)
+
     # Check prerequisites
-    if not check_sox_installed():
+    if not args.resume and not check_sox_installed():
         print("Error: sox is not installed", file=sys.stderr)
         print("Install it with: brew install sox (macOS) or apt install sox (Linux)", file=sys.stderr)
         sys.exit(1)
@@ -274,27 +725,59 @@ def main():
         print("Set it in .aur2/.env or export it: export OPENAI_API_KEY=your-key", file=sys.stderr)
         sys.exit(1)
 
+    live = args.live
+    if live:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            print("Warning: numpy not installed, recording without live transcription", file=sys.stderr)
+            live = False
+
     # Get visions directory and ensure structure exists
     visions_dir = get_visions_dir()
     ensure_directories(visions_dir)
 
+    options = {
+        "jobs": args.jobs,
+        "trim": not args.no_trim,
+        "transcode": not args.no_transcode,
+        "use_cache": not args.no_cache,
+    }
+    if args.resume:
+        resume_memo(Path(args.resume), visions_dir, use_daemon=not args.no_daemon, **options)
+
     # Create temp file for recording
     with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
         temp_audio_path = Path(tmp.name)
+    handed_off = threading.Event()  # Set once the daemon owns the recording
 
     try:
-        # Step 1: Record audio
-        if not record_audio(temp_audio_path, args.max_duration):
+        # Step 1: Record audio (and, with --live, transcribe it as it comes in)
+        transcript = None
+        if live:
+            # The title is generated in the background once the opening is transcribed
+            with ThreadPoolExecutor(max_workers=1) as title_executor:
+                on_segment_done, start_title = title_alongside(title_executor)
+                recorded, transcript = timed("record", record_audio_live, temp_audio_path, args.max_duration,
+                                             jobs=args.jobs, use_cache=not args.no_cache,
+                                             on_segment_done=on_segment_done)
+                title = start_title(transcript).result() if transcript else None
+        else:
+            recorded = timed("record", record_audio, temp_audio_path, args.max_duration)
+        if not recorded:
             # Clean up temp file
             if temp_audio_path.exists():
                 temp_audio_path.unlink()
             sys.exit(1)
 
-        # Step 2: Transcribe audio
-        transcript = transcribe_audio(temp_audio_path)
-
-        # Step 3: Save memo (handles both success and failure cases)
-        final_dir, success = save_memo(temp_audio_path, transcript, visions_dir)
+        # Steps 2-3: Transcribe, title and save (live mode falls back to this if a segment failed)
+        if transcript:
+            final_dir, success = timed("save", save_memo, temp_audio_path, transcript, visions_dir, title=title)
+        else:
+            final_dir, success = finish_memo_anywhere(temp_audio_path, visions_dir, use_daemon=not args.no_daemon,
+                                                      on_handoff=handed_off.set, **options)
+        if args.timings:
+            print(format_timings(metrics.run_spans()), file=sys.stderr)
 
         if success:
             print(f"\n✓ Memo saved to: {final_dir}", file=sys.stderr)
@@ -302,18 +785,16 @@ def main():
             sys.exit(0)
         else:
             print(f"\n⚠ Transcription failed. Audio saved to: {final_dir}", file=sys.stderr)
-            print(f"  You can retry transcription manually or delete the memo.", file=sys.stderr)
+            print(f"  Retry with: python .aur2/scripts/record_memo.py --resume {final_dir}", file=sys.stderr)
             sys.exit(2)
 
     except KeyboardInterrupt:
         print("\nAborted.", file=sys.stderr)
-        if temp_audio_path.exists():
-            temp_audio_path.unlink()
+        discard_recording(temp_audio_path, handed_off.is_set(), visions_dir)
         sys.exit(130)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        if temp_audio_path.exists():
-            temp_audio_path.unlink()
+        discard_recording(temp_audio_path, handed_off.is_set(), visions_dir)
         sys.exit(1)
 
 
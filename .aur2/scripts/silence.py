@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""Frame-level energy analysis: chunk cuts in pauses and silence compaction.
+
+Usage:
+    python .aur2/scripts/silence.py <audio-file-path> [--chunk-minutes N]
+    python .aur2/scripts/silence.py <audio-file-path> --compact <output-path>
+
+Prints the chunk plan (start/end in seconds) that transcribe.py would use,
+or writes a copy with leading/trailing silence trimmed and long pauses
+collapsed. PCM WAV is read through a memory map; other formats are decoded to 16 kHz
+mono by ffmpeg and streamed, so memory stays flat for long recordings.
+
+Requirements:
+    pip install -r .aur2/scripts/requirements.txt
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+FRAME_MS = 20  # Analysis frame length
+SMOOTHING_MS = 300  # Window for averaging frame energy, so single quiet frames don't count as gaps
+SNAP_TOLERANCE_MS = 20 * 1000  # How far a cut may move from its target to find a pause
+BLOCK_FRAMES = 3000  # Frames analysed per vectorized block (60 s at 20 ms)
+
+SILENCE_THRESHOLD_DBFS = -45.0  # Frames quieter than this count as silence
+MAX_PAUSE_MS = 2000  # Internal pauses longer than this are collapsed
+KEEP_PAUSE_MS = 500  # Length a collapsed pause is shortened to
+EDGE_PADDING_MS = 250  # Silence kept before the first and after the last sound
+MIN_SAVING_MS = 1000  # Skip rewriting the file for smaller savings
+
+# numpy dtypes for WAV sample widths that can be memory-mapped directly
+PCM_DTYPES = {1: "u1", 2: "<i2", 4: "<i4"}
+FLOAT_DTYPES = {4: "<f4", 8: "<f8"}
+
+
+def _wav_samples(path: str, header: dict):
+    """Memory-map the interleaved samples of a WAV file, or None if they aren't plain PCM/float."""
+    import numpy as np
+
+    from transcribe import WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT
+
+    if header["format_tag"] not in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+        return None  # Compressed (ADPCM, mu-law, ...): ffmpeg decodes it
+    dtypes = FLOAT_DTYPES if header["format_tag"] == WAVE_FORMAT_IEEE_FLOAT else PCM_DTYPES
+    dtype = dtypes.get(header["sample_width"])
+    if dtype is None or header["data_size"] == 0:
+        return None
+
+    return np.memmap(path, dtype=dtype, mode="r", offset=header["data_offset"],
+                     shape=(header["data_size"] // header["sample_width"],))
+
+
+def _scale(block, dtype) -> "np.ndarray":
+    """Convert a block of raw samples to float32 in [-1, 1]."""
+    import numpy as np
+
+    if dtype.kind == "f":
+        return block.astype(np.float32)
+    if dtype.kind == "u":
+        return (block.astype(np.float32) - 128.0) / 128.0
+    return block.astype(np.float32) / float(2 ** (8 * dtype.itemsize - 1))
+
+
+def _block_rms(samples, frame_len: int) -> "np.ndarray":
+    """RMS of each complete frame in a flat float32 sample block."""
+    import numpy as np
+
+    n_frames = len(samples) // frame_len
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+    return np.sqrt(np.mean(np.square(frames), axis=1))
+
+
+def _iter_ffmpeg_blocks(path: str, sample_rate: int, block_samples: int) -> Iterator[bytes]:
+    """Decode any ffmpeg-readable file to s16le mono and yield raw blocks."""
+    cmd = [
+        "ffmpeg", "-v", "error",
+        "-i", path,
+        "-vn", "-ac", "1", "-ar", str(sample_rate),
+        "-f", "s16le", "pipe:1",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        while True:
+            block = proc.stdout.read(block_samples * 2)
+            if not block:
+                break
+            yield block
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+def frame_rms(path: str, frame_ms: int = FRAME_MS, block_frames: int = BLOCK_FRAMES):
+    """Compute per-frame RMS energy of an audio file.
+
+    Works block by block, vectorized within each block, so long recordings
+    never need to be fully decoded into memory.
+
+    Args:
+        path: Path to the audio file
+        frame_ms: Frame length in milliseconds
+        block_frames: Frames per vectorized block
+
+    Returns:
+        float32 array with one RMS value (0..1 full scale) per frame, or None
+        if the file can't be read without ffmpeg
+    """
+    import numpy as np
+
+    from transcribe import read_wav_header
+
+    header = read_wav_header(path)
+    samples = _wav_samples(path, header) if header else None
+
+    blocks = []
+    if samples is not None:
+        # Interleaved channels are kept together in a frame; RMS covers all of them
+        frame_len = header["sample_rate"] * frame_ms // 1000 * header["channels"]
+        block_len = frame_len * block_frames
+        for start in range(0, len(samples), block_len):
+            blocks.append(_block_rms(_scale(samples[start:start + block_len], samples.dtype), frame_len))
+    elif shutil.which("ffmpeg") is not None:
+        sample_rate = 16000
+        frame_len = sample_rate * frame_ms // 1000
+        dtype = np.dtype("<i2")
+        pending = b""
+        for raw in _iter_ffmpeg_blocks(path, sample_rate, frame_len * block_frames):
+            raw = pending + raw
+            usable = len(raw) // (frame_len * 2) * frame_len * 2
+            pending = raw[usable:]
+            if usable:
+                blocks.append(_block_rms(_scale(np.frombuffer(raw[:usable], dtype=dtype), dtype), frame_len))
+    else:
+        return None
+
+    if not blocks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(blocks)
+
+
+def load_rms(path: str):
+    """frame_rms for path, or None if numpy is not installed or the audio can't be analysed."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return None
+
+    rms = frame_rms(path)
+    if rms is None or len(rms) == 0:
+        return None
+    return rms
+
+
+def compacted_rms(rms, spans: list[tuple[int, int]], frame_ms: int = FRAME_MS):
+    """Per-frame energy of audio cut down to spans, looked up from the original's energy.
+
+    Each frame of the compacted timeline is mapped back through the kept
+    spans to the original frame it came from, so the compacted file never
+    has to be decoded and analysed again.
+
+    Args:
+        rms: Per-frame RMS energy of the original audio
+        spans: (start_ms, end_ms) spans kept, in order (see plan_silence_compaction)
+        frame_ms: Frame length rms was computed with
+
+    Returns:
+        float32 array with one RMS value per frame of the compacted audio
+    """
+    import numpy as np
+
+    starts = np.array([start_ms for start_ms, _ in spans], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum([end_ms - start_ms for start_ms, end_ms in spans]))).astype(np.int64)
+    centers = np.arange(offsets[-1] // frame_ms, dtype=np.int64) * frame_ms + frame_ms // 2
+    span = np.searchsorted(offsets, centers, side="right") - 1
+    original_ms = starts[span] + centers - offsets[span]
+    return rms[np.minimum(original_ms // frame_ms, len(rms) - 1)]
+
+
+def plan_chunk_boundaries(rms, duration_ms: int, chunk_duration_ms: int, tolerance_ms: int = SNAP_TOLERANCE_MS,
+                          frame_ms: int = FRAME_MS) -> list[tuple[int, int]]:
+    """Place each cut at the quietest moment within tolerance of its target.
+
+    Args:
+        rms: Per-frame RMS energy from frame_rms
+        duration_ms: Duration of the audio in milliseconds
+        chunk_duration_ms: Target chunk length in milliseconds
+        tolerance_ms: Maximum distance a cut may move from its target
+        frame_ms: Frame length rms was computed with
+
+    Returns:
+        List of (start_ms, end_ms) chunk spans covering the whole file
+    """
+    import numpy as np
+
+    # Moving average over frames, so a cut lands in a real pause
+    window = max(1, SMOOTHING_MS // frame_ms)
+    cumulative = np.concatenate(([0.0], np.cumsum(rms, dtype=np.float64)))
+    index = np.arange(len(rms))
+    lo = np.clip(index - window // 2, 0, len(rms))
+    hi = np.clip(index + window // 2 + 1, 0, len(rms))
+    smoothed = (cumulative[hi] - cumulative[lo]) / np.maximum(hi - lo, 1)
+
+    tolerance_ms = min(tolerance_ms, chunk_duration_ms // 2)
+    spans = []
+    start_ms = 0
+    while duration_ms - start_ms > chunk_duration_ms + tolerance_ms:
+        target_ms = start_ms + chunk_duration_ms
+        lo = max(0, (target_ms - tolerance_ms) // frame_ms)
+        hi = min(len(smoothed), (target_ms + tolerance_ms) // frame_ms + 1)
+
+        cut_ms = target_ms
+        if hi > lo:
+            candidates = smoothed[lo:hi]
+            # Among near-silent frames prefer the one closest to the target
+            quiet = candidates <= candidates.min() * 1.1 + 1e-6
+            distance = np.abs(np.arange(lo, hi) * frame_ms + frame_ms // 2 - target_ms)
+            best = lo + int(np.argmin(np.where(quiet, distance, np.iinfo(np.int64).max)))
+            cut_ms = best * frame_ms + frame_ms // 2
+
+        spans.append((start_ms, cut_ms))
+        start_ms = cut_ms
+
+    spans.append((start_ms, duration_ms))
+    return spans
+
+
+def plan_silence_aware_chunks(path: str, duration_ms: int, chunk_duration_ms: int,
+                              tolerance_ms: int = SNAP_TOLERANCE_MS, rms=None) -> list[tuple[int, int]] | None:
+    """Build a chunk plan for path with cuts snapped to pauses.
+
+    Args:
+        path: Path to the audio file
+        duration_ms: Duration of the audio in milliseconds
+        chunk_duration_ms: Target chunk length in milliseconds
+        tolerance_ms: Maximum distance a cut may move from its target
+        rms: Per-frame energy of path if already known (e.g. from
+            compact_silence), so it isn't analysed again
+
+    Returns:
+        List of (start_ms, end_ms) spans, or None if numpy is not installed or
+        the audio can't be analysed (callers fall back to fixed cuts)
+    """
+    if rms is None:
+        rms = load_rms(path)
+    if rms is None:
+        return None
+    return plan_chunk_boundaries(rms, duration_ms, chunk_duration_ms, tolerance_ms)
+
+
+def plan_silence_compaction(rms, duration_ms: int, threshold_dbfs: float = SILENCE_THRESHOLD_DBFS,
+                            max_pause_ms: int = MAX_PAUSE_MS, keep_pause_ms: int = KEEP_PAUSE_MS,
+                            edge_padding_ms: int = EDGE_PADDING_MS,
+                            frame_ms: int = FRAME_MS) -> list[tuple[int, int]]:
+    """Plan which spans of audio to keep after trimming and compacting silence.
+
+    Leading and trailing silence is cut down to edge_padding_ms, and every
+    internal pause longer than max_pause_ms is shortened to keep_pause_ms.
+
+    Args:
+        rms: Per-frame RMS energy from frame_rms
+        duration_ms: Duration of the audio in milliseconds
+        threshold_dbfs: Frames quieter than this (dB full scale) count as silence
+        max_pause_ms: Longest internal pause left untouched
+        keep_pause_ms: Length a longer pause is collapsed to
+        edge_padding_ms: Silence kept before the first and after the last sound
+        frame_ms: Frame length rms was computed with
+
+    Returns:
+        List of (start_ms, end_ms) spans to keep, in order; empty if the
+        audio is silent throughout
+    """
+    import numpy as np
+
+    loud = rms >= 10 ** (threshold_dbfs / 20)
+    if not loud.any():
+        return []
+
+    loud_frames = np.flatnonzero(loud)
+    first, last = int(loud_frames[0]), int(loud_frames[-1])
+
+    # Run-length encode silence: starts/ends of each silent run, in frames
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], (~loud).astype(np.int8), [0]))))
+    run_starts, run_ends = edges[::2], edges[1::2]
+    collapse = ((run_ends - run_starts) * frame_ms > max_pause_ms) & (run_starts > first) & (run_ends <= last)
+
+    spans = []
+    cursor = max(0, first * frame_ms - edge_padding_ms)
+    for run_start, run_end in zip(run_starts[collapse], run_ends[collapse]):
+        spans.append((cursor, int(run_start) * frame_ms + keep_pause_ms // 2))
+        cursor = int(run_end) * frame_ms - keep_pause_ms // 2
+    spans.append((cursor, min(duration_ms, (last + 1) * frame_ms + edge_padding_ms)))
+    return spans
+
+
+def write_spans(path: str, spans: list[tuple[int, int]], output_path: str) -> None:
+    """Write only the given spans of an audio file to output_path.
+
+    PCM WAV is copied slice by slice from a memory map with no decode; other
+    formats, compressed WAV included, go through an ffmpeg aselect filter and
+    keep their container.
+
+    Args:
+        path: Path to the source audio file
+        spans: (start_ms, end_ms) spans to keep, in order
+        output_path: Destination path (same format as path)
+    """
+    import mmap
+
+    from transcribe import (read_wav_header, wav_header_bytes, EXPORT_FORMAT_MAP, WAVE_FORMAT_PCM,
+                            WAVE_FORMAT_IEEE_FLOAT)
+
+    header = read_wav_header(path)
+    # Compressed WAV blocks hold many frames, so byte offsets can't be computed from time
+    if header and header["format_tag"] in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+        block_align = header["channels"] * header["sample_width"]
+        data_end = header["data_offset"] + header["data_size"]
+
+        def offset(ms: int) -> int:
+            return min(header["data_offset"] + ms * header["sample_rate"] // 1000 * block_align, data_end)
+
+        slices = [(offset(start_ms), offset(end_ms)) for start_ms, end_ms in spans]
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                open(output_path, "wb") as out:
+            out.write(wav_header_bytes(
+                header["format_tag"], header["channels"], header["sample_rate"],
+                header["sample_width"], sum(end - start for start, end in slices),
+            ))
+            with memoryview(mm) as view:
+                for start, end in slices:
+                    out.write(view[start:end])
+        return
+
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required to trim silence from audio other than PCM WAV")
+
+    ext = Path(path).suffix.lower().lstrip(".")
+    keep = "+".join(f"between(t,{start_ms / 1000:.3f},{end_ms / 1000:.3f})" for start_ms, end_ms in spans)
+    cmd = [
+        "ffmpeg", "-v", "error", "-y",
+        "-i", path,
+        "-vn",
+        "-af", f"aselect='{keep}',asetpts=N/SR/TB",
+        "-f", EXPORT_FORMAT_MAP.get(ext, ext),
+        output_path,
+    ]
+    try:
+        subprocess.run(cmd, capture_output=True, check=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg failed to trim silence: {e.stderr.decode().strip()}") from e
+
+
+def compact_silence(path: str, output_path: str, duration_ms: int | None = None,
+                    max_pause_ms: int = MAX_PAUSE_MS, keep_pause_ms: int = KEEP_PAUSE_MS,
+                    rms=None) -> dict | None:
+    """Trim leading/trailing silence and collapse long pauses before upload.
+
+    Args:
+        path: Path to the audio file
+        output_path: Where to write the compacted audio (same format as path)
+        duration_ms: Known duration of the file (probed if omitted)
+        max_pause_ms: Longest internal pause left untouched
+        keep_pause_ms: Length a longer pause is collapsed to
+        rms: Per-frame energy of path if already known (see load_rms)
+
+    Returns:
+        Dict with input_ms, output_ms, input_bytes, output_bytes and the kept
+        spans, or None if there was nothing worth removing (output_path is
+        not written)
+    """
+    from transcribe import get_audio_duration_ms
+
+    if rms is None:
+        rms = load_rms(path)
+    if rms is None:
+        return None
+    if duration_ms is None:
+        duration_ms = get_audio_duration_ms(path)
+
+    spans = plan_silence_compaction(rms, duration_ms, max_pause_ms=max_pause_ms, keep_pause_ms=keep_pause_ms)
+    kept_ms = sum(end_ms - start_ms for start_ms, end_ms in spans)
+    if not spans or duration_ms - kept_ms < MIN_SAVING_MS:
+        return None
+
+    write_spans(path, spans, output_path)
+    return {
+        "input_ms": duration_ms,
+        "output_ms": kept_ms,
+        "input_bytes": os.path.getsize(path),
+        "output_bytes": os.path.getsize(output_path),
+        "spans": spans,
+    }
+
+
+def format_savings(stats: dict) -> str:
+    """One-line summary of what compact_silence removed."""
+    saved_s = (stats["input_ms"] - stats["output_ms"]) / 1000
+    saved_mb = (stats["input_bytes"] - stats["output_bytes"]) / (1024 * 1024)
+    return (f"Trimmed {saved_s:.1f}s of silence ({stats['input_ms'] / 1000:.1f}s -> "
+            f"{stats['output_ms'] / 1000:.1f}s, {saved_mb:.1f}MB saved)")
+
+
+def main():
+    """CLI interface for inspecting chunk plans and compacting silence."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from transcribe import get_audio_duration_ms, plan_chunks, CHUNK_DURATION_MS
+
+    parser = argparse.ArgumentParser(description="Show silence-aware chunk boundaries for an audio file")
+    parser.add_argument("audio_path", type=str, help="Path to the audio file")
+    parser.add_argument(
+        "--chunk-minutes",
+        type=float,
+        default=CHUNK_DURATION_MS / 60000,
+        help=f"Target chunk length in minutes (default: {CHUNK_DURATION_MS / 60000:g})"
+    )
+    parser.add_argument(
+        "--compact",
+        type=str,
+        metavar="OUTPUT",
+        help="Write a copy with silence trimmed and long pauses collapsed"
+    )
+    args = parser.parse_args()
+
+    if args.compact:
+        stats = compact_silence(args.audio_path, args.compact)
+        if stats is None:
+            print("Nothing to trim", file=sys.stderr)
+        else:
+            print(format_savings(stats))
+        return
+
+    duration_ms = get_audio_duration_ms(args.audio_path)
+    for start_ms, end_ms in plan_chunks(args.audio_path, duration_ms, int(args.chunk_minutes * 60000)):
+        print(f"{start_ms / 1000:9.2f}  {end_ms / 1000:9.2f}  ({(end_ms - start_ms) / 1000:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@
 """Transcribe audio files using OpenAI's Whisper API.
 
 Usage:
-    python .aur2/scripts/transcribe.py <audio-file-path>
+    python .aur2/scripts/transcribe.py <audio-file-path> [--jobs N] [--chunk-minutes N]
+        [--no-trim] [--no-transcode] [--no-cache] [--resume] [--stream] [--profile]
 
 Requirements:
     pip install -r .aur2/scripts/requirements.txt
@@ -11,106 +12,1053 @@ Environment:
     OPENAI_API_KEY - Required. Your OpenAI API key.
 """
 
+import io
 import os
+import json
+import re
 import sys
+import mmap
+import time
+import random
+import shutil
+import struct
+import argparse
 import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import Callable, Collection, Iterable, Iterator
 
 SUPPORTED_FORMATS = {"mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"}
 MAX_FILE_SIZE_MB = 25
 CHUNK_DURATION_MS = 5 * 60 * 1000  # 5 minutes in milliseconds
 CHUNK_THRESHOLD_MS = 8 * 60 * 1000  # Only chunk files longer than 8 minutes
+DEFAULT_JOBS = 4  # Chunks transcribed concurrently
+CHUNK_MEMORY_BUDGET_MB = 256  # Chunk bytes held in memory before spilling to temp files
+UPLOAD_BITRATE_KBPS = 24  # Speech bitrate for upload transcodes (16 kHz WAV is 256kbps)
+TRANSCODE_MIN_RATIO = 2  # Only transcode inputs at least this many times the target bitrate
+# Upload transcodes: AAC in m4a encodes ~5x faster than libopus at the same size for speech
+UPLOAD_ENCODER = "aac"
+UPLOAD_CONTAINER = "ipod"
+UPLOAD_EXT = "m4a"
+TRANSCRIPT_CACHE_NAMESPACE = "transcripts"  # Per-chunk transcripts under .aur2/cache/
+TRANSCRIPT_CACHE_MAX_MB = 50  # Transcript cache size before LRU eviction
+MAX_CHUNK_RETRIES = 3  # Retries per chunk before giving up
+RETRY_BACKOFF_S = 1.0  # Base delay for exponential backoff between retries
+
+# WAV format tags the mmap fast path can re-wrap without decoding
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# "Duration: 00:12:00.00" in ffmpeg's input summary, and the "time=" of its progress line
+FFMPEG_DURATION_RE = re.compile(r"Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+FFMPEG_TIME_RE = re.compile(r"time=(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
 
 # Map file extensions to ffmpeg export format names (some differ from extension)
 EXPORT_FORMAT_MAP = {"m4a": "ipod", "mpga": "mp3"}
 
+# A chunk is either a file path or an in-memory (upload filename, encoded bytes) pair
+Chunk = str | tuple[str, bytes]
+
+
+def read_wav_header(path: str) -> dict | None:
+    """Read the format and data layout of a WAV file from its RIFF header.
+
+    Only the header chunks are read; no sample data is decoded. The data size
+    is clamped to the bytes actually present, so files whose header was never
+    finalized (e.g. a recording that was killed) still report a sane length.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        Dict with format_tag, channels, sample_rate, sample_width,
+        data_offset and data_size, or None if the file is not a parseable WAV
+    """
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            riff = f.read(12)
+            if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+                return None
+
+            fmt = None
+            while True:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    return None
+                chunk_id = chunk_header[:4]
+                chunk_size = struct.unpack("<I", chunk_header[4:])[0]
+
+                if chunk_id == b"fmt ":
+                    fmt = f.read(chunk_size)
+                    if chunk_size % 2:
+                        f.seek(1, os.SEEK_CUR)
+                elif chunk_id == b"data":
+                    if fmt is None or len(fmt) < 16:
+                        return None
+                    format_tag, channels, sample_rate, _, block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+                    if not channels or not sample_rate or not block_align:
+                        return None
+                    if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+                        # Real format tag is the first two bytes of the SubFormat GUID
+                        format_tag = struct.unpack("<H", fmt[24:26])[0]
+                    data_offset = f.tell()
+                    data_size = min(chunk_size, file_size - data_offset)
+                    data_size -= data_size % block_align
+                    return {
+                        "format_tag": format_tag,
+                        "channels": channels,
+                        "sample_rate": sample_rate,
+                        "sample_width": block_align // channels,
+                        "data_offset": data_offset,
+                        "data_size": data_size,
+                    }
+                else:
+                    f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+
+def probe_duration_ms(path: str) -> int | None:
+    """Read the container duration with ffprobe, without decoding the audio.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        Duration in milliseconds, or None if ffprobe is unavailable or fails
+    """
+    if shutil.which("ffprobe") is None:
+        return None
+
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return int(float(result.stdout.strip()) * 1000)
+    except (subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def ffmpeg_duration_ms(path: str) -> int | None:
+    """Read the duration from ffmpeg's input summary, for machines without ffprobe.
+
+    Containers that carry no duration (e.g. some streamed webm recordings) are
+    decoded to a null sink and the last progress timestamp is used instead.
+
+    Args:
+        path: Path to the audio file
+
+    Returns:
+        Duration in milliseconds, or None if ffmpeg is unavailable or fails
+    """
+    if shutil.which("ffmpeg") is None:
+        return None
+
+    # With no output file ffmpeg exits non-zero, but still prints the input summary
+    result = subprocess.run(["ffmpeg", "-hide_banner", "-i", path], capture_output=True, text=True)
+    match = FFMPEG_DURATION_RE.search(result.stderr)
+    if match is None:
+        cmd = ["ffmpeg", "-hide_banner", "-v", "error", "-stats", "-i", path, "-f", "null", "-"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        matches = FFMPEG_TIME_RE.findall(result.stderr) if result.returncode == 0 else []
+        if not matches:
+            return None
+        hours, minutes, seconds = matches[-1]
+    else:
+        hours, minutes, seconds = match.groups()
+    return int((int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1000)
+
 
 def get_audio_duration_ms(path: str) -> int:
-    """Get the duration of an audio file in milliseconds."""
+    """Get the duration of an audio file in milliseconds.
+
+    PCM WAV durations come from the RIFF header and other audio is probed
+    with ffprobe, or with ffmpeg itself where ffprobe is not installed.
+
+    Raises:
+        RuntimeError: If ffmpeg is not installed, or cannot read the file
+    """
+    header = read_wav_header(path)
+    # Compressed WAV (e.g. ADPCM) packs many frames into each block, so only PCM sizes map to time
+    if header and header["format_tag"] in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+        frame_size = header["channels"] * header["sample_width"]
+        return header["data_size"] // frame_size * 1000 // header["sample_rate"]
+
+    duration_ms = probe_duration_ms(path)
+    if duration_ms is None:
+        duration_ms = ffmpeg_duration_ms(path)
+    if duration_ms is None and shutil.which("ffmpeg") is None:
+        raise RuntimeError(
+            "ffmpeg/ffprobe is required to read audio other than PCM WAV. "
+            "Install it with: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)"
+        )
+    if duration_ms is None:
+        raise RuntimeError(f"Could not read the duration of {path}; is it a valid audio file?")
+    return duration_ms
+
+
+def load_audio(path: str):
+    """Decode an audio file into a pydub AudioSegment.
+
+    Decode once and pass the segment to split_audio_into_chunks to avoid
+    decoding the same file again.
+    """
     from pydub import AudioSegment
 
-    audio = AudioSegment.from_file(path)
-    return len(audio)
+    return AudioSegment.from_file(path)
 
 
-def split_audio_into_chunks(path: str, chunk_duration_ms: int = CHUNK_DURATION_MS) -> list[str]:
+def keep_or_spill(name: str, data: bytes, held_bytes: int,
+                  budget_bytes: int = CHUNK_MEMORY_BUDGET_MB * 1024 * 1024) -> tuple[Chunk, int]:
+    """Keep a chunk in memory, or spill it to a temp file once the budget is used up.
+
+    Args:
+        name: Chunk file name, used as the upload filename
+        data: Encoded chunk bytes
+        held_bytes: Bytes of chunks already kept in memory by this split
+        budget_bytes: Maximum bytes of chunks to keep in memory
+
+    Returns:
+        Tuple of (chunk, held_bytes) with held_bytes updated for the new chunk
+    """
+    if held_bytes + len(data) <= budget_bytes:
+        return (name, data), held_bytes + len(data)
+
+    with tempfile.NamedTemporaryFile(suffix=Path(name).suffix, delete=False) as temp_file:
+        temp_file.write(data)
+    return temp_file.name, held_bytes
+
+
+def chunk_name(chunk: Chunk) -> str:
+    """Display/upload file name of a chunk."""
+    return chunk[0] if isinstance(chunk, tuple) else Path(chunk).name
+
+
+def chunk_size(chunk: Chunk) -> int:
+    """Size of a chunk in bytes, without reading a file chunk."""
+    return len(chunk[1]) if isinstance(chunk, tuple) else os.path.getsize(chunk)
+
+
+def chunk_threshold_ms(chunk_duration_ms: int = CHUNK_DURATION_MS) -> int:
+    """Shortest duration that gets split, scaled with the chunk length.
+
+    With the default 5-minute chunks this is CHUNK_THRESHOLD_MS (8 minutes),
+    which avoids uploading a tiny trailing chunk.
+    """
+    return CHUNK_THRESHOLD_MS * chunk_duration_ms // CHUNK_DURATION_MS
+
+
+def fixed_chunk_plan(duration_ms: int, chunk_duration_ms: int = CHUNK_DURATION_MS) -> list[tuple[int, int]]:
+    """Plan chunks with a cut exactly every chunk_duration_ms.
+
+    Returns:
+        List of (start_ms, end_ms) spans; a single span if no split is needed
+    """
+    if duration_ms <= chunk_threshold_ms(chunk_duration_ms):
+        return [(0, duration_ms)]
+    return [
+        (start_ms, min(start_ms + chunk_duration_ms, duration_ms))
+        for start_ms in range(0, duration_ms, chunk_duration_ms)
+    ]
+
+
+def plan_chunks(path: str, duration_ms: int, chunk_duration_ms: int = CHUNK_DURATION_MS,
+                snap_to_silence: bool = True, rms=None) -> list[tuple[int, int]]:
+    """Plan where to cut an audio file into chunks.
+
+    When snap_to_silence is set and numpy is available, each cut moves to the
+    quietest pause near its target (see silence.py), so chunks can be short
+    without splitting words. Otherwise cuts fall on a fixed grid.
+
+    Args:
+        path: Path to the audio file
+        duration_ms: Duration of the file in milliseconds
+        chunk_duration_ms: Target duration of each chunk in milliseconds
+        snap_to_silence: Move cuts into nearby pauses
+        rms: Per-frame energy of path if already known (see compact_for_upload)
+
+    Returns:
+        List of (start_ms, end_ms) spans covering the file
+    """
+    if duration_ms <= chunk_threshold_ms(chunk_duration_ms):
+        return [(0, duration_ms)]
+
+    if snap_to_silence:
+        from silence import plan_silence_aware_chunks
+
+        plan = plan_silence_aware_chunks(path, duration_ms, chunk_duration_ms, rms=rms)
+        if plan:
+            return plan
+
+    return fixed_chunk_plan(duration_ms, chunk_duration_ms)
+
+
+def split_audio_into_chunks(path: str, chunk_duration_ms: int = CHUNK_DURATION_MS, audio=None,
+                            memory_budget_mb: int = CHUNK_MEMORY_BUDGET_MB,
+                            plan: list[tuple[int, int]] | None = None) -> list[Chunk]:
     """Split an audio file into chunks if it exceeds the threshold duration.
 
     Args:
         path: Path to the audio file
         chunk_duration_ms: Duration of each chunk in milliseconds
+        audio: Already-decoded AudioSegment for path (decoded here if omitted)
+        memory_budget_mb: Chunk bytes to keep in memory before spilling to temp files
+        plan: (start_ms, end_ms) spans to cut (fixed chunk_duration_ms grid if omitted)
 
     Returns:
-        List of file paths (original path if no splitting needed, or temp chunk paths)
+        List of chunks (original path if no splitting needed, otherwise
+        in-memory (name, bytes) chunks or temp paths once over budget)
     """
-    from pydub import AudioSegment
-
-    audio = AudioSegment.from_file(path)
-    duration_ms = len(audio)
+    if audio is None:
+        # Cheap header probe first so short files are never decoded
+        if plan is None:
+            plan = fixed_chunk_plan(get_audio_duration_ms(path), chunk_duration_ms)
+        if len(plan) == 1:
+            return [path]
+        audio = load_audio(path)
 
-    if duration_ms <= CHUNK_THRESHOLD_MS:
+    if plan is None:
+        plan = fixed_chunk_plan(len(audio), chunk_duration_ms)
+    if len(plan) == 1:
         return [path]
 
-    chunk_paths = []
-    for i, start_ms in enumerate(range(0, duration_ms, chunk_duration_ms)):
-        end_ms = min(start_ms + chunk_duration_ms, duration_ms)
-        chunk = audio[start_ms:end_ms]
+    ext = Path(path).suffix.lower().lstrip(".")
+    export_format = EXPORT_FORMAT_MAP.get(ext, ext)
+    budget_bytes = memory_budget_mb * 1024 * 1024
 
-        # Create temp file with same extension for compatibility
-        ext = Path(path).suffix.lower().lstrip(".")
-        export_format = EXPORT_FORMAT_MAP.get(ext, ext)
-        temp_file = tempfile.NamedTemporaryFile(suffix=f".{ext}", delete=False)
-        chunk.export(temp_file.name, format=export_format)
-        chunk_paths.append(temp_file.name)
+    chunks = []
+    held_bytes = 0
+    for i, (start_ms, end_ms) in enumerate(plan):
+        buffer = io.BytesIO()
+        audio[start_ms:end_ms].export(buffer, format=export_format)
 
-    return chunk_paths
+        # Keep the same extension so the API detects the format
+        chunk, held_bytes = keep_or_spill(f"chunk-{i + 1:03d}.{ext}", buffer.getvalue(), held_bytes, budget_bytes)
+        chunks.append(chunk)
 
+    return chunks
 
-def transcribe_audio(path: str, model: str = "gpt-4o-mini-transcribe") -> str:
-    """Transcribe an audio file using OpenAI's Whisper API.
+
+def wav_header_bytes(format_tag: int, channels: int, sample_rate: int, sample_width: int, data_size: int) -> bytes:
+    """Build a canonical 44-byte WAV header for the given sample layout."""
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, format_tag, channels, sample_rate,
+        sample_rate * block_align, block_align, sample_width * 8,
+        b"data", data_size,
+    )
+
+
+def iter_wav_chunks(path: str, chunk_duration_ms: int = CHUNK_DURATION_MS, header: dict | None = None,
+                    memory_budget_mb: int = CHUNK_MEMORY_BUDGET_MB, plan: list[tuple[int, int]] | None = None,
+                    skip: Collection[int] = ()) -> Iterator[Chunk | None]:
+    """Split a PCM WAV file by slicing its sample data, with no decode or ffmpeg.
+
+    The file is memory-mapped and each chunk is a fresh header followed by a
+    memoryview slice of the original samples. Chunks are built in memory
+    until memory_budget_mb is used up, then written straight to temp files.
+
+    Args:
+        path: Path to a PCM WAV file
+        chunk_duration_ms: Duration of each chunk in milliseconds
+        header: Result of read_wav_header(path) (read here if omitted)
+        memory_budget_mb: Chunk bytes to keep in memory before spilling to temp files
+        plan: (start_ms, end_ms) spans to cut (fixed chunk_duration_ms grid if omitted)
+        skip: Indices of spans not to cut (e.g. already transcribed)
+
+    Yields:
+        Chunks, in order; None for skipped spans
+    """
+    header = header or read_wav_header(path)
+    if header is None:
+        raise ValueError(f"Not a PCM WAV file: {path}")
+
+    block_align = header["channels"] * header["sample_width"]
+    data_start = header["data_offset"]
+    data_end = data_start + header["data_size"]
+    budget_bytes = memory_budget_mb * 1024 * 1024
+
+    if plan is None:
+        duration_ms = header["data_size"] // block_align * 1000 // header["sample_rate"]
+        plan = fixed_chunk_plan(duration_ms, chunk_duration_ms)
+
+    def offset(ms: int) -> int:
+        return min(data_start + ms * header["sample_rate"] // 1000 * block_align, data_end)
+
+    held_bytes = 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            for i, (start_ms, end_ms) in enumerate(plan):
+                if i in skip:
+                    yield None
+                    continue
+                start = offset(start_ms)
+                end = data_end if i == len(plan) - 1 else offset(end_ms)
+                chunk_header = wav_header_bytes(
+                    header["format_tag"], header["channels"], header["sample_rate"],
+                    header["sample_width"], end - start,
+                )
+
+                if held_bytes + len(chunk_header) + end - start <= budget_bytes:
+                    data = b"".join((chunk_header, view[start:end]))
+                    held_bytes += len(data)
+                    yield f"chunk-{i + 1:03d}.wav", data
+                else:
+                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+                        temp_file.write(chunk_header)
+                        temp_file.write(view[start:end])
+                    yield temp_file.name
+
+
+def iter_audio_chunks(path: str, chunk_duration_ms: int = CHUNK_DURATION_MS, duration_ms: int | None = None,
+                      memory_budget_mb: int = CHUNK_MEMORY_BUDGET_MB,
+                      plan: list[tuple[int, int]] | None = None, transcode: bool = False,
+                      bitrate_kbps: int = UPLOAD_BITRATE_KBPS, skip: Collection[int] = ()) -> Iterator[Chunk | None]:
+    """Cut an audio file into chunks one at a time, without decoding it in memory.
+
+    Each chunk is cut by its own ffmpeg process that seeks straight to the
+    chunk start and stream-copies only that span, so peak memory stays flat no
+    matter how long the recording is. Chunks are yielded as soon as they are
+    cut, as in-memory (name, bytes) pairs until memory_budget_mb is used up
+    and as temp files after that; consumers own any yielded temp files.
+
+    PCM WAV input (what record_memo produces) takes the iter_wav_chunks fast
+    path instead; anything else needs ffmpeg.
+
+    With transcode, each chunk is re-encoded as mono 16 kHz speech at
+    bitrate_kbps as it is cut (see should_transcode), so encoding chunk N+1
+    overlaps the upload of chunk N instead of delaying the first upload.
 
     Args:
         path: Path to the audio file
+        chunk_duration_ms: Duration of each chunk in milliseconds
+        duration_ms: Known duration of the file (probed if omitted)
+        memory_budget_mb: Chunk bytes to keep in memory before spilling to temp files
+        plan: (start_ms, end_ms) spans to cut (see plan_chunks; planned here if omitted)
+        transcode: Re-encode chunks to low-bitrate speech audio when that saves bytes
+        bitrate_kbps: Target bitrate for transcoded chunks
+        skip: Indices of spans not to cut or encode, e.g. chunks a resumed run
+            already transcribed
+
+    Yields:
+        The original path if no splitting or transcoding is needed, otherwise
+        chunks; None in place of each skipped span
+
+    Raises:
+        RuntimeError: If a file other than PCM WAV needs cutting and ffmpeg is not installed
+    """
+    if plan is None:
+        if duration_ms is None:
+            duration_ms = get_audio_duration_ms(path)
+        plan = plan_chunks(path, duration_ms, chunk_duration_ms)
+
+    if transcode and should_transcode(path, plan[-1][1], bitrate_kbps):
+        yield from iter_transcoded_chunks(path, plan, memory_budget_mb, bitrate_kbps, skip)
+        return
+
+    if len(plan) == 1:
+        yield None if 0 in skip else path
+        return
+
+    header = read_wav_header(path)
+    if header and header["format_tag"] in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+        yield from iter_wav_chunks(path, chunk_duration_ms, header, memory_budget_mb, plan, skip)
+        return
+
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError(
+            "ffmpeg is required to split audio other than PCM WAV. "
+            "Install it with: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)"
+        )
+
+    ext = Path(path).suffix.lower().lstrip(".")
+    budget_bytes = memory_budget_mb * 1024 * 1024
+
+    held_bytes = 0
+    for i, (start_ms, end_ms) in enumerate(plan):
+        if i in skip:
+            yield None
+            continue
+        try:
+            result = subprocess.run(cut_command(path, plan, i, copy_args(ext)), capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"ffmpeg failed to cut chunk at {start_ms}ms: {e.stderr.decode().strip()}") from e
+
+        chunk, held_bytes = keep_or_spill(f"chunk-{i + 1:03d}.{ext}", result.stdout, held_bytes, budget_bytes)
+        yield chunk
+
+
+def cut_command(path: str, plan: list[tuple[int, int]], i: int, output_args: list[str]) -> list[str]:
+    """ffmpeg command that reads only the i-th planned span of path and writes it with output_args."""
+    start_ms, end_ms = plan[i]
+    # Input seek skips everything before the chunk; the last chunk runs to end of file
+    cmd = ["ffmpeg", "-v", "error", "-ss", f"{start_ms / 1000:.3f}"]
+    if i < len(plan) - 1:
+        cmd += ["-t", f"{(end_ms - start_ms) / 1000:.3f}"]
+    return cmd + ["-i", path] + output_args
+
+
+def copy_args(ext: str) -> list[str]:
+    """ffmpeg output options that stream-copy audio to stdout in the container for ext."""
+    export_format = EXPORT_FORMAT_MAP.get(ext, ext)
+    # Stream copy: the chunk keeps the source codec and bitrate, with no re-encode.
+    # Source metadata is dropped so the chunk doesn't inherit the full-file duration tag.
+    args = ["-vn", "-c:a", "copy", "-map_metadata", "-1", "-fflags", "+bitexact", "-f", export_format]
+    if export_format in ("ipod", "mp4"):
+        # MP4 muxers need a seekable output unless the moov atom goes first
+        args += ["-movflags", "frag_keyframe+empty_moov"]
+    return args + ["pipe:1"]
+
+
+def measured_chunks(chunks: Iterator[Chunk | None], plan: list[tuple[int, int]], **fields) -> Iterator[Chunk | None]:
+    """Pass chunks through, recording the time spent cutting (and transcoding) each one as a split span."""
+    import metrics
+
+    for i, (start_ms, end_ms) in enumerate(plan):
+        start = time.perf_counter()
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return
+        if chunk is None:
+            yield chunk  # Skipped span: nothing was cut
+            continue
+        metrics.record_span("split", start, time.perf_counter(), chunk=i, bytes=chunk_size(chunk),
+                            audio_s=(end_ms - start_ms) / 1000, **fields)
+        yield chunk
+
+
+def compact_for_upload(path: str, duration_ms: int | None = None) -> tuple[str, "np.ndarray | None"]:
+    """Trim edge silence and collapse long pauses into a temp copy for upload.
+
+    The audio is analysed once; its frame energy is returned mapped onto the
+    upload file's timeline, so plan_chunks can snap cuts without decoding it again.
+
+    Args:
+        path: Path to the audio file
+        duration_ms: Known duration of the file (probed if omitted)
+
+    Returns:
+        Tuple of (upload_path, rms). upload_path is the compacted temp file
+        (caller deletes it), or path itself if there was nothing worth
+        trimming or trimming wasn't possible. rms is the per-frame energy of
+        upload_path, or None if the audio couldn't be analysed.
+    """
+    from silence import load_rms, compact_silence, compacted_rms, format_savings
+
+    with tempfile.NamedTemporaryFile(suffix=Path(path).suffix, delete=False) as temp_file:
+        output_path = temp_file.name
+
+    rms = stats = None
+    try:
+        rms = load_rms(path)
+        stats = compact_silence(path, output_path, duration_ms, rms=rms) if rms is not None else None
+    except Exception as e:
+        print(f"Warning: silence trimming failed ({e}), uploading untrimmed audio", file=sys.stderr)
+
+    if stats is None:
+        os.unlink(output_path)
+        return path, rms
+
+    print(format_savings(stats), file=sys.stderr)
+    return output_path, compacted_rms(rms, stats["spans"])
+
+
+def should_transcode(path: str, duration_ms: int, bitrate_kbps: int = UPLOAD_BITRATE_KBPS) -> bool:
+    """Whether re-encoding for upload saves enough bytes to be worth it.
+
+    Files already close to the target bitrate (e.g. phone m4a memos) are left
+    alone; uncompressed WAV typically shrinks about 10x. Needs ffmpeg.
+    """
+    if shutil.which("ffmpeg") is None or duration_ms <= 0:
+        return False
+    return os.path.getsize(path) * 8 / (duration_ms / 1000) >= bitrate_kbps * 1000 * TRANSCODE_MIN_RATIO
+
+
+def transcode_args(bitrate_kbps: int = UPLOAD_BITRATE_KBPS) -> list[str]:
+    """ffmpeg output options that encode mono 16 kHz speech audio to stdout."""
+    return [
+        "-vn", "-ac", "1", "-ar", "16000", "-c:a", UPLOAD_ENCODER, "-b:a", f"{bitrate_kbps}k",
+        # bitexact keeps identical input producing identical bytes (no encoder/version tags),
+        # so re-runs hit the transcript cache
+        "-map_metadata", "-1", "-fflags", "+bitexact",
+        # MP4 muxers need a seekable output unless the moov atom goes first. Fragments are
+        # capped at 10s: a single fragment of several minutes of AAC comes out corrupt.
+        "-f", UPLOAD_CONTAINER, "-movflags", "frag_keyframe+empty_moov", "-frag_duration", "10000000", "pipe:1",
+    ]
+
+
+def iter_transcoded_chunks(path: str, plan: list[tuple[int, int]], memory_budget_mb: int = CHUNK_MEMORY_BUDGET_MB,
+                           bitrate_kbps: int = UPLOAD_BITRATE_KBPS,
+                           skip: Collection[int] = ()) -> Iterator[Chunk | None]:
+    """Cut and re-encode each planned span as low-bitrate speech audio.
+
+    PCM WAV spans are sliced by iter_wav_chunks and piped to ffmpeg, so the
+    samples are read once through the mmap; other formats are cut and
+    encoded by one ffmpeg process per chunk that seeks to the span. A chunk
+    that fails to encode is uploaded in its original encoding instead.
+    Spans in skip are neither cut nor encoded.
+
+    Yields:
+        Chunks, in order; None for skipped spans
+    """
+    budget_bytes = memory_budget_mb * 1024 * 1024
+    held_bytes = output_bytes = 0
+    start = time.perf_counter()
+    todo = [i for i in range(len(plan)) if i not in skip]
+
+    header = read_wav_header(path)
+    if header and header["format_tag"] in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+        sources = iter_wav_chunks(path, header=header, memory_budget_mb=memory_budget_mb, plan=plan, skip=skip)
+    else:
+        sources = (None for _ in plan)
+
+    for i, source in enumerate(sources):
+        if i in skip:
+            yield None
+            continue
+        if source is None:
+            cmd = cut_command(path, plan, i, transcode_args(bitrate_kbps))
+            stdin = None
+        elif isinstance(source, tuple):
+            cmd, stdin = ["ffmpeg", "-v", "error", "-f", "wav", "-i", "pipe:0"] + transcode_args(bitrate_kbps), source[1]
+        else:
+            cmd, stdin = ["ffmpeg", "-v", "error", "-i", source] + transcode_args(bitrate_kbps), None
+
+        try:
+            result = subprocess.run(cmd, input=stdin, capture_output=True)
+        finally:
+            if isinstance(source, str):
+                os.unlink(source)  # WAV slice spilled to a temp file by iter_wav_chunks
+        if result.returncode == 0:
+            name, data = f"chunk-{i + 1:03d}.{UPLOAD_EXT}", result.stdout
+        else:
+            print(f"Warning: transcode of chunk {i + 1} failed ({result.stderr.decode().strip()}), "
+                  "uploading it in its original encoding", file=sys.stderr)
+            name, data = cut_original(path, plan, i, source)
+
+        output_bytes += len(data)
+        chunk, held_bytes = keep_or_spill(name, data, held_bytes, budget_bytes)
+        if i == todo[-1]:
+            # Before the last yield: consumers stop pulling once they have every planned chunk
+            # Input bytes of just the encoded spans, when a resume skipped some
+            input_bytes = os.path.getsize(path) * sum(plan[j][1] - plan[j][0] for j in todo) // max(plan[-1][1], 1)
+            print(f"Transcoded {len(todo)} chunk(s) to {UPLOAD_EXT} at {bitrate_kbps}kbps: "
+                  f"{input_bytes / (1024 * 1024):.1f}MB -> {output_bytes / (1024 * 1024):.2f}MB "
+                  f"({input_bytes / max(output_bytes, 1):.1f}x smaller) in {time.perf_counter() - start:.1f}s",
+                  file=sys.stderr)
+        yield chunk
+
+
+def cut_original(path: str, plan: list[tuple[int, int]], i: int, source: Chunk | None = None) -> tuple[str, bytes]:
+    """The i-th planned chunk in the source encoding, as (name, bytes).
+
+    Args:
+        path: Path to the audio file
+        plan: (start_ms, end_ms) spans
+        i: Index of the span to cut
+        source: The WAV slice iter_wav_chunks produced for the span, if any
+    """
+    if isinstance(source, tuple):
+        return source
+    ext = Path(path).suffix.lower().lstrip(".")
+    if len(plan) == 1:
+        with open(path, "rb") as f:
+            return Path(path).name, f.read()
+    try:
+        result = subprocess.run(cut_command(path, plan, i, copy_args(ext)), capture_output=True, check=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"ffmpeg failed to cut chunk at {plan[i][0]}ms: {e.stderr.decode().strip()}") from e
+    return f"chunk-{i + 1:03d}.{ext}", result.stdout
+
+
+def transcribe_audio(chunk: Chunk, model: str = "gpt-4o-mini-transcribe") -> str:
+    """Transcribe an audio file using OpenAI's Whisper API.
+
+    Args:
+        chunk: Path to the audio file, or an in-memory (name, bytes) chunk
         model: OpenAI model to use for transcription
 
     Returns:
         Transcribed text
     """
-    from openai import OpenAI
+    import metrics
+    from api_client import get_client
+    from rate_limit import rate_limited
 
-    client = OpenAI()
-    with open(path, "rb") as f:
-        tx = client.audio.transcriptions.create(
-            model=model,
-            file=f,
-        )
-    return tx.text
+    # Shared pooled client: concurrent chunks reuse open connections
+    client = get_client()
+    # Fleet-wide budget: every worktree's uploads and title calls share one API key
+    with rate_limited(), metrics.span("upload", bytes=chunk_size(chunk), name=chunk_name(chunk), model=model):
+        if isinstance(chunk, tuple):
+            # The SDK uploads (filename, bytes) directly; the name carries the format
+            return client.audio.transcriptions.create(model=model, file=chunk).text
+
+        with open(chunk, "rb") as f:
+            return client.audio.transcriptions.create(model=model, file=f).text
+
+
+def transcribe_with_retry(chunk: Chunk, model: str = "gpt-4o-mini-transcribe",
+                          retries: int = MAX_CHUNK_RETRIES, backoff_s: float = RETRY_BACKOFF_S) -> str:
+    """Transcribe a single chunk, retrying failed attempts with exponential backoff.
+
+    Args:
+        chunk: Path to the audio file, or an in-memory (name, bytes) chunk
+        model: OpenAI model to use for transcription
+        retries: Number of retries after the first failed attempt
+        backoff_s: Base delay in seconds, doubled after every failed attempt
+
+    Returns:
+        Transcribed text
+    """
+    from rate_limit import is_retryable
+
+    # Every attempt takes its own limiter lease (the client itself never
+    # retries), so each 429 halves the fleet's concurrency and starts its cooldown
+    for attempt in range(retries + 1):
+        try:
+            return transcribe_audio(chunk, model)
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                raise
+            # Jitter keeps parallel chunks from retrying in lockstep
+            delay = backoff_s * (2 ** attempt) * (1 + random.random() / 2)
+            print(f"Upload of {chunk_name(chunk)} failed ({e}), retrying in {delay:.1f}s...", file=sys.stderr)
+            time.sleep(delay)
+
+
+def chunk_bytes(chunk: Chunk) -> bytes:
+    """Encoded audio bytes of a chunk."""
+    if isinstance(chunk, tuple):
+        return chunk[1]
+    with open(chunk, "rb") as f:
+        return f.read()
+
+
+def transcribe_cached(chunk: Chunk, model: str = "gpt-4o-mini-transcribe",
+                      use_cache: bool = True) -> tuple[str, bool]:
+    """Transcribe a chunk, reusing the stored transcript of identical audio.
+
+    Transcripts are cached under .aur2/cache/transcripts, keyed by a hash of
+    the model name and the chunk's encoded bytes.
+
+    Args:
+        chunk: Path to the audio file, or an in-memory (name, bytes) chunk
+        model: OpenAI model to use for transcription
+        use_cache: Check and fill the transcript cache
+
+    Returns:
+        Tuple of (text, cached) where cached is True if no upload was needed
+    """
+    if not use_cache:
+        return transcribe_with_retry(chunk, model), False
+
+    from cache import cache_get, cache_put, cache_key
+
+    key = cache_key(model, chunk_bytes(chunk))
+    text = cache_get(TRANSCRIPT_CACHE_NAMESPACE, key)
+    if text is not None:
+        return text, True
 
+    text = transcribe_with_retry(chunk, model)
+    cache_put(TRANSCRIPT_CACHE_NAMESPACE, key, text, TRANSCRIPT_CACHE_MAX_MB)
+    return text, False
 
-def transcribe_chunks(chunk_paths: list[str], original_path: str, model: str = "gpt-4o-mini-transcribe") -> str:
-    """Transcribe multiple audio chunks and concatenate the results.
+
+def span_cache_keys(audio_sha256: str, plan: list[tuple[int, int]], model: str, trim: bool,
+                    transcode: bool, bitrate_kbps: int = UPLOAD_BITRATE_KBPS) -> list[str]:
+    """Transcript cache key of each planned span, derived from the source audio.
+
+    Trimming, cutting and transcoding are deterministic, so the bytes of a
+    chunk follow from the source file, its span and the preprocessing
+    settings. Keying on those instead of the encoded bytes lets a cached
+    chunk be found before it is cut or encoded.
+
+    Args:
+        audio_sha256: SHA-256 of the original audio file
+        plan: (start_ms, end_ms) spans, on the timeline of the file that is cut
+        model: OpenAI model used for transcription
+        trim: Whether silence was trimmed before planning
+        transcode: Whether chunks are transcoded for upload
+        bitrate_kbps: Target bitrate of transcoded chunks
+
+    Returns:
+        One key per span, in plan order
+    """
+    from cache import cache_key
+    from silence import SILENCE_THRESHOLD_DBFS, MAX_PAUSE_MS, KEEP_PAUSE_MS, EDGE_PADDING_MS
+
+    settings = {"trim": [SILENCE_THRESHOLD_DBFS, MAX_PAUSE_MS, KEEP_PAUSE_MS, EDGE_PADDING_MS] if trim else None,
+                "transcode": [UPLOAD_ENCODER, bitrate_kbps, TRANSCODE_MIN_RATIO] if transcode else None}
+    prefix = json.dumps(settings, sort_keys=True)
+    # The span count is part of the key: a lone span is uploaded whole, others are cut
+    return [cache_key("span", model, audio_sha256, prefix, f"{start_ms}-{end_ms}/{len(plan)}")
+            for start_ms, end_ms in plan]
+
+
+def transcribe_chunks(chunks: Iterable[Chunk | None], original_path: str, model: str = "gpt-4o-mini-transcribe",
+                      jobs: int = DEFAULT_JOBS, total: int | None = None, use_cache: bool = True,
+                      completed: dict[int, str] | None = None,
+                      on_chunk_done: Callable[[int, str], None] | None = None,
+                      executor: ThreadPoolExecutor | None = None) -> str:
+    """Transcribe multiple audio chunks concurrently and concatenate the results.
+
+    Chunks are uploaded by a pool of up to ``jobs`` threads. Each chunk is
+    retried independently, and the text is joined in original chunk order
+    regardless of completion order. ``chunks`` may be a generator such as
+    iter_audio_chunks, in which case early chunks upload while later ones
+    are still being cut.
+
+    If a chunk fails for good, the remaining chunks still finish so their
+    transcripts land in the cache, and the first error is raised at the end.
+    A re-run then only uploads the chunks that failed.
 
     Args:
-        chunk_paths: List of paths to audio chunk files
+        chunks: Chunk paths or in-memory (name, bytes) chunks, in order; None
+            for a chunk in completed that was never cut
         original_path: Original audio file path (to know which files are temp)
         model: OpenAI model to use for transcription
+        jobs: Maximum number of chunks transcribed at the same time
+        total: Expected number of chunks, for progress output
+        use_cache: Reuse and store per-chunk transcripts in .aur2/cache
+        completed: Texts of chunks finished by an earlier run, keyed by index;
+            those chunks are skipped
+        on_chunk_done: Called with (index, text) in the calling thread as each
+            chunk finishes, e.g. to record progress
+        executor: Upload pool shared with other files (jobs is then ignored);
+            by default a pool of ``jobs`` threads is created for this call
 
     Returns:
         Concatenated transcribed text from all chunks
+
+    Raises:
+        ValueError: If a chunk is larger than MAX_FILE_SIZE_MB (nothing more is submitted)
     """
-    transcripts = []
+    count = 0
+    temp_paths: list[str] = []
+    transcripts: dict[int, str] = dict(completed or {})
+    errors: dict[int, Exception] = {}
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ThreadPoolExecutor(max_workers=max(1, jobs))
+    futures = {}
     try:
-        for i, chunk_path in enumerate(chunk_paths):
-            print(f"Transcribing chunk {i + 1}/{len(chunk_paths)}...", file=sys.stderr)
-            transcript = transcribe_audio(chunk_path, model)
-            transcripts.append(transcript)
+        for i, chunk in enumerate(chunks):
+            count += 1
+            if chunk is None:
+                continue  # Not cut because it is already in completed
+            if isinstance(chunk, str) and chunk != original_path:
+                temp_paths.append(chunk)
+            size_mb = chunk_size(chunk) / (1024 * 1024)
+            if size_mb > MAX_FILE_SIZE_MB:
+                raise ValueError(f"Chunk {i + 1} too large ({size_mb:.1f}MB). Maximum is {MAX_FILE_SIZE_MB}MB.")
+            if i not in transcripts:
+                futures[executor.submit(transcribe_cached, chunk, model, use_cache)] = i
+
+        total = total or count
+        if transcripts:
+            print(f"Skipping {len(transcripts)}/{total} chunks already transcribed", file=sys.stderr)
+        done = len(transcripts)
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                transcripts[i], cached = future.result()
+            except Exception as e:
+                errors[i] = e
+                print(f"Chunk {i + 1}/{total} failed: {e}", file=sys.stderr)
+                continue
+            done += 1
+            if on_chunk_done:
+                on_chunk_done(i, transcripts[i])
+            if total > 1:
+                source = " from cache" if cached else ""
+                print(f"Transcribed chunk {i + 1}/{total}{source} ({done}/{total} done)", file=sys.stderr)
     finally:
-        # Clean up temporary chunk files
-        for chunk_path in chunk_paths:
-            if chunk_path != original_path and os.path.exists(chunk_path):
+        if owns_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            # Don't leave this file's queued uploads behind in the shared pool
+            for future in futures:
+                future.cancel()
+            wait(futures)
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+        # Clean up chunks that were spilled to temp files
+        for chunk_path in temp_paths:
+            if os.path.exists(chunk_path):
                 os.unlink(chunk_path)
 
-    return " ".join(transcripts)
+    if errors:
+        raise errors[min(errors)]
+
+    return " ".join(transcripts[i] for i in range(count))
+
+
+def ordered_stream(write: Callable[[str], None]) -> Callable[[int, str], None]:
+    """Write chunk texts in order, each as soon as it and every earlier chunk is done.
+
+    Chunks are separated by a space, so the written text is exactly the
+    joined transcript.
+
+    Args:
+        write: Receives successive pieces of transcript text
+
+    Returns:
+        on_chunk_done callback for transcribe_file and transcribe_chunks
+    """
+    lock = threading.Lock()
+    finished: dict[int, str] = {}
+    state = {"next": 0}
+
+    def on_chunk_done(i: int, text: str) -> None:
+        with lock:
+            finished[i] = text
+            while state["next"] in finished:
+                head = state["next"]
+                text = finished.pop(head)
+                write(text if head == 0 else " " + text)
+                state["next"] += 1
+
+    return on_chunk_done
+
+
+def transcribe_file(path: str, model: str = "gpt-4o-mini-transcribe", jobs: int = DEFAULT_JOBS,
+                    chunk_duration_ms: int = CHUNK_DURATION_MS, snap_to_silence: bool = True,
+                    trim: bool = True, transcode: bool = True, use_cache: bool = True,
+                    memory_budget_mb: int = CHUNK_MEMORY_BUDGET_MB, resume: bool = False,
+                    on_chunk_done: Callable[[int, str], None] | None = None,
+                    executor: ThreadPoolExecutor | None = None) -> str:
+    """Run the whole pipeline for one file: preprocess, plan, cut, transcribe.
+
+    Chunked runs keep a progress manifest next to the audio (see manifest.py)
+    that is updated as each chunk finishes and removed on success. With
+    resume, a manifest matching the audio and settings supplies the chunk
+    plan and the finished chunks, so only the missing ones are uploaded.
+
+    Transcripts are cached per span of the source audio (see
+    span_cache_keys) and looked up before cutting, so cached chunks are
+    never cut, encoded or uploaded.
+
+    Args:
+        path: Path to the audio file
+        model: OpenAI model to use for transcription
+        jobs: Maximum number of chunks transcribed at the same time
+        chunk_duration_ms: Target duration of each chunk in milliseconds
+        snap_to_silence: Move chunk cuts into nearby pauses
+        trim: Trim edge silence and collapse long pauses before upload
+        transcode: Re-encode to low-bitrate speech audio before upload
+        use_cache: Reuse and store per-chunk transcripts in .aur2/cache
+        memory_budget_mb: Chunk bytes to keep in memory before spilling to temp files
+        resume: Continue from the progress manifest left by an earlier run
+        on_chunk_done: Called with (index, text) for every chunk, including
+            ones restored from the manifest, e.g. to start work on the opening
+        executor: Upload pool shared with other files, see transcribe_chunks
+
+    Returns:
+        Transcribed text
+
+    Raises:
+        ValueError: If a chunk to upload is larger than MAX_FILE_SIZE_MB
+    """
+    import metrics
+    from cache import cache_get, cache_put
+    from manifest import (manifest_path_for, file_sha256, new_manifest, load_manifest, save_manifest,
+                          completed_chunks)
+
+    manifest_path = manifest_path_for(path)
+    settings = {
+        "model": model,
+        "chunk_duration_ms": chunk_duration_ms,
+        "snap_to_silence": snap_to_silence,
+        "trim": trim,
+        "transcode": transcode,
+    }
+    audio_sha256 = file_sha256(path)
+    manifest = load_manifest(manifest_path, audio_sha256, settings) if resume else None
+
+    # Trim silence first: fewer seconds to upload, bill and transcribe. Trimming (and the
+    # per-chunk transcode below) is deterministic, so a resumed run cuts the same chunks.
+    upload_path, upload_rms = path, None
+    if trim:
+        with metrics.span("trim", bytes=os.path.getsize(path)) as fields:
+            upload_path, upload_rms = compact_for_upload(path)
+            fields["upload_bytes"] = os.path.getsize(upload_path)
+
+    try:
+        if manifest:
+            plan = [tuple(span) for span in manifest["plan"]]
+        else:
+            with metrics.span("probe") as fields:
+                duration_ms = get_audio_duration_ms(upload_path)
+                fields["audio_s"] = duration_ms / 1000
+            # Cuts snap to pauses found by the trim analysis; only untrimmed runs analyse here
+            plan = plan_chunks(upload_path, duration_ms, chunk_duration_ms, snap_to_silence=snap_to_silence,
+                               rms=upload_rms)
+            if len(plan) > 1:
+                print(f"Audio is {duration_ms / 1000 / 60:.1f} minutes, splitting into {len(plan)} chunks...",
+                      file=sys.stderr)
+            manifest = new_manifest(audio_sha256, settings, plan)
+
+        keys = span_cache_keys(audio_sha256, plan, model, trim, transcode) if use_cache else None
+        # A single-chunk file has nothing worth resuming
+        progress = {"save": len(plan) > 1}
+
+        def record_progress(i: int, text: str) -> None:
+            if keys and i not in completed:
+                cache_put(TRANSCRIPT_CACHE_NAMESPACE, keys[i], text, TRANSCRIPT_CACHE_MAX_MB)
+            if progress["save"]:
+                manifest["chunks"][str(i)] = text
+                try:
+                    save_manifest(manifest_path, manifest)
+                except OSError as e:
+                    # e.g. a read-only audio directory: losing resumability beats losing the run
+                    progress["save"] = False
+                    print(f"Warning: could not write progress manifest ({e}), this run can't be resumed",
+                          file=sys.stderr)
+            if on_chunk_done:
+                on_chunk_done(i, text)
+
+        completed = completed_chunks(manifest)
+        if on_chunk_done:
+            for i, text in sorted(completed.items()):
+                on_chunk_done(i, text)
+
+        # Look up cached spans before anything is cut, so a cached chunk costs no encode
+        if keys:
+            cached = {i: text for i, key in enumerate(keys)
+                      if i not in completed and (text := cache_get(TRANSCRIPT_CACHE_NAMESPACE, key)) is not None}
+            completed.update(cached)
+            for i, text in sorted(cached.items()):
+                record_progress(i, text)
+
+        # Chunks are transcoded as they are cut, overlapping the uploads of earlier chunks.
+        # Finished chunks are skipped before ffmpeg runs, so a resume only encodes what it uploads.
+        chunks = measured_chunks(iter_audio_chunks(upload_path, memory_budget_mb=memory_budget_mb, plan=plan,
+                                                   transcode=transcode, skip=completed.keys()), plan,
+                                 transcode=transcode)
+        # Uploaded chunks are cached by span in record_progress, not again by their bytes
+        transcript = transcribe_chunks(chunks, upload_path, model, jobs=jobs, total=len(plan), use_cache=False,
+                                       completed=completed, on_chunk_done=record_progress, executor=executor)
+    finally:
+        if upload_path != path and os.path.exists(upload_path):
+            os.unlink(upload_path)
+
+    try:
+        manifest_path.unlink(missing_ok=True)
+    except OSError:
+        pass  # Left over in a directory we can't write to; a later resume still matches it
+    return transcript
 
 
 def main():
@@ -118,7 +1066,6 @@ def main():
     # Check .aur2/.env first (standard location), then .env in current dir
     try:
         from dotenv import load_dotenv
-        from pathlib import Path
         aur2_env = Path(".aur2/.env")
         if aur2_env.exists():
             load_dotenv(aur2_env)
@@ -127,12 +1074,83 @@ def main():
     except ImportError:
         pass  # dotenv not installed, rely on environment variables
 
-    if len(sys.argv) < 2:
-        print("Error: No audio file path provided", file=sys.stderr)
-        print(f"Usage: python .aur2/scripts/transcribe.py <audio-file-path>", file=sys.stderr)
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Transcribe audio files using OpenAI's Whisper API",
+        epilog="Examples:\n"
+               "  python .aur2/scripts/transcribe.py memo.m4a\n"
+               "  python .aur2/scripts/transcribe.py long-meeting.wav --jobs 8\n"
+               "  python .aur2/scripts/transcribe.py long-meeting.wav --chunk-minutes 1.5 --jobs 8\n"
+               "  python .aur2/scripts/transcribe.py long-meeting.wav --resume\n"
+               "  python .aur2/scripts/transcribe.py long-meeting.wav --stream | python .aur2/scripts/generate_title.py\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        "audio_path",
+        type=str,
+        help="Path to the audio file to transcribe"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of chunks to transcribe concurrently (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--chunk-minutes",
+        type=float,
+        default=CHUNK_DURATION_MS / 60000,
+        help=f"Target chunk length in minutes for long files (default: {CHUNK_DURATION_MS / 60000:g})"
+    )
+    parser.add_argument(
+        "--fixed-cuts",
+        action="store_true",
+        help="Cut chunks at exact intervals instead of snapping cuts to pauses"
+    )
+    parser.add_argument(
+        "--no-trim",
+        action="store_true",
+        help="Upload the audio as-is instead of trimming silence and collapsing long pauses"
+    )
+    parser.add_argument(
+        "--no-transcode",
+        action="store_true",
+        help=f"Upload the original encoding instead of {UPLOAD_BITRATE_KBPS}kbps mono speech audio"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Upload every chunk even if an identical one was transcribed before"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its progress manifest, uploading only missing chunks"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write each chunk to stdout as soon as it and all earlier chunks are transcribed"
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Transcribe in this process even if the warm daemon (memo_daemon.py) is running"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings, bytes and peak memory (spans are always saved to .aur2/metrics)"
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=int,
+        default=CHUNK_MEMORY_BUDGET_MB,
+        help=f"Chunk bytes to keep in memory before spilling to temp files (default: {CHUNK_MEMORY_BUDGET_MB})"
+    )
 
-    audio_path = sys.argv[1]
+    args = parser.parse_args()
+    audio_path = args.audio_path
 
     # Check if file exists
     if not os.path.exists(audio_path):
@@ -146,12 +1164,36 @@ def main():
         print(f"Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}", file=sys.stderr)
         sys.exit(1)
 
-    # Check file size
-    file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-    if file_size_mb > MAX_FILE_SIZE_MB:
-        print(f"Error: File too large ({file_size_mb:.1f}MB). Maximum is {MAX_FILE_SIZE_MB}MB.", file=sys.stderr)
-        print("Tip: Compress with ffmpeg: ffmpeg -i input.m4a -vn -ac 1 -ar 16000 -b:a 48k output.m4a", file=sys.stderr)
-        sys.exit(1)
+    options = {
+        "jobs": args.jobs,
+        "chunk_duration_ms": int(args.chunk_minutes * 60 * 1000),
+        "snap_to_silence": not args.fixed_cuts,
+        "trim": not args.no_trim,
+        "transcode": not args.no_transcode,
+        "use_cache": not args.no_cache,
+        "memory_budget_mb": args.memory_budget_mb,
+        "resume": args.resume,
+    }
+
+    def write_stdout(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    import metrics
+    metrics.start_run("transcribe", profile=args.profile)
+
+    # Hand the job to the warm daemon if one is running (it has everything loaded already)
+    if not args.no_daemon:
+        from memo_daemon import call_daemon
+        try:
+            transcript = call_daemon("transcribe", audio_path=str(Path(audio_path).resolve()), options=options,
+                                     stream=args.stream, on_text=write_stdout, **metrics.run_context())
+        except RuntimeError as e:
+            print(f"Error during transcription: {e}", file=sys.stderr)
+            sys.exit(1)
+        if transcript is not None:
+            print("" if args.stream else transcript)
+            return
 
     # Check for API key
     if not os.environ.get("OPENAI_API_KEY"):
@@ -174,23 +1216,20 @@ def main():
         print("Install dependencies: pip install -r .aur2/scripts/requirements.txt", file=sys.stderr)
         sys.exit(1)
 
-    # Check duration and split into chunks if needed
     try:
-        duration_ms = get_audio_duration_ms(audio_path)
-        duration_min = duration_ms / 1000 / 60
-
-        if duration_ms > CHUNK_THRESHOLD_MS:
-            num_chunks = (duration_ms + CHUNK_DURATION_MS - 1) // CHUNK_DURATION_MS
-            print(f"Audio is {duration_min:.1f} minutes, splitting into {num_chunks} chunks...", file=sys.stderr)
-            chunk_paths = split_audio_into_chunks(audio_path)
-            transcript = transcribe_chunks(chunk_paths, audio_path)
-        else:
-            transcript = transcribe_audio(audio_path)
-
-        print(transcript)
+        with metrics.span("transcribe"):
+            if args.stream:
+                transcribe_file(audio_path, on_chunk_done=ordered_stream(write_stdout), **options)
+                print()
+            else:
+                print(transcribe_file(audio_path, **options))
     except Exception as e:
         print(f"Error during transcription: {e}", file=sys.stderr)
+        if args.no_transcode and "too large" in str(e):
+            print("Tip: Drop --no-transcode to compress it automatically", file=sys.stderr)
         sys.exit(1)
+    finally:
+        metrics.finish_run()
 
 
 if __name__ == "__main__":
@@ -59,13 +59,25 @@ echo "--- KNOWLEDGE BASE ---"
 if [ -f "$REPO_DIR/knowledge-base/INDEX.md" ]; then
     head -3 "$REPO_DIR/knowledge-base/INDEX.md"
     echo ""
-    KB_FILES=$(find "$REPO_DIR/knowledge-base" -name "*.md" ! -name "INDEX.md" ! -name "README.md" | wc -l | tr -d ' ')
-    echo "  Content files: $KB_FILES"
+    # The indexer only re-parses files changed since its last run
+    if ! python3 "$SCRIPT_DIR/kb_index.py" stats 2>/dev/null; then
+        KB_FILES=$(find "$REPO_DIR/knowledge-base" -name "*.md" ! -name "INDEX.md" ! -name "README.md" | wc -l | tr -d ' ')
+        echo "  Content files: $KB_FILES"
+    fi
 else
     echo "  INDEX.md not found"
 fi
 echo ""
 
+# Shared API budget (transcription and titling across all worktrees)
+echo "--- API RATE LIMIT ---"
+if [ -f "$REPO_DIR/.aur2/scripts/rate_limit.py" ]; then
+    python3 "$REPO_DIR/.aur2/scripts/rate_limit.py" status 2>/dev/null || echo "  Rate limiter unavailable"
+else
+    echo "  Rate limiter not installed"
+fi
+echo ""
+
 # Recent activity
 echo "--- RECENT COMMITS ---"
 git log --oneline --all -10 2>/dev/null || echo "  No commits yet"
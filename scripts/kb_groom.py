@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""Find near-duplicate passages and contradiction candidates in the knowledge base.
+
+Usage:
+    python3 scripts/kb_groom.py                     # Ranked JSON report on stdout
+    python3 scripts/kb_groom.py --output groom.json --changed-only
+    python3 scripts/kb_groom.py --threshold 0.6 --limit 20
+
+Input for /hive.groom. Three kinds of findings, each ranked by score:
+
+    duplicates      Pairs of KB files with passages (the text under one
+                    heading) that overlap heavily. Each passage is reduced
+                    to the set of its SHINGLE_WORDS-word shingles and a
+                    NUM_PERM-value MinHash signature; LSH banding puts
+                    passages that agree on a whole band into one bucket, so
+                    only passages sharing a bucket are compared. Finding
+                    the pairs above the similarity threshold takes time
+                    proportional to the number of passages, not its square.
+                    Frontmatter differences between the two files are
+                    included: the older or less confident copy is the one
+                    to fix.
+    contradictions  Pairs of KB files that talk about the same things
+                    (shared named entities and at least one shared tag) but
+                    whose frontmatter disagrees: different confidence, or
+                    ingested / last_verified dates DATE_GAP_DAYS or more
+                    apart. These are candidates for a human or agent to
+                    read side by side, not proven conflicts. Entities found
+                    in too many files (the company name) are ignored, which
+                    also keeps pair counting bounded.
+    boilerplate     Passages repeated in more than MAX_BUCKET places
+                    (templates, pasted disclaimers), reported once per group
+                    instead of pair by pair; the score is the group size.
+
+Each finding names the files, the evidence, and a suggested bead title, so
+the groom skill can turn it into a remediation bead directly.
+
+Incremental: the scan starts from kb_index.update_index(), and only files
+whose content hash changed since the last scan are re-read. Their passage
+signatures and entities are cached in knowledge-base/.groom/. With
+--changed-only the report keeps only findings that involve a file changed
+since the previous scan (every file counts as changed on the first one).
+
+Requirements:
+    pip install numpy
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import zlib
+import argparse
+from collections import Counter
+from datetime import date, datetime
+from itertools import combinations
+from pathlib import Path
+
+from kb_index import find_kb_dir, parse_frontmatter, update_index
+
+STORE_DIR = ".groom"  # Inside the KB directory; derived, so gitignored
+STORE_VERSION = 1
+SHINGLE_WORDS = 5  # Words per shingle
+MIN_PASSAGE_WORDS = 30  # Shorter passages (stubs, lists of links) are not compared
+NUM_PERM = 128  # MinHash values per passage
+BANDS = 32  # LSH bands of NUM_PERM // BANDS values; pairs at 0.5 similarity collide ~87% of the time
+MAX_BUCKET = 50  # Bigger LSH buckets are shared boilerplate (templates), not duplication
+DUPLICATE_THRESHOLD = 0.5  # Minimum estimated Jaccard similarity between passages
+HASH_SEED = 1  # Fixed, so cached signatures stay comparable between runs
+SHINGLE_MIX = 0x9E3779B97F4A7C15  # Odd multiplier combining word hashes into a shingle hash
+MINHASH_BATCH = 2 ** 15  # Shingles hashed per batch (NUM_PERM x this uint64s, 32MB)
+MIN_SHARED_ENTITIES = 2
+MAX_ENTITY_SHARE = 0.01  # Entities in more than this share of files are too common to link them...
+MIN_ENTITY_CAP = 20  # ...unless that is fewer than this many files (small KBs)
+DATE_GAP_DAYS = 30  # Frontmatter dates this far apart count as a difference
+DEFAULT_LIMIT = 50  # Findings of each kind in the report
+CONFIDENCE_RANK = {"low": 0, "medium": 1, "high": 2}
+
+WORD = re.compile(r"[a-z0-9]+")
+HEADING = re.compile(r"^#{1,6}\s+(.*?)\s*#*\s*$", re.MULTILINE)
+ENTITY = re.compile(r"\b[A-Z][A-Za-z0-9]*(?:[-&'][A-Za-z0-9]+)*(?:[ \t]+[A-Z][A-Za-z0-9]*(?:[-&'][A-Za-z0-9]+)*)*")
+SENTENCE_END = set(".!?:;>*-|\n")
+
+# Capitalized for grammar, not because they name something; months and days
+# would otherwise link every file that mentions a date
+NOT_ENTITIES = set("""
+a about after all also an and any are as at be because before both but by can could did do does
+for from had has have he her here his how i if in into is it its just may me might more most my
+no not now of on once one only or our out over per she should since so some such than that the
+their them then there these they this those though through to too under until up us was we were
+what when where whether which while who why will with would yes you your
+january february march april may june july august september october november december
+jan feb mar apr jun jul aug sep sept oct nov dec
+monday tuesday wednesday thursday friday saturday sunday today tomorrow yesterday
+q1 q2 q3 q4 h1 h2 fy note notes todo tbd see status summary update next
+""".split())
+
+
+def _require_numpy():
+    """Import numpy, or exit with install instructions."""
+    try:
+        import numpy as np
+        return np
+    except ImportError:
+        print("Error: kb_groom.py needs numpy (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+
+
+def split_passages(body: str) -> list[tuple[str, str]]:
+    """Split a markdown body at its headings.
+
+    Returns:
+        List of (heading, text) pairs; text before the first heading has heading ""
+    """
+    passages = []
+    heading, start = "", 0
+    for match in HEADING.finditer(body):
+        passages.append((heading, body[start:match.start()]))
+        heading, start = match.group(1), match.end()
+    passages.append((heading, body[start:]))
+    return [(heading, text) for heading, text in passages if text.strip()]
+
+
+_word_hashes: dict[str, int] = {}  # Word -> CRC32; words repeat, so hash each once
+
+
+def shingle_hashes(text: str):
+    """32-bit hashes of the distinct SHINGLE_WORDS-word shingles in text.
+
+    Words are hashed once and combined per shingle in numpy, rather than
+    hashing every joined shingle string.
+
+    Returns:
+        Sorted uint64 array, empty if text has fewer than MIN_PASSAGE_WORDS words
+    """
+    np = _require_numpy()
+    words = WORD.findall(text.lower())
+    if len(words) < MIN_PASSAGE_WORDS:
+        return np.zeros(0, dtype=np.uint64)
+    for word in set(words).difference(_word_hashes):
+        _word_hashes[word] = zlib.crc32(word.encode("utf-8"))
+    ids = np.fromiter(map(_word_hashes.__getitem__, words), dtype=np.uint64, count=len(words))
+    count = len(words) - SHINGLE_WORDS + 1
+    combined = np.zeros(count, dtype=np.uint64)
+    for offset in range(SHINGLE_WORDS):
+        combined = combined * np.uint64(SHINGLE_MIX) + ids[offset:offset + count]  # Wraps mod 2**64
+    return np.unique(combined >> np.uint64(32))
+
+
+def minhash(shingle_sets: list):
+    """MinHash signatures of shingle sets: per set, the minimum of each of NUM_PERM permuted hashes.
+
+    The permutations are multiply-shift hashes h(x) = ((a * x + b) mod 2**64) >> 32
+    with random odd a, which need no division.
+    Sets are processed MINHASH_BATCH shingles at a time, each batch as one
+    array operation.
+
+    Returns:
+        (len(shingle_sets), NUM_PERM) uint32 array
+    """
+    np = _require_numpy()
+    rng = np.random.default_rng(HASH_SEED)
+    a = (rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1))[:, None]
+    b = rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)[:, None]
+    signatures = np.zeros((len(shingle_sets), NUM_PERM), dtype=np.uint32)
+
+    start = 0
+    while start < len(shingle_sets):
+        end, total = start, 0
+        while end < len(shingle_sets) and (end == start or total + len(shingle_sets[end]) <= MINHASH_BATCH):
+            total += len(shingle_sets[end])
+            end += 1
+        batch = shingle_sets[start:end]
+        offsets = np.cumsum([0] + [len(values) for values in batch[:-1]])
+        hashed = (a * np.concatenate(batch)[None, :] + b) >> np.uint64(32)  # Wraps mod 2**64, then top half
+        signatures[start:end] = np.minimum.reduceat(hashed, offsets, axis=1).T
+        start = end
+    return signatures
+
+
+def extract_entities(body: str) -> list[str]:
+    """Named things a file mentions: capitalized phrases that aren't just sentence-initial words.
+
+    Heading lines are skipped (title case would make every heading word an
+    entity). Phrases are lowercased so "Billing Team" and "billing team"
+    match.
+    """
+    entities = set()
+    for line in body.split("\n"):
+        if line.startswith("#"):
+            continue
+        for match in ENTITY.finditer(line):
+            words = match.group().split()
+            leading = len(words)
+            while words and words[0].lower() in NOT_ENTITIES:
+                words = words[1:]
+            if not words:
+                continue
+            if len(words) == 1:
+                word = words[0]
+                preceding = line[:match.start()].rstrip()
+                sentence_start = leading == 1 and (not preceding or preceding[-1] in SENTENCE_END)
+                # A lone capitalized word at a sentence start is usually just a word;
+                # keep it only if it looks like a name anyway (API, GitHub, Q3-launch)
+                if sentence_start and word[1:].islower():
+                    continue
+                if len(word) < 2:
+                    continue
+            entities.add(" ".join(words).lower())
+    return sorted(entities)
+
+
+def load_state(store: Path) -> tuple[dict, object]:
+    """The cached scan (file metadata and the passage signature matrix), or an empty one."""
+    np = _require_numpy()
+    empty = {"version": STORE_VERSION, "num_perm": NUM_PERM, "shingle_words": SHINGLE_WORDS, "files": {}}
+    try:
+        state = json.loads((store / "state.json").read_text(encoding="utf-8"))
+        signatures = np.load(store / "signatures.npy")
+        if (state.get("version") == STORE_VERSION and state.get("num_perm") == NUM_PERM
+                and state.get("shingle_words") == SHINGLE_WORDS and signatures.shape[1:] == (NUM_PERM,)):
+            return state, signatures
+    except (FileNotFoundError, ValueError, json.JSONDecodeError):
+        pass
+    return empty, np.zeros((0, NUM_PERM), dtype=np.uint32)
+
+
+def save_state(store: Path, state: dict, signatures) -> None:
+    """Write the signature matrix, then the metadata that describes it (each atomically)."""
+    np = _require_numpy()
+    store.mkdir(exist_ok=True)
+    with open(store / "signatures.tmp", "wb") as f:
+        np.save(f, signatures)
+    os.replace(store / "signatures.tmp", store / "signatures.npy")
+    temp_path = store / "state.tmp"
+    temp_path.write_text(json.dumps(state, separators=(",", ":")), encoding="utf-8")
+    os.replace(temp_path, store / "state.json")
+
+
+def update_state(kb_dir: Path, index: dict) -> tuple[dict, object, list[str]]:
+    """Bring the cached passages, signatures and entities up to date with the frontmatter index.
+
+    Files whose SHA-256 in the index matches the cache keep their rows; the
+    rest are re-read and re-signed.
+
+    Returns:
+        Tuple of (state, signatures, changed paths)
+    """
+    np = _require_numpy()
+    store = kb_dir / STORE_DIR
+    state, old_signatures = load_state(store)
+    old_files = state["files"]
+    files, blocks, changed = {}, [], []
+    pending = []  # (position in blocks, shingle sets) of re-read files
+    rows = 0
+
+    for rel_path, entry in index["files"].items():
+        cached = old_files.get(rel_path)
+        if cached and cached["sha256"] == entry["sha256"]:
+            start, count = cached["rows"]
+            blocks.append(old_signatures[start:start + count])
+        else:
+            text = (kb_dir / rel_path).read_text(encoding="utf-8", errors="replace")
+            _, body = parse_frontmatter(text)
+            passages, shingle_sets = [], []
+            for heading, passage in split_passages(body):
+                hashes = shingle_hashes(passage)
+                if len(hashes):
+                    passages.append([heading, len(hashes)])
+                    shingle_sets.append(hashes)
+            pending.append((len(blocks), shingle_sets))
+            blocks.append(None)
+            cached = {"sha256": entry["sha256"], "passages": passages, "entities": extract_entities(body)}
+            changed.append(rel_path)
+        count = len(cached["passages"])
+        files[rel_path] = {**cached, "rows": [rows, count]}
+        rows += count
+
+    if pending:
+        signed = minhash([hashes for _, shingle_sets in pending for hashes in shingle_sets])
+        row = 0
+        for position, shingle_sets in pending:
+            blocks[position] = signed[row:row + len(shingle_sets)]
+            row += len(shingle_sets)
+
+    removed = set(old_files) - set(files)
+    signatures = np.concatenate(blocks) if blocks else np.zeros((0, NUM_PERM), dtype=np.uint32)
+    state["files"] = files
+    if changed or removed or not (store / "state.json").exists():
+        save_state(store, state, signatures)
+    return state, signatures, changed
+
+
+def candidate_pairs(signatures, owners) -> tuple[list[tuple[int, int]], set]:
+    """Passage pairs (from different files) that share at least one LSH bucket.
+
+    Args:
+        signatures: (passages, NUM_PERM) MinHash matrix
+        owners: File number of each passage row
+
+    Returns:
+        Tuple of (sorted row pairs, row tuples of the oversized buckets skipped)
+    """
+    np = _require_numpy()
+    rows_per_band = NUM_PERM // BANDS
+    pairs, oversized = set(), set()
+    if len(signatures) < 2:
+        return [], oversized
+
+    for band in range(BANDS):
+        # Fold the band's values into one uint64 key; a rare collision only adds a
+        # candidate that fails the similarity check
+        columns = signatures[:, band * rows_per_band:(band + 1) * rows_per_band].astype(np.uint64)
+        keys = columns[:, 0]
+        for column in range(1, rows_per_band):
+            keys = keys * np.uint64(SHINGLE_MIX) + columns[:, column]
+        order = np.argsort(keys, kind="stable")
+        ordered = keys[order]
+        starts = np.concatenate(([0], np.flatnonzero(ordered[1:] != ordered[:-1]) + 1))
+        sizes = np.diff(np.append(starts, len(keys)))
+        for start, size in zip(starts[sizes > 1].tolist(), sizes[sizes > 1].tolist()):
+            members = order[start:start + size].tolist()
+            if size > MAX_BUCKET:
+                oversized.add(tuple(sorted(members)))
+                continue
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    if owners[first] != owners[second]:
+                        pairs.add((first, second) if first < second else (second, first))
+    return sorted(pairs), oversized
+
+
+def find_duplicates(state: dict, signatures, paths: list[str], threshold: float) -> tuple[list[dict], list[dict]]:
+    """Near-duplicate passages, collapsed to one finding per pair of files.
+
+    Passages repeated in more than MAX_BUCKET places are not paired up;
+    they are reported once per group as boilerplate instead.
+
+    Returns:
+        Tuple of (duplicate findings, boilerplate findings)
+    """
+    np = _require_numpy()
+    owners = np.zeros(len(signatures), dtype=np.int64)
+    passages = []
+    for number, path in enumerate(paths):
+        start, count = state["files"][path]["rows"]
+        owners[start:start + count] = number
+        passages.extend(state["files"][path]["passages"])
+
+    pairs, oversized = candidate_pairs(signatures, owners)
+    boilerplate, covered = [], set()
+    for members in sorted(oversized, key=len, reverse=True):
+        if len(covered.intersection(members)) * 2 > len(members):
+            continue  # The same group, seen through another band
+        covered.update(members)
+        heading = Counter(passages[row][0] for row in members).most_common(1)[0][0]
+        files = sorted({paths[owners[row]] for row in members})
+        boilerplate.append({"files": files, "score": len(members), "heading": heading})
+    if not pairs:
+        return [], boilerplate
+    left, right = np.array(pairs).T
+    similarity = (signatures[left] == signatures[right]).mean(axis=1)
+
+    by_files: dict = {}
+    for first, second, score in zip(left.tolist(), right.tolist(), similarity.tolist()):
+        if score < threshold:
+            continue
+        key = (owners[first], owners[second])
+        by_files.setdefault(key, []).append({
+            "headings": [passages[first][0], passages[second][0]],
+            "similarity": round(score, 3),
+        })
+
+    findings = []
+    for (a, b), matches in by_files.items():
+        matches.sort(key=lambda match: -match["similarity"])
+        findings.append({"files": [paths[a], paths[b]], "score": matches[0]["similarity"], "passages": matches})
+    return findings, boilerplate
+
+
+def _date(value) -> date | None:
+    """Parse an ISO date from frontmatter, or None."""
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def frontmatter_differences(first: dict, second: dict) -> dict:
+    """Frontmatter fields that disagree between two index entries: field -> [first, second]."""
+    differences = {}
+    if first["confidence"] != second["confidence"] and (first["confidence"] or second["confidence"]):
+        differences["confidence"] = [first["confidence"], second["confidence"]]
+    for field in ("last_verified", "ingested"):
+        a, b = _date(first[field]), _date(second[field])
+        if a and b and abs((a - b).days) >= DATE_GAP_DAYS:
+            differences[field] = [first[field], second[field]]
+    return differences
+
+
+def _authoritative(first: dict, second: dict) -> str | None:
+    """The entry to treat as authoritative: more recently verified, then more confident."""
+    def key(entry):
+        return (_date(entry["last_verified"]) or date.min, CONFIDENCE_RANK.get(entry["confidence"], -1))
+    if key(first) == key(second):
+        return None
+    return first["path"] if key(first) > key(second) else second["path"]
+
+
+def find_contradictions(state: dict, index: dict, paths: list[str]) -> list[dict]:
+    """File pairs with shared entities and tags whose confidence or dates differ.
+
+    Pairs are counted through an entity -> files inverted index, skipping
+    entities too common to be informative, so the work grows with the
+    number of rare shared mentions rather than with every pair of files.
+    """
+    entity_files: dict = {}
+    for number, path in enumerate(paths):
+        for entity in state["files"][path]["entities"]:
+            entity_files.setdefault(entity, []).append(number)
+
+    cap = max(MIN_ENTITY_CAP, int(MAX_ENTITY_SHARE * len(paths)))
+    weights = {entity: math.log(len(paths) / len(files)) + 1.0
+               for entity, files in entity_files.items() if len(files) <= cap}
+    shared = Counter()
+    for entity in weights:
+        shared.update(combinations(entity_files[entity], 2))
+
+    findings = []
+    for (a, b), count in shared.items():
+        if count < MIN_SHARED_ENTITIES:
+            continue
+        first, second = index["files"][paths[a]], index["files"][paths[b]]
+        tags_a, tags_b = {tag.lower() for tag in first["tags"]}, {tag.lower() for tag in second["tags"]}
+        common_tags = tags_a & tags_b
+        if not common_tags:
+            continue
+        differences = frontmatter_differences(first, second)
+        if not differences:
+            continue
+
+        entities_a, entities_b = set(state["files"][paths[a]]["entities"]), set(state["files"][paths[b]]["entities"])
+        entities = [entity for entity in entities_a & entities_b if entity in weights]
+        entity_overlap = (sum(weights[entity] for entity in entities)
+                          / sum(weights.get(entity, 0.0) for entity in entities_a | entities_b))
+        tag_overlap = len(common_tags) / len(tags_a | tags_b)
+        gaps = [abs((_date(x) - _date(y)).days) for field, (x, y) in differences.items() if field != "confidence"]
+        divergence = min(max(gaps, default=0) / 365, 1.0)
+        if "confidence" in differences:
+            ranks = [CONFIDENCE_RANK.get(value, 0) for value in differences["confidence"]]
+            divergence += abs(ranks[0] - ranks[1]) / 2
+        score = (entity_overlap + tag_overlap) / 2 * (1 + divergence) / 3
+
+        entities.sort(key=lambda entity: -weights[entity])
+        findings.append({
+            "files": [paths[a], paths[b]],
+            "score": round(score, 3),
+            "shared_entities": entities[:10],
+            "shared_tags": sorted(common_tags),
+            "differences": differences,
+            "authoritative": _authoritative(first, second),
+        })
+    return findings
+
+
+def _rank(findings: list[dict], limit: int, bead) -> list[dict]:
+    """Sort by score, keep the top limit, and number them with a suggested bead title."""
+    findings.sort(key=lambda finding: (-finding["score"], finding["files"]))
+    return [{"rank": rank, **finding, "bead": bead(finding)} for rank, finding in enumerate(findings[:limit], start=1)]
+
+
+def scan(kb_dir: Path, threshold: float = DUPLICATE_THRESHOLD, limit: int = DEFAULT_LIMIT,
+         changed_only: bool = False) -> dict:
+    """Update the cached scan and build the groom report.
+
+    Args:
+        kb_dir: Knowledge base directory
+        threshold: Minimum estimated similarity for duplicate passages
+        limit: Findings of each kind to keep
+        changed_only: Keep only findings involving files changed since the last scan
+
+    Returns:
+        Report dict (JSON-serializable)
+    """
+    index, _ = update_index(kb_dir)
+    state, signatures, changed = update_state(kb_dir, index)
+    paths = list(state["files"])
+    duplicates, boilerplate = find_duplicates(state, signatures, paths, threshold)
+    contradictions = find_contradictions(state, index, paths)
+    for finding in duplicates:
+        # A copy whose frontmatter disagrees is probably the stale one
+        first, second = (index["files"][path] for path in finding["files"])
+        finding["differences"] = frontmatter_differences(first, second)
+        finding["authoritative"] = _authoritative(first, second) if finding["differences"] else None
+
+    if changed_only:
+        changed_set = set(changed)
+        duplicates = [f for f in duplicates if changed_set & set(f["files"])]
+        contradictions = [f for f in contradictions if changed_set & set(f["files"])]
+        boilerplate = [f for f in boilerplate if changed_set & set(f["files"])]
+
+    prefix = kb_dir.name
+    for finding in duplicates + contradictions + boilerplate:
+        finding["files"] = [f"{prefix}/{path}" for path in finding["files"]]
+        if finding.get("authoritative"):
+            finding["authoritative"] = f"{prefix}/{finding['authoritative']}"
+
+    return {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "kb_dir": str(kb_dir),
+        "files": len(paths),
+        "passages": len(signatures),
+        "changed": len(changed),
+        "settings": {"threshold": threshold, "shingle_words": SHINGLE_WORDS, "num_perm": NUM_PERM,
+                     "bands": BANDS, "date_gap_days": DATE_GAP_DAYS, "changed_only": changed_only},
+        "duplicates": _rank(duplicates, limit, lambda f: (
+            f"Merge near-duplicate content: {f['files'][0]} and {f['files'][1]}")),
+        "contradictions": _rank(contradictions, limit, lambda f: (
+            f"Reconcile {f['files'][0]} and {f['files'][1]} ({', '.join(f['differences'])} differ)")),
+        "boilerplate": _rank(boilerplate, limit, lambda f: (
+            f"Review text repeated in {len(f['files'])} files under \"{f['heading']}\"")),
+    }
+
+
+def main():
+    """CLI interface for the groom scanner."""
+    parser = argparse.ArgumentParser(
+        description="Report near-duplicate passages and contradiction candidates in the knowledge base",
+        epilog="Examples:\n"
+               "  python3 scripts/kb_groom.py > groom.json\n"
+               "  python3 scripts/kb_groom.py --changed-only --output groom.json\n"
+               "  python3 scripts/kb_groom.py --threshold 0.7 --limit 10\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--threshold", type=float, default=DUPLICATE_THRESHOLD,
+                        help=f"Minimum passage similarity for duplicates, 0-1 (default: {DUPLICATE_THRESHOLD})")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT,
+                        help=f"Findings of each kind to report (default: {DEFAULT_LIMIT})")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="Only findings involving files changed since the last scan")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the cached scan and re-read every file")
+    parser.add_argument("--output", type=str, help="Write the report here instead of stdout")
+    parser.add_argument("--kb-dir", type=str, help="Knowledge base directory (default: ./knowledge-base)")
+    args = parser.parse_args()
+
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold must be between 0 and 1")
+
+    kb_dir = Path(args.kb_dir) if args.kb_dir else find_kb_dir()
+    if not kb_dir.is_dir():
+        print(f"Error: Knowledge base not found: {kb_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.rebuild:
+        (kb_dir / STORE_DIR / "state.json").unlink(missing_ok=True)
+    start = time.perf_counter()
+    report = scan(kb_dir, args.threshold, args.limit, args.changed_only)
+    print(f"Scanned {report['files']} files ({report['changed']} changed, {report['passages']} passages) "
+          f"in {time.perf_counter() - start:.2f}s: {len(report['duplicates'])} duplicates, "
+          f"{len(report['contradictions'])} contradiction candidates, "
+          f"{len(report['boilerplate'])} boilerplate groups", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        print(f"  Report: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""Incremental index of knowledge-base frontmatter, and INDEX.md generated from it.
+
+Usage:
+    python3 scripts/kb_index.py            # Re-index changed files and regenerate INDEX.md
+    python3 scripts/kb_index.py stats      # Summary for dashboard.sh
+    python3 scripts/kb_index.py check      # Exit 1 if any file lacks the required frontmatter
+    python3 scripts/kb_index.py list [--json]
+
+Reads the YAML frontmatter that protocols/quality.md requires of every KB
+file (source, ingested, confidence, last_verified, tags) and keeps it in
+knowledge-base/.index.json, together with each file's mtime, size and
+SHA-256. A re-index only reads files whose mtime or size changed, and only
+re-parses those whose content hash changed too, so a no-change run over
+thousands of files is a directory walk and one JSON load.
+
+INDEX.md is rewritten from the index, and only when its content (other
+than the date) would change. README.md files and INDEX.md itself are not
+indexed.
+
+No third-party dependencies: the frontmatter parser handles the subset of
+YAML the KB uses (scalars, quoted strings, [flow] and block lists).
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+INDEX_VERSION = 1
+INDEX_FILE = ".index.json"  # Inside the KB directory; derived, so gitignored
+REQUIRED_FIELDS = ["source", "ingested", "confidence", "last_verified", "tags"]
+CONFIDENCE_LEVELS = {"high", "medium", "low"}
+STALE_AFTER_DAYS = 90  # last_verified older than this counts as stale
+SKIP_NAMES = {"INDEX.md", "README.md"}
+
+# Sections shown in INDEX.md even when empty, with the hint for adding content
+SECTIONS = {
+    "user": "_No profile yet. Run `/hive.onboard` to create your user profile._",
+    "strategic-context": "_No entries yet. Use `/hive.ingest` to add organizational strategy and priorities._",
+    "projects": "_No entries yet. Use `/hive.ingest` to add project context._",
+    "team": "_No entries yet. Use `/hive.ingest` to add team models._",
+    "workstreams": "_No entries yet. Use `/hive.ingest` to add workstream status._",
+}
+
+
+def find_kb_dir() -> Path:
+    """Find knowledge-base/ by walking up from cwd (falls back to the repo this script is in)."""
+    cwd = Path.cwd()
+    for parent in [cwd] + list(cwd.parents):
+        kb_dir = parent / "knowledge-base"
+        if kb_dir.is_dir():
+            return kb_dir
+    return Path(__file__).resolve().parent.parent / "knowledge-base"
+
+
+def _parse_scalar(value: str):
+    """Parse a YAML scalar: quoted string, flow list, or plain text (dates stay strings)."""
+    value = value.strip()
+    if not value:
+        return None
+    if value[0] in "\"'":
+        quote = value[0]
+        end = value.find(quote, 1)
+        while quote == '"' and end > 0 and value[end - 1] == "\\":
+            end = value.find(quote, end + 1)
+        text = value[1:end if end > 0 else None]
+        return text.replace('\\"', '"') if quote == '"' else text.replace("''", "'")
+    if value.startswith("["):
+        inner = value[1:value.rfind("]")] if "]" in value else value[1:]
+        return [item for item in (_parse_scalar(part) for part in _split_flow(inner)) if item not in (None, "")]
+
+    # Plain scalar: drop a trailing comment
+    if " #" in value:
+        value = value[:value.index(" #")].rstrip()
+    return value
+
+
+def _split_flow(inner: str) -> list[str]:
+    """Split the inside of a [flow, list] on commas outside quotes."""
+    parts, current, quote = [], "", None
+    for char in inner:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "\"'":
+            quote = char
+        elif char == ",":
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+    parts.append(current)
+    return parts
+
+
+def parse_frontmatter(text: str) -> tuple[dict | None, str]:
+    """Split a markdown file into its YAML frontmatter and body.
+
+    Args:
+        text: File content
+
+    Returns:
+        Tuple of (fields, body); fields is None if there is no frontmatter block
+    """
+    lines = text.split("\n")
+    if not lines or lines[0].strip() != "---":
+        return None, text
+
+    fields: dict = {}
+    current_list = None
+    for i, line in enumerate(lines[1:], start=1):
+        stripped = line.strip()
+        if stripped in ("---", "..."):
+            return fields, "\n".join(lines[i + 1:])
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- ") and current_list is not None:
+            # Block list item under the last key
+            item = _parse_scalar(stripped[2:])
+            if item not in (None, ""):
+                current_list.append(item)
+            continue
+        if ":" in line and not line[0].isspace():
+            key, _, value = line.partition(":")
+            parsed = _parse_scalar(value)
+            if parsed is None:
+                current_list = fields[key.strip()] = []  # Value follows as a block list (or is empty)
+            else:
+                fields[key.strip()] = parsed
+                current_list = None
+
+    return None, text  # Unterminated block: not frontmatter
+
+
+def first_heading(body: str) -> str | None:
+    """Text of the first markdown heading in body."""
+    for line in body.split("\n"):
+        if line.startswith("#"):
+            return line.lstrip("#").strip() or None
+    return None
+
+
+def index_entry(path: Path, rel_path: str, data: bytes, stat: os.stat_result) -> dict:
+    """Parse one KB file into an index entry."""
+    text = data.decode("utf-8", errors="replace")
+    fields, body = parse_frontmatter(text)
+    fields = fields or {}
+
+    tags = fields.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+
+    problems = [f"missing {name}" for name in REQUIRED_FIELDS if fields.get(name) in (None, "", [])]
+    if fields.get("confidence") and str(fields["confidence"]).lower() not in CONFIDENCE_LEVELS:
+        problems.append(f"confidence is '{fields['confidence']}' (expected high, medium or low)")
+
+    return {
+        "path": rel_path,
+        "section": rel_path.split("/")[0] if "/" in rel_path else "",
+        "title": first_heading(body) or path.stem.replace("-", " ").replace("_", " ").title(),
+        "source": fields.get("source"),
+        "ingested": fields.get("ingested"),
+        "confidence": str(fields["confidence"]).lower() if fields.get("confidence") else None,
+        "last_verified": fields.get("last_verified"),
+        "tags": [str(tag) for tag in tags],
+        "problems": problems,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def iter_kb_files(kb_dir: Path):
+    """Yield (path, relative path, stat) for every indexable markdown file, skipping dot-directories.
+
+    Paths are plain strings: building a Path per file would double the cost
+    of a no-change walk.
+    """
+    stack = [(kb_dir, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{prefix}{entry.name}/"))
+                elif entry.name.endswith(".md") and entry.name not in SKIP_NAMES:
+                    yield entry.path, prefix + entry.name, entry.stat()
+
+
+def load_index(kb_dir: Path) -> dict:
+    """Read the saved index, or an empty one if it is missing or from another version."""
+    try:
+        index = json.loads((kb_dir / INDEX_FILE).read_text(encoding="utf-8"))
+        if index.get("version") == INDEX_VERSION:
+            return index
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {"version": INDEX_VERSION, "files": {}}
+
+
+def update_index(kb_dir: Path) -> tuple[dict, dict]:
+    """Bring the saved index up to date with the files on disk.
+
+    Returns:
+        Tuple of (index, changes) where changes lists the added, updated
+        and removed paths
+    """
+    index = load_index(kb_dir)
+    old_files = index["files"]
+    files = {}
+    changes = {"added": [], "updated": [], "removed": []}
+    touched = False
+
+    for path, rel_path, stat in iter_kb_files(kb_dir):
+        entry = old_files.get(rel_path)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            files[rel_path] = entry
+            continue
+
+        path = Path(path)
+        data = path.read_bytes()
+        if entry and entry["sha256"] == hashlib.sha256(data).hexdigest():
+            # Touched but unchanged (checkout, copy): keep the parse, refresh the stat
+            entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            files[rel_path] = entry
+            touched = True
+            continue
+
+        files[rel_path] = index_entry(path, rel_path, data, stat)
+        changes["updated" if entry else "added"].append(rel_path)
+
+    changes["removed"] = sorted(set(old_files) - set(files))
+    index["files"] = dict(sorted(files.items()))
+    if touched or any(changes.values()) or not (kb_dir / INDEX_FILE).exists():
+        save_index(kb_dir, index)
+    return index, changes
+
+
+def save_index(kb_dir: Path, index: dict) -> None:
+    """Write the index atomically (temp file + rename)."""
+    path = kb_dir / INDEX_FILE
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def is_stale(entry: dict, today: date | None = None) -> bool:
+    """Whether an entry's last_verified date is older than STALE_AFTER_DAYS (or unreadable)."""
+    try:
+        verified = date.fromisoformat(str(entry["last_verified"]))
+    except (TypeError, ValueError):
+        return True
+    return verified < (today or date.today()) - timedelta(days=STALE_AFTER_DAYS)
+
+
+def render_index_md(index: dict, updated: str) -> str:
+    """Render INDEX.md from the index."""
+    entries = list(index["files"].values())
+    lines = [
+        "# Hive Mind Knowledge Base Index",
+        "",
+        f"Last updated: {updated}",
+        f"Total files: {len(entries)}",
+        "",
+        "<!-- Generated by scripts/kb_index.py from file frontmatter; edit the files, not this index. -->",
+        "",
+        "## Quick Reference",
+        "| Topic | Path | Last Verified | Confidence |",
+        "|---|---|---|---|",
+    ]
+    for entry in entries:
+        stale = " (stale)" if is_stale(entry) else ""
+        title = entry["title"].replace("|", "\\|")  # A pipe would end the table cell
+        lines.append(f"| {title} | {entry['path']} | {entry['last_verified'] or '-'}{stale} | "
+                     f"{entry['confidence'] or '-'} |")
+
+    lines += ["", "## By Section"]
+    by_section: dict[str, list[dict]] = {}
+    for entry in entries:
+        by_section.setdefault(entry["section"] or "(root)", []).append(entry)
+    for section in list(SECTIONS) + sorted(set(by_section) - set(SECTIONS)):
+        lines += ["", f"### {section}/"]
+        if section not in by_section:
+            lines.append(SECTIONS.get(section, "_No entries yet._"))
+            continue
+        for entry in by_section[section]:
+            tags = f" — {', '.join(entry['tags'])}" if entry["tags"] else ""
+            lines.append(f"- [{entry['title']}]({entry['path']}){tags}")
+
+    problems = [entry for entry in entries if entry["problems"]]
+    if problems:
+        lines += ["", "## Needs Attention", "Files whose frontmatter does not meet protocols/quality.md:"]
+        for entry in problems:
+            lines.append(f"- {entry['path']}: {'; '.join(entry['problems'])}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_index_md(kb_dir: Path, index: dict) -> bool:
+    """Regenerate INDEX.md if anything other than its date would change.
+
+    Returns:
+        True if INDEX.md was rewritten
+    """
+    path = kb_dir / "INDEX.md"
+    content = render_index_md(index, date.today().isoformat())
+    try:
+        existing = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = None
+
+    def without_date(text: str) -> str:
+        return "\n".join(line for line in text.split("\n") if not line.startswith("Last updated:"))
+
+    if existing is not None and without_date(existing) == without_date(content):
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def stats(index: dict) -> dict:
+    """Counts for the dashboard: files per section, confidence, stale and problem files."""
+    entries = list(index["files"].values())
+    by_section: dict[str, int] = {}
+    by_confidence: dict[str, int] = {}
+    for entry in entries:
+        by_section[entry["section"] or "(root)"] = by_section.get(entry["section"] or "(root)", 0) + 1
+        by_confidence[entry["confidence"] or "unset"] = by_confidence.get(entry["confidence"] or "unset", 0) + 1
+    return {
+        "files": len(entries),
+        "by_section": dict(sorted(by_section.items())),
+        "by_confidence": dict(sorted(by_confidence.items())),
+        "stale": sum(1 for entry in entries if is_stale(entry)),
+        "problems": sum(1 for entry in entries if entry["problems"]),
+    }
+
+
+def main():
+    """CLI interface for the KB indexer."""
+    parser = argparse.ArgumentParser(
+        description="Index knowledge-base frontmatter and regenerate INDEX.md",
+        epilog="Examples:\n"
+               "  python3 scripts/kb_index.py\n"
+               "  python3 scripts/kb_index.py stats\n"
+               "  python3 scripts/kb_index.py check\n"
+               "  python3 scripts/kb_index.py list --json | jq '.[] | select(.confidence == \"low\")'\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", nargs="?", default="update", choices=["update", "stats", "check", "list"])
+    parser.add_argument("--kb-dir", type=str, help="Knowledge base directory (default: ./knowledge-base)")
+    parser.add_argument("--no-markdown", action="store_true", help="Update the index without touching INDEX.md")
+    parser.add_argument("--json", action="store_true", help="Print stats or list output as JSON")
+    args = parser.parse_args()
+
+    kb_dir = Path(args.kb_dir) if args.kb_dir else find_kb_dir()
+    if not kb_dir.is_dir():
+        print(f"Error: Knowledge base not found: {kb_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    index, changes = update_index(kb_dir)
+
+    if args.command == "update":
+        rewritten = False if args.no_markdown else write_index_md(kb_dir, index)
+        print(f"Indexed {len(index['files'])} files: {len(changes['added'])} added, "
+              f"{len(changes['updated'])} updated, {len(changes['removed'])} removed"
+              f"{'; INDEX.md regenerated' if rewritten else ''}", file=sys.stderr)
+    elif args.command == "stats":
+        summary = stats(index)
+        if args.json:
+            print(json.dumps(summary, indent=2))
+            return
+        print(f"  Content files: {summary['files']}")
+        if summary["by_section"]:
+            print("  By section: " + ", ".join(f"{name} {count}" for name, count in summary["by_section"].items()))
+            print("  Confidence: " + ", ".join(f"{name} {count}" for name, count in summary["by_confidence"].items()))
+        print(f"  Stale (last verified > {STALE_AFTER_DAYS} days): {summary['stale']}")
+        print(f"  Missing or invalid frontmatter: {summary['problems']}")
+    elif args.command == "check":
+        problems = [entry for entry in index["files"].values() if entry["problems"]]
+        for entry in problems:
+            print(f"{entry['path']}: {'; '.join(entry['problems'])}")
+        sys.exit(1 if problems else 0)
+    else:
+        entries = list(index["files"].values())
+        if args.json:
+            print(json.dumps(entries, indent=2))
+            return
+        for entry in entries:
+            print(f"{entry['path']}\t{entry['confidence'] or '-'}\t{entry['last_verified'] or '-'}\t"
+                  f"{','.join(entry['tags'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""BM25 full-text search over the knowledge base and processed voice memos.
+
+Usage:
+    python3 scripts/kb_search.py "billing migration owner"
+    python3 scripts/kb_search.py "launch date" --section projects --confidence high --fresh
+    python3 scripts/kb_search.py "hiring plan" --tag hiring --exclude-section team -k 5 --json
+
+Indexes every KB markdown file (body, title and tags) and every
+.aur2/visions/processed/*/transcript.txt in a SQLite FTS5 table at
+knowledge-base/.search.db, and returns the top-k paths with a snippet
+around the matching terms, ranked by BM25 (title and tag matches weigh
+more than body matches).
+
+Each search first brings the index up to date: files whose mtime and size
+are unchanged are skipped, KB frontmatter comes from kb_index.py's cache,
+and only files whose content hash changed are re-indexed.
+
+Frontmatter filters (--tag, --confidence, --fresh, --stale) apply to KB
+files; memos have no frontmatter and drop out of results when one is used.
+"""
+
+import re
+import sys
+import json
+import time
+import hashlib
+import sqlite3
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+from kb_index import (STALE_AFTER_DAYS, find_kb_dir, iter_kb_files, parse_frontmatter,
+                      update_index)
+
+DB_FILE = ".search.db"  # Inside the KB directory; derived, so gitignored
+MEMO_DIR = Path(".aur2") / "visions" / "processed"  # Relative to the repo root
+DEFAULT_LIMIT = 10
+SNIPPET_TOKENS = 16  # Words of context in each snippet
+FIELD_WEIGHTS = (5.0, 3.0, 1.0)  # BM25 weight of title, tags, body
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,
+    section TEXT,
+    title TEXT,
+    confidence TEXT,
+    last_verified TEXT,
+    tags TEXT,
+    mtime_ns INTEGER,
+    size INTEGER,
+    sha256 TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(title, tags, body, tokenize='porter unicode61');
+"""
+
+
+def connect(kb_dir: Path) -> sqlite3.Connection:
+    """Open the search database, creating its tables if needed."""
+    conn = sqlite3.connect(str(kb_dir / DB_FILE), timeout=30)
+    try:
+        conn.executescript(SCHEMA)
+    except sqlite3.OperationalError as e:
+        conn.close()
+        print(f"Error: This Python's SQLite lacks FTS5 ({e})", file=sys.stderr)
+        sys.exit(1)
+    return conn
+
+
+def iter_memo_files(repo_dir: Path):
+    """Yield (path, repo-relative path, stat) for every processed memo transcript."""
+    memo_dir = repo_dir / MEMO_DIR
+    if not memo_dir.is_dir():
+        return
+    for path in memo_dir.glob("*/transcript.txt"):
+        yield path, path.relative_to(repo_dir).as_posix(), path.stat()
+
+
+def _iso_date(value) -> str | None:
+    """value as YYYY-MM-DD if it is a date, else None (so SQL comparisons stay meaningful)."""
+    try:
+        return date.fromisoformat(str(value)).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def _upsert(conn: sqlite3.Connection, doc: dict, body: str) -> None:
+    """Insert or replace one document and its full-text row."""
+    row = conn.execute("SELECT id FROM docs WHERE path = ?", (doc["path"],)).fetchone()
+    tags = "," + ",".join(tag.lower() for tag in doc["tags"]) + "," if doc["tags"] else None
+    values = (doc["kind"], doc["section"], doc["title"], doc["confidence"], doc["last_verified"], tags,
+              doc["mtime_ns"], doc["size"], doc["sha256"])
+    if row:
+        doc_id = row[0]
+        conn.execute("UPDATE docs SET kind = ?, section = ?, title = ?, confidence = ?, last_verified = ?, "
+                     "tags = ?, mtime_ns = ?, size = ?, sha256 = ? WHERE id = ?", values + (doc_id,))
+        conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+    else:
+        doc_id = conn.execute("INSERT INTO docs (kind, section, title, confidence, last_verified, tags, "
+                              "mtime_ns, size, sha256, path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                              values + (doc["path"],)).lastrowid
+    conn.execute("INSERT INTO docs_fts (rowid, title, tags, body) VALUES (?, ?, ?, ?)",
+                 (doc_id, doc["title"], " ".join(doc["tags"]), body))
+
+
+def update_search_index(conn: sqlite3.Connection, kb_dir: Path, include_memos: bool = True) -> dict:
+    """Bring the search index up to date with the KB and memo transcripts on disk.
+
+    Args:
+        conn: Connection from connect()
+        kb_dir: Knowledge base directory
+        include_memos: Also index .aur2/visions/processed transcripts
+
+    Returns:
+        Counts of indexed, skipped (unchanged) and removed documents
+    """
+    repo_dir = kb_dir.parent
+    kb_prefix = kb_dir.name + "/"
+    known = {path: (mtime_ns, size, sha256)
+             for path, mtime_ns, size, sha256 in conn.execute("SELECT path, mtime_ns, size, sha256 FROM docs")}
+    seen, kb_changed, memo_changed = set(), [], []
+
+    for path, rel_path, stat in iter_kb_files(kb_dir):
+        key = kb_prefix + rel_path
+        seen.add(key)
+        if known.get(key, (None, None))[:2] != (stat.st_mtime_ns, stat.st_size):
+            kb_changed.append((path, rel_path, key))
+    if include_memos:
+        for path, key, stat in iter_memo_files(repo_dir):
+            seen.add(key)
+            if known.get(key, (None, None))[:2] != (stat.st_mtime_ns, stat.st_size):
+                memo_changed.append((path, key, stat))
+
+    counts = {"indexed": 0, "skipped": len(seen) - len(kb_changed) - len(memo_changed), "removed": 0}
+    removed = [path for path in known if path not in seen]
+    if not (kb_changed or memo_changed or removed):
+        return counts  # The common case: a stat walk and one SELECT
+
+    with conn:
+        if kb_changed:
+            # Reuse the frontmatter index's hashes and parses for changed KB files
+            entries = update_index(kb_dir)[0]["files"]
+            for path, rel_path, key in kb_changed:
+                entry = entries[rel_path]
+                doc = {"path": key, "kind": "kb", "section": entry["section"], "title": entry["title"],
+                       "confidence": entry["confidence"], "last_verified": _iso_date(entry["last_verified"]),
+                       "tags": entry["tags"], "mtime_ns": entry["mtime_ns"], "size": entry["size"],
+                       "sha256": entry["sha256"]}
+                if known.get(key, (None, None, None))[2] == entry["sha256"]:
+                    conn.execute("UPDATE docs SET mtime_ns = ?, size = ? WHERE path = ?",
+                                 (doc["mtime_ns"], doc["size"], key))
+                    continue
+                _upsert(conn, doc, parse_frontmatter(Path(path).read_text(encoding="utf-8", errors="replace"))[1])
+                counts["indexed"] += 1
+
+        for path, key, stat in memo_changed:
+            data = path.read_bytes()
+            sha256 = hashlib.sha256(data).hexdigest()
+            if known.get(key, (None, None, None))[2] == sha256:
+                conn.execute("UPDATE docs SET mtime_ns = ?, size = ? WHERE path = ?",
+                             (stat.st_mtime_ns, stat.st_size, key))
+                continue
+            doc = {"path": key, "kind": "memo", "section": "memos", "title": path.parent.name,
+                   "confidence": None, "last_verified": None, "tags": [], "mtime_ns": stat.st_mtime_ns,
+                   "size": stat.st_size, "sha256": sha256}
+            _upsert(conn, doc, data.decode("utf-8", errors="replace"))
+            counts["indexed"] += 1
+
+        for key in removed:
+            doc_id = conn.execute("SELECT id FROM docs WHERE path = ?", (key,)).fetchone()[0]
+            conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+            conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+            counts["removed"] += 1
+    return counts
+
+
+def to_match_query(query: str) -> str:
+    """Turn free text into an FTS5 query: any of the words, each quoted so punctuation is literal."""
+    words = re.findall(r"\w+", query)
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+def search(conn: sqlite3.Connection, query: str, limit: int = DEFAULT_LIMIT, raw: bool = False,
+           sections: list[str] | None = None, exclude_sections: list[str] | None = None,
+           tags: list[str] | None = None, confidence: list[str] | None = None,
+           fresh: bool = False, stale: bool = False, kind: str | None = None) -> list[dict]:
+    """Top documents for a query by BM25, with snippets.
+
+    Args:
+        conn: Connection from connect()
+        query: Free text, or an FTS5 query if raw
+        limit: Number of results
+        raw: Pass query to FTS5 unchanged (phrases, AND/OR/NOT, prefix*)
+        sections: Only these top-level KB sections ("memos" for transcripts)
+        exclude_sections: Never these sections (e.g. team, for stakeholder deliverables)
+        tags: Only KB files carrying all of these tags
+        confidence: Only KB files with one of these confidence levels
+        fresh: Only KB files verified within STALE_AFTER_DAYS
+        stale: Only KB files not verified within STALE_AFTER_DAYS (or never)
+        kind: Only "kb" or only "memo" documents
+
+    Returns:
+        Results, best first: path, title, section, score (higher is better),
+        confidence, last_verified and snippet
+    """
+    match = query if raw else to_match_query(query)
+    if not match:
+        return []
+
+    cutoff = (date.today() - timedelta(days=STALE_AFTER_DAYS)).isoformat()
+    where, params = ["docs_fts MATCH ?"], [match]
+    if sections:
+        where.append(f"d.section IN ({','.join('?' * len(sections))})")
+        params += sections
+    if exclude_sections:
+        where.append(f"d.section NOT IN ({','.join('?' * len(exclude_sections))})")
+        params += exclude_sections
+    for tag in tags or []:
+        where.append("d.tags LIKE ?")
+        params.append(f"%,{tag.lower()},%")
+    if confidence:
+        where.append(f"d.confidence IN ({','.join('?' * len(confidence))})")
+        params += [level.lower() for level in confidence]
+    if fresh:
+        where.append("d.last_verified >= ?")
+        params.append(cutoff)
+    if stale:
+        where.append("d.kind = 'kb' AND (d.last_verified IS NULL OR d.last_verified < ?)")
+        params.append(cutoff)
+    if kind:
+        where.append("d.kind = ?")
+        params.append(kind)
+
+    weights = ", ".join(str(weight) for weight in FIELD_WEIGHTS)
+    sql = (f"SELECT d.path, d.title, d.section, -bm25(docs_fts, {weights}) AS score, d.confidence, "
+           f"d.last_verified, snippet(docs_fts, 2, '[', ']', ' ... ', {SNIPPET_TOKENS}) "
+           f"FROM docs_fts JOIN docs d ON d.id = docs_fts.rowid "
+           f"WHERE {' AND '.join(where)} ORDER BY bm25(docs_fts, {weights}) LIMIT ?")
+    rows = conn.execute(sql, params + [limit]).fetchall()
+    return [{"path": path, "title": title, "section": section, "score": round(score, 3),
+             "confidence": level, "last_verified": verified, "snippet": " ".join(snippet.split())}
+            for path, title, section, score, level, verified, snippet in rows]
+
+
+def main():
+    """CLI interface for KB search."""
+    parser = argparse.ArgumentParser(
+        description="Search the knowledge base and processed memos (BM25 ranking)",
+        epilog="Examples:\n"
+               "  python3 scripts/kb_search.py \"billing migration owner\"\n"
+               "  python3 scripts/kb_search.py \"launch date\" --section projects --confidence high --fresh\n"
+               "  python3 scripts/kb_search.py \"roadmap\" --exclude-section team --json\n"
+               "  python3 scripts/kb_search.py '\"cache region\" AND NOT draft' --raw\n"
+               "  python3 scripts/kb_search.py --reindex\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("query", nargs="?", help="Words to search for")
+    parser.add_argument("-k", "--limit", type=int, default=DEFAULT_LIMIT,
+                        help=f"Number of results (default: {DEFAULT_LIMIT})")
+    parser.add_argument("--section", action="append", help="Only this KB section, or memos (repeatable)")
+    parser.add_argument("--exclude-section", action="append", help="Leave out this section (repeatable)")
+    parser.add_argument("--tag", action="append", help="Only KB files with this tag (repeatable; all must match)")
+    parser.add_argument("--confidence", action="append", choices=["high", "medium", "low"],
+                        help="Only KB files with this confidence (repeatable)")
+    freshness = parser.add_mutually_exclusive_group()
+    freshness.add_argument("--fresh", action="store_true",
+                           help=f"Only KB files verified in the last {STALE_AFTER_DAYS} days")
+    freshness.add_argument("--stale", action="store_true",
+                           help=f"Only KB files not verified in the last {STALE_AFTER_DAYS} days")
+    parser.add_argument("--kind", choices=["kb", "memo"], help="Only KB files or only memo transcripts")
+    parser.add_argument("--raw", action="store_true", help="Pass the query to SQLite FTS5 unchanged")
+    parser.add_argument("--no-memos", action="store_true", help="Don't index .aur2/visions/processed transcripts")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the search index from scratch")
+    parser.add_argument("--kb-dir", type=str, help="Knowledge base directory (default: ./knowledge-base)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    if not args.query and not args.reindex:
+        parser.error("a query is required (or --reindex)")
+
+    kb_dir = Path(args.kb_dir) if args.kb_dir else find_kb_dir()
+    if not kb_dir.is_dir():
+        print(f"Error: Knowledge base not found: {kb_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.reindex:
+        (kb_dir / DB_FILE).unlink(missing_ok=True)
+    conn = connect(kb_dir)
+    start = time.perf_counter()
+    counts = update_search_index(conn, kb_dir, include_memos=not args.no_memos)
+    if counts["indexed"] or counts["removed"]:
+        print(f"Indexed {counts['indexed']} changed files, removed {counts['removed']} "
+              f"({time.perf_counter() - start:.2f}s)", file=sys.stderr)
+    if not args.query:
+        return
+
+    try:
+        results = search(conn, args.query, args.limit, raw=args.raw, sections=args.section,
+                         exclude_sections=args.exclude_section, tags=args.tag, confidence=args.confidence,
+                         fresh=args.fresh, stale=args.stale, kind=args.kind)
+    except sqlite3.OperationalError as e:
+        print(f"Error: Invalid query ({e})", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        print("  No matches", file=sys.stderr)
+        return
+    for result in results:
+        details = ", ".join(value for value in (result["confidence"], result["last_verified"]) if value)
+        print(f"{result['score']:7.2f}  {result['path']}" + (f"  ({details})" if details else ""))
+        print(f"         {result['snippet']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,750 @@
+#!/usr/bin/env python3
+"""Semantic (vector) retrieval over the knowledge base and processed voice memos.
+
+Usage:
+    python3 scripts/kb_vectors.py query "the launch slipped" [-k 5] [--exclude-section team]
+    python3 scripts/kb_vectors.py update [--embedder lsa|hashing|module:function] [--rebuild]
+
+Splits KB files and .aur2/visions/processed transcripts into chunks of
+about CHUNK_WORDS words, embeds each chunk, and keeps the vectors in a
+memory-mapped float32 matrix under knowledge-base/.vectors/. A query is one
+matrix product against that matrix (in blocks, so it never loads more than
+a block at a time) and returns the files whose chunks are most similar by
+cosine, with the best chunk as the snippet.
+
+Like kb_search.py, every query first brings the index up to date, and only
+files whose content hash changed are re-embedded. Rows of removed or changed
+files are freed and reused.
+
+Embedders:
+    lsa      - Default. TF-IDF over hashed, stemmed words, projected
+               onto the corpus's top singular vectors (latent semantic
+               analysis), so terms that occur in similar contexts ("slipped",
+               "delayed") land near each other. Fitted locally; refitted when
+               the corpus has grown REFIT_GROWTH times since the last fit.
+               Terms outside the fitted vocabulary are feature-hashed into
+               UNSEEN_DIM extra columns, so they still match exactly.
+    hashing  - Signed feature hashing, no fitting. Cheapest, but only matches
+               shared words.
+    module:function - Any importable callable taking a list of strings and
+               returning an (n, dim) array, e.g. a local sentence-transformers
+               model. Switching embedders rebuilds the index.
+
+No network access is needed for the built-in embedders. Words the lsa model
+was not fitted on only match the same words until the next refit relates
+them to others (update --rebuild); kb_search.py finds exact terms.
+
+Requirements:
+    pip install numpy
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import zlib
+import hashlib
+import argparse
+import importlib
+from collections import Counter
+from pathlib import Path
+
+from kb_index import find_kb_dir, iter_kb_files, parse_frontmatter
+from kb_search import iter_memo_files
+
+STORE_DIR = ".vectors"  # Inside the KB directory; derived, so gitignored
+STORE_VERSION = 2  # 2: lsa rows carry UNSEEN_DIM hashed columns
+DEFAULT_EMBEDDER = "lsa"
+DEFAULT_DIM = 256  # LSA components per vector
+HASHING_DIM = 1024  # Buckets for the hashing embedder
+UNSEEN_DIM = 128  # Hashed columns after the LSA components, for terms the model was not fitted on
+HASH_BUCKETS = 2 ** 18  # Hash space for LSA terms; the model keeps only its vocabulary's buckets
+MAX_VOCABULARY = 2 ** 14  # Most frequent terms kept by the LSA model
+MIN_DOCUMENT_FREQUENCY = 2  # Terms in fewer chunks can't relate chunks to each other
+FIT_SAMPLE_CHUNKS = 20000  # LSA is fitted on at most this many chunks (sampled), then applied to all
+CHUNK_WORDS = 150  # A chunk ends at the first sentence or paragraph end after this many words
+MAX_CHUNK_WORDS = 300  # ...or here, if the text has no punctuation (raw transcripts)
+OVERSAMPLE = 10  # Extra random directions for the randomized SVD
+POWER_ITERATIONS = 1  # Sharpens the SVD when singular values decay slowly
+REFIT_GROWTH = 2.0  # Refit LSA once the corpus has this many times the chunks it was fitted on
+EMBED_BATCH = 2048  # Chunks embedded per batch
+DENSE_BATCH_CELLS = 2 ** 24  # Cells per dense batch in sparse products (64MB of float32)
+QUERY_BLOCK_ROWS = 16384  # Matrix rows scored per block
+CANDIDATES_PER_RESULT = 4  # Chunks fetched per requested file, before collapsing to files
+SNIPPET_CHARS = 240
+
+WORD = re.compile(r"[a-z0-9]+")
+TOKEN = re.compile(r"\S+")
+BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n|\n(?=#)")  # Sentence end, blank line, or before a heading
+
+# Function words that say nothing about the topic
+STOPWORDS = frozenset("""
+a about after again all also am an and any are as at be because been but by can could did do does
+doing for from get got had has have having he her here him his how i if in into is it its just know
+let like maybe me more my no not now of off oh ok okay on one or our out really right say so some
+something that the their them then there these they thing things think this to too uh um up us very
+want was we well were what when where which who will with would yeah you your
+""".split())
+
+
+def _require_numpy():
+    """Import numpy, or exit with install instructions."""
+    try:
+        import numpy as np
+        return np
+    except ImportError:
+        print("Error: kb_vectors.py needs numpy (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+
+
+def _stem(word: str) -> str:
+    """Strip common inflections so "delays", "delayed" and "delaying" share a term."""
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+
+_digests: dict[str, int] = {}  # Word -> CRC32 of its stem (0 for stopwords); words repeat, so hash each once
+
+
+def _digest(word: str) -> int:
+    digest = _digests.get(word)
+    if digest is None:
+        digest = 0 if word in STOPWORDS or len(word) < 2 else zlib.crc32(_stem(word).encode("utf-8")) or 1
+        _digests[word] = digest
+    return digest
+
+
+def hashed_rows(texts: list[str], buckets: int):
+    """Counts of each text's stemmed content words, hashed into buckets, as CSR arrays.
+
+    Returns:
+        Tuple of (indptr, columns, counts, digests): row i's buckets are
+        columns[indptr[i]:indptr[i + 1]] (a rare hash collision repeats a
+        bucket, which then sums); digests are the full CRC32s, for hash signs
+    """
+    np = _require_numpy()
+    indptr, digests, counts = [0], [], []
+    for text in texts:
+        row = Counter([_digest(word) for word in WORD.findall(text.lower())])
+        row.pop(0, None)
+        digests.extend(row)
+        counts.extend(row.values())
+        indptr.append(len(digests))
+    digests = np.array(digests, dtype=np.uint32)
+    return (np.array(indptr, dtype=np.int64), (digests % buckets).astype(np.int64),
+            np.array(counts, dtype=np.float32), digests)
+
+
+def sparse_dot(indptr, columns, values, matrix):
+    """(sparse rows) @ matrix for CSR arrays.
+
+    Each batch of rows is made dense so the product runs in BLAS; with the
+    vocabulary capped that is several times faster than gathering and
+    summing the matrix rows per entry.
+    """
+    np = _require_numpy()
+    n_rows, n_columns = len(indptr) - 1, matrix.shape[0]
+    out = np.empty((n_rows, matrix.shape[1]), dtype=np.float32)
+    batch_rows = max(1, DENSE_BATCH_CELLS // max(n_columns, 1))
+    for row in range(0, n_rows, batch_rows):
+        end = min(row + batch_rows, n_rows)
+        low, high = indptr[row], indptr[end]
+        dense = np.zeros((end - row, n_columns), dtype=np.float32)
+        rows = np.repeat(np.arange(end - row), np.diff(indptr[row:end + 1]))
+        np.add.at(dense, (rows, columns[low:high]), values[low:high])  # add.at: a hash collision repeats a column
+        out[row:end] = dense @ matrix
+    return out
+
+
+def transpose_csr(indptr, columns, values, n_columns: int):
+    """CSR arrays of the transposed matrix."""
+    np = _require_numpy()
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    order = np.argsort(columns, kind="stable")
+    transposed_indptr = np.concatenate([[0], np.cumsum(np.bincount(columns, minlength=n_columns))])
+    return transposed_indptr, rows[order], values[order]
+
+
+def normalize_rows(matrix):
+    """Scale rows to unit length (zero rows stay zero)."""
+    np = _require_numpy()
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return (matrix / np.where(norms == 0, 1, norms)).astype(np.float32, copy=False)
+
+
+class HashingEmbedder:
+    """Signed feature hashing of terms into dim buckets: no state, no fitting."""
+
+    name = "hashing"
+    needs_fit = False
+
+    def __init__(self, dim: int = HASHING_DIM):
+        self.dim = dim
+
+    def embed(self, texts: list[str]):
+        indptr, columns, counts, hashes = hashed_rows(texts, self.dim)
+        np = _require_numpy()
+        signs = np.where(hashes & 0x80000000, 1.0, -1.0).astype(np.float32)
+        rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(vectors, (rows, columns), signs * np.log1p(counts))
+        return normalize_rows(vectors)
+
+
+class LsaEmbedder:
+    """TF-IDF over hashed terms, projected onto the corpus's top singular vectors.
+
+    Terms outside the fitted vocabulary (new topics added since the last fit,
+    or words too rare to fit on) would project to nothing, so they are
+    signed-hashed into UNSEEN_DIM columns appended to the components instead.
+    """
+
+    name = "lsa"
+    needs_fit = True
+
+    def __init__(self, store: Path, dim: int = DEFAULT_DIM):
+        self.store = store
+        self.rank = dim
+        self.dim = dim + UNSEEN_DIM
+        self.buckets = self.idf = self.components = None
+        if (store / "lsa_components.npy").exists():
+            np = _require_numpy()
+            self.buckets = np.load(store / "lsa_buckets.npy")
+            self.idf = np.load(store / "lsa_idf.npy")
+            self.components = np.load(store / "lsa_components.npy", mmap_mode="r")  # Paged in on first use
+
+    def _tfidf(self, indptr, columns, counts):
+        """Row-normalized TF-IDF as CSR arrays over the model's vocabulary (other buckets are dropped)."""
+        np = _require_numpy()
+        positions = np.minimum(np.searchsorted(self.buckets, columns), len(self.buckets) - 1)
+        known = self.buckets[positions] == columns
+        lengths = np.bincount(np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))[known],
+                              minlength=len(indptr) - 1)
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        columns, values = positions[known], np.log1p(counts[known]) * self.idf[positions[known]]
+
+        squares = np.zeros(len(lengths), dtype=np.float32)
+        if len(values):
+            squares[lengths > 0] = np.add.reduceat(values ** 2, indptr[:-1][lengths > 0])
+        norms = np.sqrt(np.where(squares == 0, 1, squares))
+        return indptr, columns, (values / np.repeat(norms, lengths)).astype(np.float32)
+
+    def fit(self, texts: list[str]) -> None:
+        """Fit the vocabulary, IDF weights and projection on texts, by randomized SVD (Halko et al.).
+
+        Args:
+            texts: Chunks of the corpus, or a sample of them
+        """
+        np = _require_numpy()
+        indptr, columns, counts, _ = hashed_rows(texts, HASH_BUCKETS)
+        document_frequency = np.bincount(columns, minlength=HASH_BUCKETS)
+        frequent = np.flatnonzero(document_frequency >= MIN_DOCUMENT_FREQUENCY)
+        if not len(frequent):
+            frequent = np.flatnonzero(document_frequency) if columns.size else np.zeros(1, dtype=np.int64)
+        if len(frequent) > MAX_VOCABULARY:
+            frequent = frequent[np.argsort(-document_frequency[frequent], kind="stable")[:MAX_VOCABULARY]]
+        self.buckets = np.sort(frequent)
+        self.idf = (np.log((1 + len(texts)) / (1 + document_frequency[self.buckets])) + 1).astype(np.float32)
+
+        csr = self._tfidf(indptr, columns, counts)
+        csc = transpose_csr(*csr, len(self.buckets))
+        rng = np.random.default_rng(0)
+        sketch = sparse_dot(*csr, rng.standard_normal((len(self.buckets), self.rank + OVERSAMPLE), dtype=np.float32))
+        for _ in range(POWER_ITERATIONS):
+            sketch = np.linalg.qr(sketch)[0]
+            sketch = sparse_dot(*csr, np.linalg.qr(sparse_dot(*csc, sketch))[0])
+        basis = np.linalg.qr(sketch)[0]
+        # X ~ basis @ B with B = basis.T @ X; the right singular vectors of B are the term components
+        vectors = np.linalg.svd(sparse_dot(*csc, basis), full_matrices=False)[0][:, :self.rank]
+        components = np.zeros((len(self.buckets), self.rank), dtype=np.float32)
+        components[:, :vectors.shape[1]] = vectors  # Fewer chunks or terms than dim: pad
+
+        self.store.mkdir(parents=True, exist_ok=True)
+        np.save(self.store / "lsa_buckets.npy", self.buckets)
+        np.save(self.store / "lsa_idf.npy", self.idf)
+        np.save(self.store / "lsa_components.npy", components)
+        self.components = np.load(self.store / "lsa_components.npy", mmap_mode="r")
+
+    def embed(self, texts: list[str]):
+        np = _require_numpy()
+        indptr, columns, counts, hashes = hashed_rows(texts, HASH_BUCKETS)
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        vectors[:, :self.rank] = sparse_dot(*self._tfidf(indptr, columns, counts), self.components)
+
+        # Unseen terms, weighted like the rarest vocabulary term and scaled to share the row's TF-IDF norm
+        positions = np.minimum(np.searchsorted(self.buckets, columns), len(self.buckets) - 1)
+        seen = self.buckets[positions] == columns
+        rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        values = np.log1p(counts) * np.where(seen, self.idf[positions], self.idf.max())
+        norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=len(texts)))
+        seen_norms = np.sqrt(np.bincount(rows[seen], weights=values[seen] ** 2, minlength=len(texts)))
+        vectors[:, :self.rank] *= (seen_norms / np.where(norms == 0, 1, norms))[:, None]
+        unseen = ~seen
+        signs = np.where(hashes[unseen] & 0x80000000, 1.0, -1.0)
+        np.add.at(vectors, (rows[unseen], self.rank + hashes[unseen] % UNSEEN_DIM),
+                  signs * values[unseen] / np.where(norms == 0, 1, norms)[rows[unseen]])
+        return normalize_rows(vectors)
+
+
+class CallableEmbedder:
+    """Wraps a user-supplied function (list of texts -> (n, dim) array), imported from "module:function"."""
+
+    needs_fit = False
+
+    def __init__(self, spec: str):
+        module, _, attribute = spec.partition(":")
+        if not attribute:
+            raise ValueError(f"Embedder must be lsa, hashing or module:function, not '{spec}'")
+        sys.path.insert(0, str(Path.cwd()))
+        try:
+            self.function = getattr(importlib.import_module(module), attribute)
+        finally:
+            sys.path.pop(0)
+        self.name = spec
+        self.dim = None  # Known after the first call
+
+    def embed(self, texts: list[str]):
+        np = _require_numpy()
+        vectors = np.asarray(self.function(texts), dtype=np.float32).reshape(len(texts), -1)
+        self.dim = vectors.shape[1]
+        return normalize_rows(vectors)
+
+
+def load_embedder(name: str, store: Path):
+    """Embedder for a name: lsa, hashing, or module:function."""
+    if name == "lsa":
+        return LsaEmbedder(store)
+    if name == "hashing":
+        return HashingEmbedder()
+    return CallableEmbedder(name)
+
+
+def chunk_spans(text: str, offset: int = 0) -> list[tuple[int, int]]:
+    """Split text into (start, end) spans of about CHUNK_WORDS words, ending at sentence or paragraph ends.
+
+    Args:
+        text: Text to split
+        offset: Added to every position (e.g. the length of skipped frontmatter)
+    """
+    spans, start, words, position = [], None, 0, 0
+    for match in [*BREAK.finditer(text), None]:
+        end = match.start() if match else len(text.rstrip())
+        segment = text[position:end]
+        segment_words = len(segment.split())
+        if segment_words and start is None:
+            start = position + len(segment) - len(segment.lstrip())
+        if words + segment_words > MAX_CHUNK_WORDS:
+            # Run-on text (e.g. an unpunctuated transcript): cut it at word boundaries
+            for word in TOKEN.finditer(text, position, end):
+                start = word.start() if start is None else start
+                words += 1
+                if words >= MAX_CHUNK_WORDS:
+                    spans.append((start, word.end()))
+                    start, words = None, 0
+        else:
+            words += segment_words
+        if words >= CHUNK_WORDS:
+            spans.append((start, end))
+            start, words = None, 0
+        position = match.end() if match else end
+
+    if start is not None:
+        if spans and words < CHUNK_WORDS // 3:
+            start = spans.pop()[0]  # Too short to stand alone: extend the previous chunk
+        spans.append((start, len(text.rstrip())))
+    return [(offset + start, offset + end) for start, end in spans]
+
+
+def load_file(path: str, kind: str) -> tuple[str, list[tuple[int, int]], list[str]]:
+    """Hash, chunk spans and texts to embed for one file.
+
+    KB files skip their frontmatter. Each chunk's text is prefixed with the
+    file's title, which often names the topic the chunk leaves implicit.
+
+    Returns:
+        Tuple of (sha256, spans, texts)
+    """
+    data = Path(path).read_bytes()
+    text = data.decode("utf-8", errors="replace")
+    if kind == "kb":
+        body = parse_frontmatter(text)[1]
+        spans = chunk_spans(body, len(text) - len(body))
+        title = Path(path).stem.replace("-", " ").replace("_", " ")
+    else:
+        spans = chunk_spans(text)
+        title = Path(path).parent.name.replace("-", " ")
+    return hashlib.sha256(data).hexdigest(), spans, [f"{title}\n{text[start:end]}" for start, end in spans]
+
+
+def load_meta(store: Path, name: str = "meta.json") -> dict | None:
+    """The store's metadata (or its lookup table, for queries), or None if there is no usable store."""
+    try:
+        meta = json.loads((store / name).read_text(encoding="utf-8"))
+        return meta if meta.get("version") == STORE_VERSION else None
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write JSON atomically (temp file + rename)."""
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def save_meta(store: Path, meta: dict) -> None:
+    """Write the metadata, after the matrices it describes.
+
+    Queries read lookup.json instead: the matrix shape and each file id's
+    path and section, without the hashes and stats only updates need.
+    """
+    files: list = [None] * meta["next_file_id"]
+    for key, entry in meta["files"].items():
+        files[entry["id"]] = [key, entry["section"]]
+    lookup = {key: meta[key] for key in ("version", "embedder", "dim", "capacity", "rows")}
+    _write_json(store / "lookup.json", {**lookup, "files": files})
+    _write_json(store / "meta.json", meta)
+
+
+def open_matrices(store: Path, meta: dict, mode: str = "r"):
+    """Memory-map the vector matrix (capacity x dim float32) and chunk table (capacity x 3 int64).
+
+    Chunk rows are (file id, start, end); file id 0 marks a free row.
+    """
+    np = _require_numpy()
+    capacity = meta["capacity"]
+    if capacity == 0:
+        return np.zeros((0, meta["dim"] or 1), dtype=np.float32), np.zeros((0, 3), dtype=np.int64)
+    vectors = np.memmap(store / "vectors.f32", dtype=np.float32, mode=mode, shape=(capacity, meta["dim"]))
+    chunks = np.memmap(store / "chunks.i64", dtype=np.int64, mode=mode, shape=(capacity, 3))
+    return vectors, chunks
+
+
+def _grow(store: Path, meta: dict, rows_needed: int) -> None:
+    """Extend the matrix files (zero-filled, so new rows are free) to hold rows_needed rows."""
+    if rows_needed <= meta["capacity"]:
+        return
+    capacity = max(rows_needed, meta["capacity"] * 2, 1024)
+    for name, row_bytes in (("vectors.f32", 4 * meta["dim"]), ("chunks.i64", 8 * 3)):
+        with open(store / name, "ab") as f:
+            f.truncate(capacity * row_bytes)
+    meta["capacity"] = capacity
+
+
+def _new_meta(embedder) -> dict:
+    return {"version": STORE_VERSION, "embedder": embedder.name, "dim": embedder.dim, "fit_chunks": 0,
+            "capacity": 0, "rows": 0, "free": [], "next_file_id": 1, "files": {}}
+
+
+def _scan(kb_dir: Path, include_memos: bool) -> dict:
+    """Current files: repo-relative path -> (absolute path, kind, section, stat)."""
+    files = {}
+    for path, rel_path, stat in iter_kb_files(kb_dir):
+        files[f"{kb_dir.name}/{rel_path}"] = (path, "kb", rel_path.split("/")[0] if "/" in rel_path else "", stat)
+    if include_memos:
+        for path, key, stat in iter_memo_files(kb_dir.parent):
+            files[key] = (str(path), "memo", "memos", stat)
+    return files
+
+
+def _embed_files(store: Path, meta: dict, embedder, paths: list[str], files: dict, loaded: dict | None = None) -> int:
+    """Chunk, embed and store paths (already absent from the store).
+
+    Args:
+        store: Store directory
+        meta: Store metadata, updated in place
+        embedder: Embedder to use
+        paths: Repo-relative paths to add
+        files: Current files, from _scan()
+        loaded: load_file() results already at hand, by path
+
+    Returns:
+        Number of chunks stored
+    """
+    np = _require_numpy()
+    pending = []  # (file id, start, end, text to embed)
+    total = 0
+
+    def flush():
+        nonlocal pending
+        if not pending:
+            return
+        vectors = embedder.embed([item[3] for item in pending])
+        if meta["dim"] is None:
+            meta["dim"] = vectors.shape[1]  # Callable embedders report their width on first use
+        free = meta["free"]
+        reused = [free.pop() for _ in range(min(len(free), len(pending)))]
+        rows = reused + list(range(meta["rows"], meta["rows"] + len(pending) - len(reused)))
+        meta["rows"] += len(pending) - len(reused)
+        _grow(store, meta, meta["rows"])
+        matrix, chunks = open_matrices(store, meta, "r+")
+        matrix[rows] = vectors
+        chunks[rows] = [item[:3] for item in pending]
+        matrix.flush()
+        chunks.flush()
+        pending = []
+
+    for key in paths:
+        path, kind, section, stat = files[key]
+        sha256, spans, texts = (loaded or {}).get(key) or load_file(path, kind)
+        file_id = meta["next_file_id"]
+        meta["next_file_id"] += 1
+        meta["files"][key] = {"id": file_id, "kind": kind, "section": section, "sha256": sha256,
+                              "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        for (start, end), text in zip(spans, texts):
+            pending.append((file_id, start, end, text))
+            total += 1
+        if len(pending) >= EMBED_BATCH:
+            flush()
+    flush()
+    return total
+
+
+def _free_rows(store: Path, meta: dict, keys: list[str]) -> None:
+    """Release the rows of files for reuse and forget the files."""
+    np = _require_numpy()
+    file_ids = [meta["files"].pop(key)["id"] for key in keys]
+    if not file_ids or not meta["rows"]:
+        return
+    matrix, chunks = open_matrices(store, meta, "r+")
+    rows = np.flatnonzero(np.isin(chunks[:meta["rows"], 0], file_ids))
+    chunks[rows] = 0
+    matrix[rows] = 0
+    meta["free"].extend(rows.tolist())
+
+
+def update_vectors(kb_dir: Path, embedder_name: str | None = None, include_memos: bool = True,
+                   rebuild: bool = False) -> dict:
+    """Bring the vector store up to date with the KB and memo transcripts on disk.
+
+    Args:
+        kb_dir: Knowledge base directory
+        embedder_name: lsa, hashing or module:function (default: the store's, else DEFAULT_EMBEDDER)
+        include_memos: Also index .aur2/visions/processed transcripts
+        rebuild: Discard the store and embed everything again
+
+    Returns:
+        Counts of embedded files, chunks and removed files, and whether the model was refitted
+    """
+    store = kb_dir / STORE_DIR
+    meta = load_meta(store)
+    embedder_name = embedder_name or (meta["embedder"] if meta else DEFAULT_EMBEDDER)
+    if meta and meta["embedder"] != embedder_name:
+        rebuild = True  # Vectors from different embedders aren't comparable
+    files = _scan(kb_dir, include_memos)
+    counts = {"files": 0, "chunks": 0, "removed": 0, "touched": 0, "refit": False}
+
+    if meta and not rebuild:
+        changed = []
+        for key, (path, _, _, stat) in files.items():
+            entry = meta["files"].get(key)
+            if entry and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            if entry and entry["sha256"] == hashlib.sha256(Path(path).read_bytes()).hexdigest():
+                entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)  # Touched, not changed
+                counts["touched"] += 1
+                continue
+            changed.append(key)
+        removed = [key for key in meta["files"] if key not in files]
+        if not (changed or removed or counts["touched"]):
+            return counts  # The common case: a stat walk and one JSON load
+
+        embedder = load_embedder(embedder_name, store)
+        live = meta["rows"] - len(meta["free"])
+        if not (embedder.needs_fit and live > REFIT_GROWTH * max(meta["fit_chunks"], 1)):
+            _free_rows(store, meta, [key for key in changed + removed if key in meta["files"]])
+            counts["removed"] = len(removed)
+            counts["chunks"] = _embed_files(store, meta, embedder, changed, files)
+            counts["files"] = len(changed)
+            save_meta(store, meta)
+            return counts
+        counts["removed"] = len(removed)
+
+    # Build from scratch (first run, rebuild, new embedder, or an LSA model the corpus has outgrown)
+    for name in ("vectors.f32", "chunks.i64", "meta.json", "lookup.json", "lsa_buckets.npy", "lsa_idf.npy",
+                 "lsa_components.npy"):
+        (store / name).unlink(missing_ok=True)
+    store.mkdir(parents=True, exist_ok=True)
+    embedder = load_embedder(embedder_name, store)
+    loaded = {}
+    if embedder.needs_fit:
+        loaded = {key: load_file(path, kind) for key, (path, kind, _, _) in sorted(files.items())}
+        corpus = [text for _, _, texts in loaded.values() for text in texts]
+        if len(corpus) > FIT_SAMPLE_CHUNKS:
+            corpus = random.Random(0).sample(corpus, FIT_SAMPLE_CHUNKS)
+        embedder.fit(corpus or [""])
+        counts["refit"] = True
+    meta = _new_meta(embedder)
+    counts["chunks"] = _embed_files(store, meta, embedder, sorted(files), files, loaded)
+    counts["files"] = len(files)
+    meta["fit_chunks"] = counts["chunks"] if embedder.needs_fit else 0
+    save_meta(store, meta)
+    return counts
+
+
+def top_k(matrix, queries, k: int, valid=None, block_rows: int = QUERY_BLOCK_ROWS):
+    """Indices and cosine scores of each query's k best rows, scoring the matrix block by block.
+
+    Args:
+        matrix: (n, dim) unit vectors, e.g. a memmap
+        queries: (q, dim) unit vectors
+        k: Results per query
+        valid: Optional (n,) bool mask of rows that may be returned
+        block_rows: Rows scored per matrix product
+
+    Returns:
+        Tuple of (indices, scores), each (q, <=k), best first
+    """
+    np = _require_numpy()
+    n_queries = len(queries)
+    best_indices = np.zeros((n_queries, 0), dtype=np.int64)
+    best_scores = np.zeros((n_queries, 0), dtype=np.float32)
+    for start in range(0, len(matrix), block_rows):
+        block = np.asarray(matrix[start:start + block_rows])
+        scores = queries @ block.T
+        if valid is not None:
+            scores[:, ~valid[start:start + len(block)]] = -np.inf
+        indices = np.broadcast_to(np.arange(start, start + len(block)), scores.shape)
+        if scores.shape[1] > k:
+            keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(scores, keep, axis=1)
+            indices = np.take_along_axis(indices, keep, axis=1)
+        best_scores = np.concatenate([best_scores, scores], axis=1)
+        best_indices = np.concatenate([best_indices, indices], axis=1)
+        if best_scores.shape[1] > k:
+            keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(best_scores, keep, axis=1)
+            best_indices = np.take_along_axis(best_indices, keep, axis=1)
+
+    order = np.argsort(-best_scores, axis=1)
+    best_scores = np.take_along_axis(best_scores, order, axis=1)
+    best_indices = np.take_along_axis(best_indices, order, axis=1)
+    found = np.isfinite(best_scores)  # Fewer than k valid rows leaves -inf padding
+    return ([indices[mask] for indices, mask in zip(best_indices, found)],
+            [scores[mask] for scores, mask in zip(best_scores, found)])
+
+
+def query(kb_dir: Path, texts: list[str], k: int = 10, sections: list[str] | None = None,
+          exclude_sections: list[str] | None = None) -> list[list[dict]]:
+    """Files most similar to each query text, best first.
+
+    Args:
+        kb_dir: Knowledge base directory (the store must exist; see update_vectors)
+        texts: Query texts, scored in one batch
+        k: Files per query
+        sections: Only these top-level KB sections ("memos" for transcripts)
+        exclude_sections: Never these sections (e.g. team, for stakeholder deliverables)
+
+    Returns:
+        Per query, results with path, score (cosine of the best chunk) and snippet
+    """
+    np = _require_numpy()
+    store = kb_dir / STORE_DIR
+    lookup = load_meta(store, "lookup.json")
+    if not lookup or not lookup["rows"]:
+        return [[] for _ in texts]
+
+    files = lookup["files"]
+    matrix, chunks = open_matrices(store, lookup)
+    matrix, chunks = matrix[:lookup["rows"]], np.asarray(chunks[:lookup["rows"]])
+    allowed = [file_id for file_id, item in enumerate(files)
+               if item and (not sections or item[1] in sections)
+               and not (exclude_sections and item[1] in exclude_sections)]
+    valid = np.isin(chunks[:, 0], allowed)
+
+    embedder = load_embedder(lookup["embedder"], store)
+    indices, scores = top_k(matrix, embedder.embed(texts), k * CANDIDATES_PER_RESULT, valid)
+
+    results = []
+    for query_indices, query_scores in zip(indices, scores):
+        by_file = {}
+        for row, score in zip(query_indices.tolist(), query_scores.tolist()):
+            if score <= 0:
+                break  # Nothing in common
+            file_id, start, end = chunks[row].tolist()
+            by_file.setdefault(files[file_id][0], (score, start, end))  # Best chunk first
+        matches = []
+        for key, (score, start, end) in list(by_file.items())[:k]:
+            path = kb_dir.parent / key
+            text = path.read_text(encoding="utf-8", errors="replace")[start:end]
+            snippet = " ".join(text.split())
+            matches.append({"path": key, "score": round(score, 4),
+                            "snippet": snippet[:SNIPPET_CHARS] + ("..." if len(snippet) > SNIPPET_CHARS else "")})
+        results.append(matches)
+    return results
+
+
+def main():
+    """CLI interface for semantic KB retrieval."""
+    parser = argparse.ArgumentParser(
+        description="Semantic search over the knowledge base and processed memos",
+        epilog="Examples:\n"
+               "  python3 scripts/kb_vectors.py query \"the launch slipped\"\n"
+               "  python3 scripts/kb_vectors.py query \"who owns hiring\" -k 5 --exclude-section team --json\n"
+               "  python3 scripts/kb_vectors.py update --rebuild\n"
+               "  python3 scripts/kb_vectors.py update --embedder mymodels:embed   # returns an (n, dim) array\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=["query", "update"])
+    parser.add_argument("text", nargs="*", help="Query text (several are scored as one batch)")
+    parser.add_argument("-k", "--limit", type=int, default=10, help="Files per query (default: 10)")
+    parser.add_argument("--section", action="append", help="Only this KB section, or memos (repeatable)")
+    parser.add_argument("--exclude-section", action="append", help="Leave out this section (repeatable)")
+    parser.add_argument(
+        "--embedder",
+        type=str,
+        help=f"lsa, hashing or module:function (default: the index's, else {DEFAULT_EMBEDDER})"
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Re-embed everything (refits lsa)")
+    parser.add_argument("--no-update", action="store_true", help="Query the index as it is")
+    parser.add_argument("--no-memos", action="store_true", help="Don't index .aur2/visions/processed transcripts")
+    parser.add_argument("--kb-dir", type=str, help="Knowledge base directory (default: ./knowledge-base)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    if args.command == "query" and not args.text:
+        parser.error("query needs text")
+
+    kb_dir = Path(args.kb_dir) if args.kb_dir else find_kb_dir()
+    if not kb_dir.is_dir():
+        print(f"Error: Knowledge base not found: {kb_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "update" or not args.no_update:
+        start = time.perf_counter()
+        try:
+            counts = update_vectors(kb_dir, args.embedder, include_memos=not args.no_memos, rebuild=args.rebuild)
+        except (ValueError, ImportError, AttributeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if counts["files"] or counts["removed"] or args.command == "update":
+            print(f"Embedded {counts['chunks']} chunks from {counts['files']} files, removed {counts['removed']}"
+                  f"{' (model refitted)' if counts['refit'] else ''} ({time.perf_counter() - start:.2f}s)",
+                  file=sys.stderr)
+    if args.command == "update":
+        return
+
+    _require_numpy()  # Keep the import out of the timing
+    start = time.perf_counter()
+    results = query(kb_dir, args.text, args.limit, args.section, args.exclude_section)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if args.json:
+        print(json.dumps(results[0] if len(results) == 1 else results, indent=2))
+        return
+    for text, matches in zip(args.text, results):
+        if len(args.text) > 1:
+            print(f"== {text}")
+        if not matches:
+            print("  No matches", file=sys.stderr)
+        for match in matches:
+            print(f"{match['score']:6.3f}  {match['path']}")
+            print(f"        {match['snippet']}")
+    print(f"({elapsed_ms:.0f} ms)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()